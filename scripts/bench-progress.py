@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Measure the cold-start time of `check-progress.py --json`.
+
+Agents and CI call the progress checker at the start of every step, so its
+start-up cost matters more than its scan cost. This script runs the checker
+in fresh interpreters against a synthetic spec tree (or a real project),
+alternating with runs of a bare `python -c pass`. Each round's overhead is
+the checker's time minus the bare interpreter's in that round, and the
+median overhead of the cached run (the repeat call agents make) over all
+rounds must stay within the budget plus a tolerance, so a slow or noisy
+machine moves both sides of each difference instead of failing the gate.
+A --no-cache run is reported too but not gated: it reads and hashes every
+step file, so its cost is the scan's, growing with the tree. It also lists the modules the checker imports
+beyond a bare interpreter, heaviest first, so a regression points at the
+import that caused it. Before timing anything it checks that every plugin's
+copy of spec_progress.py is identical to this directory's.
+
+Usage:
+    python3 scripts/bench-progress.py [--project-dir DIR] [--apps 20] [--runs 21] [--budget-ms 40] [--tolerance-ms 10]
+    python3 scripts/bench-progress.py --check-copies
+
+Exit codes:
+    0 — Median cold-start overhead within budget plus tolerance
+    1 — Median overhead over budget plus tolerance, or the spec_progress.py copies differ
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Copies of spec_progress.py shipped by the plugins installed on their own
+SPEC_PROGRESS_COPIES = (SCRIPT_DIR.parent / "skills" / "architect" / "scripts" / "spec_progress.py",)
+
+# Synthetic step files by step number (names as in spec_progress)
+SUITE_FILES = {1: "domain-model.md", 2: "role-permission-matrix.md", 3: "ui-conventions.md",
+               4: "navigation-shell.md", 5: "api-event-contracts.md"}
+APP_FILES = {6: "archetype.md", 7: "domain-refinement.md", 8: "role-refinement.md", 10: "ia-spec.md",
+             12: "state-interaction.md", 13: "api-contracts.md", 14: "authorization.md", 17: "seed-data.md"}
+
+
+def step_document(step: int, title: str) -> str:
+    """A step file that passes the checker's content checks: every required heading, over the minimum size."""
+    sys.path.insert(0, str(SCRIPT_DIR))
+    from spec_progress import REQUIRED_HEADINGS
+
+    body = f"Synthetic content for {title}, long enough to count as a written section of the spec."
+    sections = "".join(f"## {heading}\n\n{body}\n\n" for heading in REQUIRED_HEADINGS[step])
+    return f"# {title}\n\n{body}\n\n{sections}"
+
+
+def build_spec_tree(root: Path, apps: int, features: int):
+    """Create a synthetic spec/ tree with every step complete for `apps` apps."""
+    spec = root / "spec"
+    (spec / "suite").mkdir(parents=True)
+    for step, name in SUITE_FILES.items():
+        (spec / "suite" / name).write_text(step_document(step, name), encoding="utf-8")
+    for i in range(apps):
+        app = f"app-{i:03d}"
+        app_dir = spec / "apps" / app
+        for sub in ("features", "pages", "generation-briefs"):
+            (app_dir / sub).mkdir(parents=True)
+        for step, name in APP_FILES.items():
+            (app_dir / name).write_text(step_document(step, f"{app} {name}"), encoding="utf-8")
+        for j in range(features):
+            (app_dir / "features" / f"feature-{j:03d}.feature.md").write_text(
+                step_document(9, f"{app} feature {j}"), encoding="utf-8")
+            (app_dir / "pages" / f"page-{j:03d}.md").write_text(step_document(11, f"{app} page {j}"), encoding="utf-8")
+        (app_dir / "generation-briefs" / "_build-order.md").write_text(
+            step_document(16, f"{app} build order"), encoding="utf-8")
+        report_dir = spec / "validation" / "reports" / app
+        report_dir.mkdir(parents=True)
+        (report_dir / "completeness-score.md").write_text(step_document(15, f"{app} score"), encoding="utf-8")
+
+    # Age every file and directory past the cache's racy window, as in a real project
+    old = time.time() - 3600
+    for p in [spec, *spec.rglob("*")]:
+        os.utime(p, (old, old))
+    return spec
+
+
+def differing_copies() -> list[Path]:
+    """Copies of spec_progress.py whose bytes differ from this directory's (missing ones included)."""
+    source = (SCRIPT_DIR / "spec_progress.py").read_bytes()
+    return [copy for copy in SPEC_PROGRESS_COPIES if not copy.is_file() or copy.read_bytes() != source]
+
+
+def time_runs(cmds: dict[str, list[str]], runs: int, env: dict) -> dict[str, list[float]]:
+    """Wall times in ms of `runs` fresh-process executions of each command.
+
+    The commands take turns, so a machine that slows down partway through
+    slows every command alike instead of skewing the difference.
+    """
+    times = {name: [] for name in cmds}
+    for _ in range(runs):
+        for name, cmd in cmds.items():
+            start = time.perf_counter()
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True, env=env)
+            times[name].append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def imported_modules(cmd: list[str], env: dict) -> dict[str, int]:
+    """Top-level modules imported by cmd with their cumulative import time (us)."""
+    proc = subprocess.run([cmd[0], "-X", "importtime"] + cmd[1:], stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, text=True, check=True, env=env)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # top-level imports only
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure check-progress.py --json cold-start time")
+    parser.add_argument("--project-dir", default=None, help="Benchmark against this project instead of a synthetic tree")
+    parser.add_argument("--apps", type=int, default=20, help="Apps in the synthetic spec tree (default: 20)")
+    parser.add_argument("--features", type=int, default=10, help="Feature and page files per synthetic app (default: 10)")
+    parser.add_argument("--runs", type=int, default=21, help="Timed rounds; the median overhead counts (default: 21)")
+    parser.add_argument("--budget-ms", type=float, default=40.0,
+                        help="Median start-up overhead allowed over a bare interpreter (default: 40 ms)")
+    parser.add_argument("--tolerance-ms", type=float, default=10.0,
+                        help="Slack over the budget before the gate fails, for machine noise (default: 10 ms)")
+    parser.add_argument("--script", default=str(SCRIPT_DIR / "check-progress.py"), help="Progress checker to measure")
+    parser.add_argument("--check-copies", action="store_true",
+                        help="Only check that the plugins' spec_progress.py copies are identical (no timing)")
+    args = parser.parse_args()
+
+    stale = differing_copies()
+    if stale:
+        for copy in stale:
+            print(f"ERROR: {copy} differs from {SCRIPT_DIR / 'spec_progress.py'}")
+        print("Copy scripts/spec_progress.py over it so every plugin runs the same scanner.")
+        return 1
+    if args.check_copies:
+        print("spec_progress.py copies are identical.")
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.project_dir:
+            spec_dir = Path(args.project_dir).resolve() / "spec"
+            label = str(spec_dir)
+        else:
+            spec_dir = build_spec_tree(Path(tmp), args.apps, args.features)
+            label = f"synthetic, {args.apps} apps x {args.features} features"
+
+        # Installed skills run with cached bytecode; keep it out of the skill directory
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=str(Path(tmp) / "pycache"))
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+        bare = [sys.executable, "-c", "pass"]
+        checker = [sys.executable, args.script, "--spec-dir", str(spec_dir), "--json", "--view", "all"]
+
+        # Warm-up: writes bytecode and the progress cache, then lets the cache
+        # file's own write age past the racy window like a real repeat run
+        subprocess.run(checker, stdout=subprocess.DEVNULL, check=True, env=env)
+        time.sleep(2.1)
+        subprocess.run(checker, stdout=subprocess.DEVNULL, check=True, env=env)
+
+        times = time_runs({"bare": bare, "cached": checker, "no cache": checker + ["--no-cache"]}, args.runs, env)
+        bare_times = times.pop("bare")
+        bare_ms = statistics.median(bare_times)
+        # Overhead per round against the bare run of the same round
+        results = {name: (statistics.median(t), statistics.median([c - b for c, b in zip(t, bare_times)]))
+                   for name, t in times.items()}
+        baseline = imported_modules(bare, env)
+        extra = {name: us for name, us in imported_modules(checker, env).items() if name not in baseline}
+
+    print(f"=== check-progress.py --json Cold Start ({label}) ===\n")
+    print(f"  Bare interpreter:     {bare_ms:7.1f} ms")
+    over = False
+    limit = args.budget_ms + args.tolerance_ms
+    for name, (ms, overhead) in results.items():
+        if name != "cached":
+            print(f"  [-] {name + ':':<17} {ms:7.1f} ms (+{overhead:.1f} ms median overhead, full scan, not gated)")
+            continue
+        mark = "✓" if overhead <= args.budget_ms else ("~" if overhead <= limit else "!")
+        over = over or overhead > limit
+        print(f"  [{mark}] {name + ':':<17} {ms:7.1f} ms (+{overhead:.1f} ms median overhead, "
+              f"budget {args.budget_ms:.0f} ms, tolerance {args.tolerance_ms:.0f} ms)")
+
+    print("\nImports beyond a bare interpreter (cumulative):")
+    for name, us in sorted(extra.items(), key=lambda kv: -kv[1])[:8]:
+        print(f"  - {name:<20} {us / 1000:6.2f} ms")
+
+    if over:
+        print("\nCold start over budget.")
+        return 1
+    print("\nCold start within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Fuzz and benchmark the validate-spec.py extraction helpers.
+
+Feeds every extractor adversarial inputs (long headings, blank-line runs,
+unterminated bold and code spans, long component-like words, random noise
+from a markdown-heavy alphabet) and fails if any extractor exceeds a
+per-KB time budget. Quadratic work grows its per-KB cost with the input
+size while linear extractors stay flat, so each input is also timed at
+1/8 of the size, and an extractor whose per-KB cost grows more than
+--max-growth times between the two sizes fails even within the budget.
+
+Usage:
+    python3 scripts/bench-extractors.py [--size-kb 256] [--budget-ms-per-kb 2.0] [--max-growth 3.0] [--seed 0]
+
+Exit codes:
+    0 — All extractors within budget
+    1 — At least one extractor exceeded the budget or grew superlinearly
+"""
+
+import argparse
+import importlib.util
+import random
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+EXTRACTORS = [
+    "extract_entities",
+    "extract_roles",
+    "extract_routes",
+    "extract_component_refs",
+    "extract_api_endpoints",
+    "extract_connected_pages",
+    "extract_design_tokens",
+    "extract_scenarios",
+]
+
+# Characters that interact with the extraction patterns
+FUZZ_ALPHABET = "#-*`<>|:./ \t\n_aZ9[]()"
+
+GROWTH_SCALE = 8  # the small input is 1/GROWTH_SCALE of the full size
+GROWTH_MIN_MS = 5.0  # full-size runs faster than this are too short to compare
+
+
+def load_validator():
+    """Import validate-spec.py (hyphenated, so not importable by name)."""
+    sys.path.insert(0, str(SCRIPT_DIR))
+    spec = importlib.util.spec_from_file_location("validate_spec", SCRIPT_DIR / "validate-spec.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def repeat_to(unit: str, size: int) -> str:
+    """Repeat a unit string until it is at least `size` characters long."""
+    return unit * (size // len(unit) + 1)
+
+
+def adversarial_inputs(size: int, rng: random.Random) -> dict[str, str]:
+    """Build named adversarial inputs of roughly `size` characters each."""
+    return {
+        "blank-lines": "\n" * size + "x",
+        "whitespace-lines": repeat_to(" \t\n", size) + "x",
+        "long-heading": "## Entity: " + repeat_to("a -", size) + "!",
+        "heading-run": repeat_to("## a\n", size),
+        "unterminated-bold": repeat_to("- **" + "a b " * 64 + "\n", size),
+        "long-tag-word": "<" + "a" * size,
+        "many-tags": repeat_to("<aaaaaaaaaaaaaaaa ", size),
+        "long-code-word": "`" + "a" * size,
+        "token-prefixes": repeat_to("`--a-", size),
+        "dotted-run": "- `" + repeat_to("a.", size) + "..",
+        "nav-then-blanks": "Navigation:" + "\n \n" * (size // 3) + "- x\n",
+        "markers-one-line": repeat_to("Connected Pages: x ", size) + "\n",
+        "table-pipes": repeat_to("|", size) + "\n",
+        "path-noise": repeat_to("GET /a/:b.c-d ", size),
+        "random": "".join(rng.choice(FUZZ_ALPHABET) for _ in range(size)),
+    }
+
+
+def time_call(fn, text: str, repeat: int) -> float:
+    """Return the best-of-`repeat` wall time in seconds for fn(text)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fuzz and benchmark validate-spec.py extractors")
+    parser.add_argument("--size-kb", type=int, default=256, help="Size of each adversarial input in KB (default: 256)")
+    parser.add_argument("--budget-ms-per-kb", type=float, default=2.0, help="Maximum time per KB of input (default: 2.0 ms)")
+    parser.add_argument("--max-growth", type=float, default=3.0,
+                        help=f"Maximum per-KB cost ratio between full-size and 1/{GROWTH_SCALE}-size inputs (default: 3.0)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions; the best run counts (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the fuzz input (default: 0)")
+    args = parser.parse_args()
+
+    validator = load_validator()
+    rng = random.Random(args.seed)
+    size = args.size_kb * 1024
+    inputs = adversarial_inputs(size, rng)
+    small_inputs = adversarial_inputs(size // GROWTH_SCALE, random.Random(args.seed))
+
+    print(f"=== Extractor Benchmark ({args.size_kb} KB inputs, budget {args.budget_ms_per_kb} ms/KB) ===\n")
+    failures = []
+    for name in EXTRACTORS:
+        fn = getattr(validator, name)
+        worst_input, worst_ms_per_kb = "", 0.0
+        failed = False
+        for label, text in inputs.items():
+            elapsed_ms = time_call(fn, text, args.repeat) * 1000
+            ms_per_kb = elapsed_ms / (len(text) / 1024)
+            if ms_per_kb > worst_ms_per_kb:
+                worst_input, worst_ms_per_kb = label, ms_per_kb
+            if ms_per_kb > args.budget_ms_per_kb:
+                failures.append((name, label, f"{ms_per_kb:.4f} ms/KB"))
+                failed = True
+            elif elapsed_ms >= GROWTH_MIN_MS:
+                small = small_inputs[label]
+                small_ms_per_kb = time_call(fn, small, args.repeat) * 1000 / (len(small) / 1024)
+                growth = ms_per_kb / max(small_ms_per_kb, 1e-9)
+                if growth > args.max_growth:
+                    failures.append((name, label, f"{growth:.1f}x per-KB cost at {GROWTH_SCALE}x the size"))
+                    failed = True
+        mark = "!" if failed else "\u2713"
+        print(f"  [{mark}] {name:<26} worst {worst_ms_per_kb:8.4f} ms/KB ({worst_input})")
+
+    if failures:
+        print(f"\nOver budget ({len(failures)}):")
+        for name, label, detail in failures:
+            print(f"  - {name} on '{label}': {detail}")
+        return 1
+
+    print("\nAll extractors within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
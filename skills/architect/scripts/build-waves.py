@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""Group generation briefs into waves that can be generated concurrently.
+
+Reads apps/{app}/generation-briefs/_build-order.md (Step 16): every row of
+the Build Sequence tables is a brief (a component or a page) with its
+dependencies. Dependencies listed in the per-page briefs' Build Order
+section are merged in. The result is a dependency graph which is checked
+for cycles and split into topological waves: every brief in a wave depends
+only on briefs in earlier waves, so a whole wave can be generated at once.
+
+The critical path is the longest dependency chain, weighted by each row's
+Est. Complexity (Low 1, Medium 2, High 3; unlisted 1). No number of
+workers can finish faster. With --workers N, the briefs are also
+list-scheduled onto N workers to estimate the build time.
+
+Usage:
+    python3 scripts/build-waves.py --project-dir DIR [--app APP] [--workers N] [--json]
+
+Exit codes:
+    0 — Waves computed for every app
+    1 — A dependency cycle was found
+    2 — No build order found
+"""
+
+import argparse
+import heapq
+import json
+import re
+from pathlib import Path
+
+BUILD_ORDER = "_build-order.md"
+BRIEF_SUFFIX = "-brief.md"
+
+_TIER_RE = re.compile(r"#{2,4}\s+Tier\s+([A-Z])\b")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_DEPS_LINE_RE = re.compile(r"[-*]\s+\*\*Dependencies\*\*:?\s*(.*)")
+_KEY_STRIP_RE = re.compile(r"[^a-z0-9]")
+
+# Cell values meaning "no dependencies"
+NO_DEPENDENCIES = {"", "-", "—", "–", "none", "n/a", "na", "nothing"}
+
+# Est. Complexity cell -> relative generation effort
+COMPLEXITY_WEIGHTS = {
+    "xs": 1, "s": 1, "low": 1, "simple": 1, "trivial": 1,
+    "m": 2, "medium": 2, "moderate": 2,
+    "l": 3, "high": 3, "complex": 3,
+    "xl": 5, "very high": 5,
+}
+
+
+def clean_cell(cell: str) -> str:
+    """Strip links, emphasis and code marks from a table cell."""
+    cell = _LINK_RE.sub(r"\1", cell)
+    return cell.replace("`", "").replace("**", "").strip()
+
+
+def brief_key(name: str) -> str:
+    """Matching key for a brief: 'Order Detail', 'order-detail-brief.md' -> 'orderdetail'."""
+    name = name.strip().lower()
+    name = name.rsplit("/", 1)[-1]
+    if name.endswith(".md"):
+        name = name[:-3]
+    if name.endswith("-brief"):
+        name = name[:-6]
+    return _KEY_STRIP_RE.sub("", name)
+
+
+def split_dependencies(cell: str) -> list[str]:
+    """Split a Dependencies cell into names, dropping 'None' markers and notes in parentheses."""
+    names = []
+    for part in re.split(r"[,;]", clean_cell(cell)):
+        part = re.sub(r"\([^)]*\)", "", part).strip()
+        if part.lower() not in NO_DEPENDENCIES:
+            names.append(part)
+    return names
+
+
+def complexity_weight(cell: str) -> float:
+    """Relative effort of a brief from its Est. Complexity cell (default 1)."""
+    value = clean_cell(cell).lower()
+    if value in COMPLEXITY_WEIGHTS:
+        return COMPLEXITY_WEIGHTS[value]
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return 1
+
+
+def table_cells(line: str) -> list[str]:
+    """Cells of a markdown table row."""
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def parse_build_order(text: str) -> list[dict]:
+    """Parse the Build Sequence tables of a build order document.
+
+    Returns one item per row: {name, file, tier, position, deps, weight}.
+    Columns are found by header name, so tables without a file or
+    complexity column are fine; tables without a Dependencies column
+    are skipped. A tier heading may follow a table directly:
+
+    >>> doc = "\\n".join([
+    ...     "### Tier A",
+    ...     "| # | Page | Dependencies |",
+    ...     "|---|------|--------------|",
+    ...     "| 1 | Shell | none |",
+    ...     "### Tier B",
+    ...     "| # | Page | Dependencies |",
+    ...     "|---|------|--------------|",
+    ...     "| 2 | Orders | Shell |",
+    ... ])
+    >>> [(item["tier"], item["name"], item["deps"]) for item in parse_build_order(doc)]
+    [('A', 'Shell', []), ('B', 'Orders', ['Shell'])]
+    """
+    items = []
+    tier = None
+    columns = None
+    for line in text.splitlines():
+        match = _TIER_RE.match(line)
+        if match:
+            # A heading ends the table above it even without a blank line
+            tier = match.group(1)
+            columns = None
+            continue
+        if not line.lstrip().startswith("|"):
+            columns = None
+            continue
+        cells = table_cells(line)
+        if columns is None:
+            headers = [clean_cell(c).lower() for c in cells]
+            columns = {}
+            for i, header in enumerate(headers):
+                if header in ("component", "page", "brief", "name", "item"):
+                    columns.setdefault("name", i)
+                elif "file" in header:
+                    columns.setdefault("file", i)
+                elif header.startswith("depend"):
+                    columns.setdefault("deps", i)
+                elif "complexity" in header:
+                    columns.setdefault("weight", i)
+            if "name" not in columns or "deps" not in columns:
+                columns = {}
+            continue
+        if not columns or set("".join(cells)) <= set("-: "):
+            continue
+
+        def cell(key: str) -> str:
+            i = columns.get(key)
+            return cells[i] if i is not None and i < len(cells) else ""
+
+        name = clean_cell(cell("name"))
+        if not name or name.startswith("{"):
+            continue  # template placeholder rows
+        items.append({
+            "name": name,
+            "file": clean_cell(cell("file")) or None,
+            "tier": tier,
+            "position": len(items) + 1,
+            "deps": split_dependencies(cell("deps")),
+            "weight": complexity_weight(cell("weight")) if "weight" in columns else 1,
+        })
+    return items
+
+
+def parse_brief_dependencies(text: str) -> list[str]:
+    """Dependencies listed in a per-page brief's Build Order section."""
+    for line in text.splitlines():
+        match = _DEPS_LINE_RE.match(line.strip())
+        if match:
+            return split_dependencies(match.group(1))
+    return []
+
+
+def build_graph(items: list[dict], brief_deps: dict[str, list[str]]) -> dict:
+    """Resolve dependency names into a graph over the build order items.
+
+    brief_deps maps brief file names to the dependencies they list; briefs
+    missing from the build order become items of their own. Names that
+    match no item are reported as unresolved (usually suite-level specs
+    such as the navigation shell) and do not constrain the order.
+    """
+    items = [dict(item) for item in items]
+    index = {}
+    for i, item in enumerate(items):
+        for label in (item["name"], item["file"]):
+            if label:
+                index.setdefault(brief_key(label), i)
+    for fname, deps in sorted(brief_deps.items()):
+        i = index.get(brief_key(fname))
+        if i is None:
+            items.append({"name": fname[:-len(BRIEF_SUFFIX)], "file": fname, "tier": None,
+                          "position": None, "deps": [], "weight": 1})
+            i = index[brief_key(fname)] = len(items) - 1
+        items[i]["deps"] = items[i]["deps"] + [d for d in deps if d not in items[i]["deps"]]
+
+    edges = {i: [] for i in range(len(items))}
+    unresolved = {}
+    for i, item in enumerate(items):
+        for dep in item["deps"]:
+            j = index.get(brief_key(dep))
+            if j is None:
+                unresolved.setdefault(item["name"], []).append(dep)
+            elif j != i and j not in edges[i]:
+                edges[i].append(j)
+    return {"items": items, "edges": edges, "unresolved": unresolved}
+
+
+def find_cycle(edges: dict[int, list[int]]) -> list[int] | None:
+    """Return one dependency cycle as a list of items (first repeated last), or None."""
+    state = dict.fromkeys(edges, 0)  # 0 unvisited, 1 on the current path, 2 done
+    for start in edges:
+        if state[start]:
+            continue
+        path, stack = [start], [iter(edges[start])]
+        state[start] = 1
+        while stack:
+            dep = next(stack[-1], None)
+            if dep is None:
+                state[path.pop()] = 2
+                stack.pop()
+            elif state[dep] == 1:
+                return path[path.index(dep):] + [dep]
+            elif state[dep] == 0:
+                state[dep] = 1
+                path.append(dep)
+                stack.append(iter(edges[dep]))
+    return None
+
+
+def compute_waves(graph: dict) -> list[list[int]]:
+    """Split an acyclic graph into waves: wave k holds items whose longest dependency chain has k links."""
+    edges = graph["edges"]
+    dependents = {i: [] for i in edges}
+    waiting = {i: len(deps) for i, deps in edges.items()}
+    for i, deps in edges.items():
+        for j in deps:
+            dependents[j].append(i)
+    def position(i: int) -> int:
+        return graph["items"][i]["position"] or len(edges) + i
+
+    wave = sorted((i for i in edges if not waiting[i]), key=position)
+    waves = []
+    while wave:
+        waves.append(wave)
+        following = []
+        for i in wave:
+            for k in dependents[i]:
+                waiting[k] -= 1
+                if not waiting[k]:
+                    following.append(k)
+        wave = sorted(following, key=position)
+    return waves
+
+
+def critical_path(graph: dict, waves: list[list[int]]) -> tuple[list[int], float]:
+    """Longest complexity-weighted dependency chain and its total weight."""
+    items, edges = graph["items"], graph["edges"]
+    finish, via = {}, {}
+    for wave in waves:
+        for i in wave:
+            via[i] = max(edges[i], key=finish.get, default=None)
+            finish[i] = items[i]["weight"] + (finish[via[i]] if via[i] is not None else 0)
+    end = max(finish, key=finish.get, default=None)
+    length = finish[end] if end is not None else 0
+    chain = []
+    while end is not None:
+        chain.append(end)
+        end = via[end]
+    return chain[::-1], length
+
+
+def schedule(graph: dict, waves: list[list[int]], workers: int) -> float:
+    """Estimated build time on `workers` workers, starting the item with the longest remaining chain first."""
+    items, edges = graph["items"], graph["edges"]
+    dependents = {i: [] for i in edges}
+    for i, deps in edges.items():
+        for j in deps:
+            dependents[j].append(i)
+    tail = {}
+    for wave in reversed(waves):
+        for i in wave:
+            tail[i] = items[i]["weight"] + max((tail[k] for k in dependents[i]), default=0)
+
+    waiting = {i: len(deps) for i, deps in edges.items()}
+    ready = [(-tail[i], i) for i in edges if not waiting[i]]
+    heapq.heapify(ready)
+    running = []  # (finish time, item)
+    now = 0.0
+    while ready or running:
+        while ready and len(running) < workers:
+            _, i = heapq.heappop(ready)
+            heapq.heappush(running, (now + items[i]["weight"], i))
+        now, i = heapq.heappop(running)
+        for k in dependents[i]:
+            waiting[k] -= 1
+            if not waiting[k]:
+                heapq.heappush(ready, (-tail[k], k))
+    return now
+
+
+def order_violations(graph: dict) -> list[str]:
+    """Dependencies that the build order lists after the item needing them."""
+    items = graph["items"]
+    violations = []
+    for i, deps in graph["edges"].items():
+        for j in deps:
+            if items[i]["position"] and items[j]["position"] and items[j]["position"] > items[i]["position"]:
+                violations.append(f"{items[i]['name']} (#{items[i]['position']}) needs {items[j]['name']} "
+                                  f"(#{items[j]['position']})")
+    return violations
+
+
+def plan_app(brief_dir: Path, workers: int) -> dict:
+    """Parse one app's build order and briefs and compute its waves."""
+    items = parse_build_order((brief_dir / BUILD_ORDER).read_text(encoding="utf-8", errors="replace"))
+    brief_deps = {path.name: parse_brief_dependencies(path.read_text(encoding="utf-8", errors="replace"))
+                  for path in sorted(brief_dir.glob(f"*{BRIEF_SUFFIX}"))}
+    graph = build_graph(items, brief_deps)
+    names = [item["name"] for item in graph["items"]]
+    result = {
+        "briefs": len(names),
+        "dependencies": sum(len(deps) for deps in graph["edges"].values()),
+        "unresolved": graph["unresolved"],
+        "order_violations": order_violations(graph),
+    }
+
+    cycle = find_cycle(graph["edges"])
+    if cycle:
+        # Edges point from an item to its dependency; report the cycle in build direction
+        result["cycle"] = [names[i] for i in reversed(cycle)]
+        return result
+
+    waves = compute_waves(graph)
+    chain, length = critical_path(graph, waves)
+    total = sum(item["weight"] for item in graph["items"])
+    result.update({
+        "waves": [[names[i] for i in wave] for wave in waves],
+        "critical_path": [names[i] for i in chain],
+        "critical_path_weight": length,
+        "total_weight": total,
+        "workers": workers,
+        "estimated_time": schedule(graph, waves, workers),
+    })
+    return result
+
+
+def format_weight(value: float) -> str:
+    """1.0 -> '1', 2.5 -> '2.5'."""
+    return f"{value:g}"
+
+
+def print_plan(app: str, plan: dict):
+    """Print one app's waves, critical path and estimate."""
+    print(f"\nApp: {app} — {plan['briefs']} briefs, {plan['dependencies']} dependencies")
+    if "cycle" in plan:
+        print(f"  [!] Dependency cycle: {' → '.join(plan['cycle'])}")
+        print("      Break the cycle in _build-order.md (or the briefs' Build Order sections) and re-run.")
+        return
+    for n, wave in enumerate(plan["waves"], 1):
+        print(f"  Wave {n} ({len(wave)}): {', '.join(wave)}")
+    print(f"  Critical path (weight {format_weight(plan['critical_path_weight'])}): "
+          f"{' → '.join(plan['critical_path'])}")
+    print(f"  Estimated time with {plan['workers']} worker(s): {format_weight(plan['estimated_time'])} "
+          f"(sequential: {format_weight(plan['total_weight'])}, lower bound: "
+          f"{format_weight(plan['critical_path_weight'])})")
+    for item in plan["order_violations"]:
+        print(f"  [!] Listed before its dependency: {item}")
+    if plan["unresolved"]:
+        count = sum(len(deps) for deps in plan["unresolved"].values())
+        print(f"  Unresolved dependencies ({count}, treated as already built):")
+        for name, deps in sorted(plan["unresolved"].items()):
+            print(f"    - {name}: {', '.join(deps)}")
+
+
+def detect_apps(spec_dir: Path) -> list[str]:
+    """Discover app directories under spec/apps/."""
+    apps_dir = spec_dir / "apps"
+    if not apps_dir.is_dir():
+        return []
+    return sorted(d.name for d in apps_dir.iterdir() if d.is_dir())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Group generation briefs into concurrent build waves")
+    parser.add_argument("--project-dir", default=None, help="Project root directory (sets --spec-dir default to <project-dir>/spec)")
+    parser.add_argument("--spec-dir", default=None, help="Path to spec directory (default: ./spec or <project-dir>/spec)")
+    parser.add_argument("--app", default=None, help="Plan only this app (default: every app with a build order)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent code generation workers to estimate for (default: 4)")
+    parser.add_argument("--json", action="store_true", help="Print the waves as JSON")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.project_dir is not None:
+        project_dir = Path(args.project_dir).resolve()
+        spec_dir = Path(args.spec_dir).resolve() if args.spec_dir else project_dir / "spec"
+    else:
+        spec_dir = Path(args.spec_dir).resolve() if args.spec_dir else Path("./spec").resolve()
+
+    apps = [args.app] if args.app else detect_apps(spec_dir)
+    plans = {}
+    for app in apps:
+        brief_dir = spec_dir / "apps" / app / "generation-briefs"
+        if (brief_dir / BUILD_ORDER).is_file():
+            plans[app] = plan_app(brief_dir, args.workers)
+    if not plans:
+        print(f"ERROR: No generation-briefs/{BUILD_ORDER} found under {spec_dir / 'apps'}. Run Step 16 first.")
+        return 2
+
+    if args.json:
+        print(json.dumps(plans, indent=2, ensure_ascii=False))
+    else:
+        print("=== Generation Build Waves ===")
+        for app, plan in plans.items():
+            print_plan(app, plan)
+    return 1 if any("cycle" in plan for plan in plans.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compile the role/permission matrix into a packed bitset permission table.
+
+Reads suite/role-permission-matrix.md (Step 2) and, for each app,
+apps/{app}/role-refinement.md (Step 8). Writes a permission-table.json next
+to each source file and reports where app refinements diverge from the
+suite matrix.
+
+Usage:
+    python3 scripts/compile-permissions.py --project-dir DIR [--app APP] [--check]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from permission_table import compile_app
+
+TABLE_FILENAME = "permission-table.json"
+
+
+def detect_apps(spec_dir: Path) -> list[str]:
+    """Discover app directories under spec/apps/."""
+    apps_dir = spec_dir / "apps"
+    if not apps_dir.is_dir():
+        return []
+    return sorted(d.name for d in apps_dir.iterdir() if d.is_dir())
+
+
+def write_table(path: Path, table: dict):
+    """Write a compiled table as compact JSON (one line per top-level key)."""
+    lines = ["{"]
+    items = list(table.items())
+    for i, (key, value) in enumerate(items):
+        sep = "," if i < len(items) - 1 else ""
+        lines.append(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}{sep}")
+    lines.append("}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def print_diff(app: str, diff: dict):
+    """Print an app refinement vs suite matrix diff."""
+    esc = diff["escalations"]
+    res = diff["restrictions"]
+    print(f"  Escalations (app grants what the suite denies): {len(esc)}")
+    for e in esc:
+        print(f"    - {e['role']} may {e['action']} {e['resource']}")
+    print(f"  Restrictions (app narrows a suite grant): {len(res)}")
+    for r in res:
+        print(f"    - {r['role']} may not {r['action']} {r['resource']}")
+    if diff["new_roles"]:
+        print(f"  App-specific roles: {', '.join(diff['new_roles'])}")
+    if diff["new_resources"]:
+        print(f"  App-specific resources: {', '.join(diff['new_resources'])}")
+
+
+def print_unknown(table: dict, source: str):
+    """Print the cell tokens from `source` ("suite" or "app") that were not recognized as operations."""
+    for u in table.get("unknown_operations", []):
+        if u["source"] == source:
+            print(f"  WARNING: unknown operation '{u['token']}' for {u['role']} on {u['resource']} — ignored")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile role-permission matrices into a bitset permission table")
+    parser.add_argument("--project-dir", default=None, help="Project root directory (sets --spec-dir default to <project-dir>/spec)")
+    parser.add_argument("--spec-dir", default=None, help="Path to spec directory (default: ./spec or <project-dir>/spec)")
+    parser.add_argument("--app", default=None, help="Compile only this app (default: suite plus every app under spec/apps/)")
+    parser.add_argument("--check", action="store_true", help="Only report diffs; exit 1 if any app escalates suite permissions")
+    args = parser.parse_args()
+
+    if args.project_dir is not None:
+        project_dir = Path(args.project_dir).resolve()
+        spec_dir = Path(args.spec_dir).resolve() if args.spec_dir else project_dir / "spec"
+    else:
+        spec_dir = Path(args.spec_dir).resolve() if args.spec_dir else Path("./spec").resolve()
+
+    matrix_path = spec_dir / "suite" / "role-permission-matrix.md"
+    if not matrix_path.is_file():
+        print(f"ERROR: Suite permission matrix not found: {matrix_path}")
+        return 2
+
+    suite_table = compile_app(spec_dir)
+    print("=== Permission Table ===\n")
+    print(f"Suite: {len(suite_table['roles'])} roles x {len(suite_table['resources'])} resources "
+          f"x {len(suite_table['actions'])} actions")
+    print_unknown(suite_table, "suite")
+    if not args.check:
+        write_table(spec_dir / "suite" / TABLE_FILENAME, suite_table)
+
+    apps = [args.app] if args.app else detect_apps(spec_dir)
+    escalated = False
+    for app in apps:
+        if not (spec_dir / "apps" / app / "role-refinement.md").is_file():
+            print(f"\nApp: {app} — no role-refinement.md, inherits suite table")
+            continue
+        table = compile_app(spec_dir, app)
+        print(f"\nApp: {app} — {len(table['roles'])} roles x {len(table['resources'])} resources")
+        print_diff(app, table["diff"])
+        print_unknown(table, "app")
+        escalated = escalated or bool(table["diff"]["escalations"])
+        if not args.check:
+            write_table(spec_dir / "apps" / app / TABLE_FILENAME, table)
+
+    if not args.check:
+        print(f"\nTables written as {TABLE_FILENAME} under suite/ and apps/{{app}}/")
+    return 1 if (args.check and escalated) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,552 @@
+"""Compile role/permission matrices into a packed bitset permission table.
+
+Parses the Permission Matrix in suite/role-permission-matrix.md (Step 2) and
+the per-entity tables in apps/{app}/role-refinement.md (Step 8) into a
+role x resource x action grid. Each (resource, role) cell is stored as an
+integer bitmask over the table's action list, so "can role R do action A on
+resource X" is two dict lookups and a bit test.
+
+The compiled table is plain JSON:
+
+    {
+      "version": "1.0",
+      "app": "portal" | null,
+      "actions": ["create", "read", "update", "delete", "approve"],
+      "roles": ["Admin", "Manager", "Viewer"],
+      "resources": ["Order", "Customer"],
+      "matrix": {"Order": {"Admin": ["create", ...]}},
+      "conditional": {"Order": {"Manager": ["update"]}},
+      "packed": {"allow": [15, 3, ...], "conditional": [0, 4, ...]},
+      "diff": {...},
+      "unknown_operations": [{"source": "suite", "resource": "Order", "role": "Admin", "token": "TBD"}]
+    }
+
+`packed` arrays are row-major: index = resource_index * len(roles) + role_index,
+and bit i of each word corresponds to actions[i]. The `matrix` view carries
+the same data for humans and generated code that prefers names.
+`unknown_operations` (only present when non-empty) lists cell tokens that
+are neither CRUD codes nor a known operation; they grant nothing.
+"""
+
+import re
+from pathlib import Path
+
+TABLE_VERSION = "1.0"
+
+# Canonical CRUD actions always occupy the first four bits
+CRUD_ACTIONS = ("create", "read", "update", "delete")
+
+ACTION_ALIASES = {
+    "c": "create", "add": "create", "new": "create",
+    "r": "read", "view": "read", "list": "read", "get": "read",
+    "u": "update", "edit": "update", "modify": "update",
+    "d": "delete", "remove": "delete",
+}
+
+# Custom operations a cell may name without an operation row of their own
+KNOWN_ACTIONS = {
+    "approve", "reject", "export", "import", "publish", "archive", "restore",
+    "assign", "share", "submit", "cancel", "invite", "comment", "download",
+    "upload", "execute", "manage", "configure", "audit",
+}
+
+# Cell markers used by the Step 2 (letters) and Step 8 (emoji) conventions
+ALLOW_MARKERS = {"✅", "✓", "✔", "yes", "y", "allow", "allowed", "x"}
+DENY_MARKERS = {"❌", "✗", "✘", "-", "—", "–", "no", "n", "none", "deny", "denied", ""}
+CONDITIONAL_MARKERS = {"\U0001f512", "⚙", "⚙️", "own", "conditional"}
+
+# Table columns that are never roles
+NON_ROLE_COLUMNS = {"conditions", "condition", "notes", "note", "description"}
+
+_FOOTNOTE_RE = re.compile(r"(\^\w+|[¹²³⁰-⁹]+)$")
+_TOKEN_SPLIT_RE = re.compile(r"[,;+/\s]+")
+_CRUD_LETTERS_RE = re.compile(r"^[CRUD]+$")
+
+
+# ---------------------------------------------------------------------------
+# Markdown table parsing
+# ---------------------------------------------------------------------------
+
+def split_row(line: str) -> list[str]:
+    """Split a markdown table row into stripped cell strings."""
+    inner = line.strip()
+    if inner.startswith("|"):
+        inner = inner[1:]
+    if inner.endswith("|"):
+        inner = inner[:-1]
+    return [c.strip().replace("**", "").strip("`").strip() for c in inner.split("|")]
+
+
+def is_separator_row(cells: list[str]) -> bool:
+    """Check if a table row is the |---|:---:| header separator."""
+    return bool(cells) and all(c and set(c) <= set("-: ") for c in cells)
+
+
+def iter_tables(text: str):
+    """Yield (section_heading, subsection_heading, header, rows) for each table.
+
+    `section_heading` is the nearest level-2 heading above the table and
+    `subsection_heading` the nearest level-3+ heading below that section.
+    """
+    section = ""
+    subsection = ""
+    header: list[str] | None = None
+    rows: list[list[str]] = []
+
+    def flush():
+        if header is not None:
+            return (section, subsection, header, rows)
+        return None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("|"):
+            cells = split_row(stripped)
+            if header is None:
+                header = cells
+                rows = []
+            elif not is_separator_row(cells):
+                rows.append(cells)
+            continue
+
+        table = flush()
+        if table:
+            yield table
+        header = None
+
+        if stripped.startswith("#"):
+            level = len(stripped) - len(stripped.lstrip("#"))
+            title = stripped.lstrip("#").strip()
+            if level <= 2:
+                section = title
+                subsection = ""
+            else:
+                subsection = title
+
+    table = flush()
+    if table:
+        yield table
+
+
+# ---------------------------------------------------------------------------
+# Cell parsing
+# ---------------------------------------------------------------------------
+
+def normalize_action(name: str) -> str:
+    """Normalize an operation name (Create, C, Approve) to a lowercase action."""
+    key = name.strip().lower()
+    return ACTION_ALIASES.get(key, key)
+
+
+def parse_cell(
+    text: str,
+    vocabulary: set[str] | None = None,
+    unknown: list[str] | None = None,
+) -> tuple[set[str], set[str], bool]:
+    """Parse a permission cell into (allowed actions, conditional actions, all_flag).
+
+    Understands CRUD letter codes (`CRU`, `R`), `*` for all operations, `-`
+    for no access, footnote markers (`U^1`) for conditional grants and
+    explicit custom operations (`Approve`, `Export`). With `vocabulary`,
+    a custom operation outside it grants nothing and its token is appended
+    to `unknown`, so stray words (`TBD`, `see note`) never become actions.
+    A footnote on a letter code applies to the letter it follows only:
+
+    >>> allowed, conditional, _ = parse_cell("U^1")
+    >>> sorted(allowed), sorted(conditional)
+    (['update'], ['update'])
+    >>> allowed, conditional, _ = parse_cell("RU^1")
+    >>> sorted(allowed), sorted(conditional)
+    (['read', 'update'], ['update'])
+    """
+    allowed: set[str] = set()
+    conditional: set[str] = set()
+    all_flag = False
+
+    for raw in _TOKEN_SPLIT_RE.split(text.strip()):
+        if not raw:
+            continue
+        token = raw
+        footnote = _FOOTNOTE_RE.search(token)
+        if footnote:
+            token = token[: footnote.start()]
+        is_conditional = bool(footnote)
+        if not token or token.lower() in DENY_MARKERS:
+            continue
+
+        if token == "*":
+            all_flag = True
+            continue
+        if _CRUD_LETTERS_RE.match(token):
+            actions = {ACTION_ALIASES[ch.lower()] for ch in token}
+            if is_conditional:
+                # `RU^1`: the footnote marks its own letter, not the whole code
+                allowed |= actions
+                conditional.add(ACTION_ALIASES[token[-1].lower()])
+                continue
+        else:
+            action = normalize_action(token)
+            if vocabulary is not None and action not in vocabulary:
+                if unknown is not None:
+                    unknown.append(raw)
+                continue
+            actions = {action}
+
+        allowed |= actions
+        if is_conditional:
+            conditional |= actions
+
+    return allowed, conditional, all_flag
+
+
+def parse_marker(text: str, vocabulary: set[str] | None = None, unknown: list[str] | None = None) -> tuple[bool, bool]:
+    """Parse a single-operation cell (Step 8 emoji style) into (allowed, conditional)."""
+    value = text.strip().lower()
+    footnote = _FOOTNOTE_RE.search(value)
+    if footnote:
+        value = value[: footnote.start()].strip()
+    if value in CONDITIONAL_MARKERS or any(m in value for m in ("\U0001f512", "⚙")):
+        return True, True
+    if value in ALLOW_MARKERS or "✅" in value:
+        return True, bool(footnote)
+    if value in DENY_MARKERS or "❌" in value:
+        return False, False
+    # Letter codes or anything else: allowed if it names at least one operation
+    allowed, conditional, all_flag = parse_cell(text, vocabulary, unknown)
+    return bool(allowed) or all_flag, bool(conditional)
+
+
+# ---------------------------------------------------------------------------
+# Grid extraction
+# ---------------------------------------------------------------------------
+
+def role_columns(header: list[str]) -> list[tuple[int, str]]:
+    """Return (column index, role name) pairs for a permission table header."""
+    return [
+        (i, name) for i, name in enumerate(header)
+        if i > 0 and name and name.lower() not in NON_ROLE_COLUMNS
+    ]
+
+
+def parse_grid(text: str) -> dict:
+    """Parse permission tables from matrix markdown into a nested grid.
+
+    Returns {"roles": [...], "resources": [...], "allow": {resource: {role: set}},
+    "conditional": {resource: {role: set}}, "stated": {resource: set},
+    "unknown": [(resource, role, token)]}. Two table shapes are recognized:
+
+    - Entity rows x role columns (Step 2): `| Entity / Operation | Admin | ... |`
+    - Operation rows x role columns under an entity heading (Step 8):
+      `### Order` followed by `| Operation | Admin | ... |`
+
+    Tables without role columns are skipped. A cell may name CRUD
+    operations, KNOWN_ACTIONS and any operation the document gives a row
+    of its own; other tokens are collected in "unknown".
+    """
+    roles: dict[str, str] = {}          # casefold -> display name
+    resources: dict[str, str] = {}
+    allow: dict[str, dict[str, set[str]]] = {}
+    conditional: dict[str, dict[str, set[str]]] = {}
+    stated: dict[str, set[str]] = {}    # operations each table row set covers
+    star_cells: list[tuple[str, str]] = []
+    unknown: list[tuple[str, str, str]] = []
+
+    def cell(grid, resource, role):
+        return grid.setdefault(resource, {}).setdefault(role, set())
+
+    def register(registry: dict[str, str], name: str) -> str:
+        return registry.setdefault(name.casefold(), name)
+
+    tables = [
+        (subsection, header, rows)
+        for section, subsection, header, rows in iter_tables(text)
+        if "permission" in section.lower() and len(header) >= 2 and role_columns(header)
+    ]
+
+    # Operations the document names as rows are valid in any cell
+    vocabulary = set(CRUD_ACTIONS) | KNOWN_ACTIONS
+    for subsection, header, rows in tables:
+        first = header[0].lower()
+        for row in rows:
+            if not row or not row[0]:
+                continue
+            if first.startswith("operation") and subsection:
+                vocabulary.add(normalize_action(row[0]))
+            elif first.startswith(("entity", "resource")) and " / " in row[0]:
+                vocabulary.add(normalize_action(row[0].split(" / ", 1)[1]))
+
+    for subsection, header, rows in tables:
+        first = header[0].lower()
+        columns = role_columns(header)
+
+        if first.startswith("operation") and subsection:
+            # Step 8 style: one table per entity, one row per operation
+            resource = register(resources, subsection.replace("Entity:", "").strip())
+            for row in rows:
+                if not row or not row[0]:
+                    continue
+                action = normalize_action(row[0])
+                stated.setdefault(resource, set()).add(action)
+                for idx, role_name in columns:
+                    role = register(roles, role_name)
+                    cell(allow, resource, role)
+                    cell(conditional, resource, role)
+                    if idx >= len(row):
+                        continue
+                    tokens: list[str] = []
+                    ok, cond = parse_marker(row[idx], vocabulary, tokens)
+                    unknown.extend((resource, role, token) for token in tokens)
+                    if ok:
+                        allow[resource][role].add(action)
+                    if cond:
+                        conditional[resource][role].add(action)
+
+        elif first.startswith(("entity", "resource")):
+            # Step 2 style: one row per entity (or "Entity / Operation" pair)
+            for row in rows:
+                if not row or not row[0]:
+                    continue
+                name = row[0]
+                row_action = None
+                if " / " in name:
+                    name, row_action = (p.strip() for p in name.split(" / ", 1))
+                resource = register(resources, name)
+                stated.setdefault(resource, set()).update(
+                    [normalize_action(row_action)] if row_action else CRUD_ACTIONS
+                )
+                for idx, role_name in columns:
+                    role = register(roles, role_name)
+                    cell(allow, resource, role)
+                    cell(conditional, resource, role)
+                    if idx >= len(row):
+                        continue
+                    tokens: list[str] = []
+                    if row_action:
+                        ok, cond = parse_marker(row[idx], vocabulary, tokens)
+                        unknown.extend((resource, role, token) for token in tokens)
+                        action = normalize_action(row_action)
+                        if ok:
+                            allow[resource][role].add(action)
+                        if cond:
+                            conditional[resource][role].add(action)
+                        continue
+                    granted, cond_set, all_flag = parse_cell(row[idx], vocabulary, tokens)
+                    unknown.extend((resource, role, token) for token in tokens)
+                    allow[resource][role] |= granted
+                    conditional[resource][role] |= cond_set
+                    if all_flag:
+                        star_cells.append((resource, role))
+
+    # `*` means every operation the matrix knows about, resolved once all
+    # custom operations have been seen
+    known = set(CRUD_ACTIONS)
+    for per_role in allow.values():
+        for acts in per_role.values():
+            known |= acts
+    for resource, role in star_cells:
+        allow[resource][role] |= known
+        stated[resource] |= known
+
+    return {
+        "roles": list(roles.values()),
+        "resources": list(resources.values()),
+        "allow": allow,
+        "conditional": conditional,
+        "stated": stated,
+        "unknown": unknown,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+def ordered_actions(*grids: dict) -> list[str]:
+    """Return CRUD actions first, then custom actions in first-seen order."""
+    actions = list(CRUD_ACTIONS)
+    seen = set(actions)
+    for grid in grids:
+        for per_role in grid["allow"].values():
+            for acts in per_role.values():
+                for a in sorted(acts):
+                    if a not in seen:
+                        seen.add(a)
+                        actions.append(a)
+    return actions
+
+
+def merge_grids(suite: dict, app: dict) -> dict:
+    """Overlay an app refinement grid onto the suite grid.
+
+    Operations the app refinement lists for a resource replace the suite
+    grant for those operations; every other operation and every unrefined
+    resource is inherited from the suite matrix.
+    """
+    roles = {r.casefold(): r for r in suite["roles"]}
+    resources = {r.casefold(): r for r in suite["resources"]}
+    allow = {res: {role: set(a) for role, a in per.items()} for res, per in suite["allow"].items()}
+    conditional = {res: {role: set(a) for role, a in per.items()} for res, per in suite["conditional"].items()}
+
+    for app_res, per_role in app["allow"].items():
+        res = resources.setdefault(app_res.casefold(), app_res)
+        replaced = app["stated"].get(app_res, set())
+        for app_role, acts in per_role.items():
+            role = roles.setdefault(app_role.casefold(), app_role)
+            cond = app["conditional"].get(app_res, {}).get(app_role, set())
+            res_allow = allow.setdefault(res, {})
+            res_cond = conditional.setdefault(res, {})
+            res_allow[role] = (res_allow.get(role, set()) - replaced) | acts
+            res_cond[role] = (res_cond.get(role, set()) - replaced) | cond
+
+    stated = {res: set(a) for res, a in suite["stated"].items()}
+    for app_res, acts in app["stated"].items():
+        stated.setdefault(resources.setdefault(app_res.casefold(), app_res), set()).update(acts)
+
+    return {
+        "roles": list(roles.values()),
+        "resources": list(resources.values()),
+        "allow": allow,
+        "conditional": conditional,
+        "stated": stated,
+    }
+
+
+def pack(grid: dict, actions: list[str]) -> dict:
+    """Pack a grid into row-major bitmask arrays over `actions`."""
+    bit = {a: 1 << i for i, a in enumerate(actions)}
+    allow_words = []
+    cond_words = []
+    for res in grid["resources"]:
+        per_role = grid["allow"].get(res, {})
+        per_cond = grid["conditional"].get(res, {})
+        for role in grid["roles"]:
+            allow_words.append(sum(bit[a] for a in per_role.get(role, ())))
+            cond_words.append(sum(bit[a] for a in per_cond.get(role, ())))
+    return {"allow": allow_words, "conditional": cond_words}
+
+
+def diff_grids(suite: dict, app: dict) -> dict:
+    """Compare an app refinement grid against the suite matrix.
+
+    - `escalations`: app grants an action the suite denies (permission creep)
+    - `restrictions`: app denies an action the suite grants (narrowing, informational)
+    - `new_roles` / `new_resources`: names the suite matrix does not define
+    """
+    suite_roles = {r.casefold() for r in suite["roles"]}
+    suite_res = {r.casefold(): r for r in suite["resources"]}
+    suite_allow = {
+        res.casefold(): {role.casefold(): acts for role, acts in per.items()}
+        for res, per in suite["allow"].items()
+    }
+
+    escalations = []
+    restrictions = []
+    new_roles = sorted({r for r in app["roles"] if r.casefold() not in suite_roles})
+    new_resources = sorted({r for r in app["resources"] if r.casefold() not in suite_res})
+
+    for res, per_role in app["allow"].items():
+        if res.casefold() not in suite_res:
+            continue
+        suite_cells = suite_allow.get(res.casefold(), {})
+        # Only operations the refinement actually lists can be restrictions
+        stated = app["stated"].get(res, set())
+        for role, acts in per_role.items():
+            if role.casefold() not in suite_roles:
+                continue
+            granted = suite_cells.get(role.casefold(), set())
+            for action in sorted(acts - granted):
+                escalations.append({"resource": res, "role": role, "action": action})
+            for action in sorted((granted & stated) - acts):
+                restrictions.append({"resource": res, "role": role, "action": action})
+
+    return {
+        "escalations": escalations,
+        "restrictions": restrictions,
+        "new_roles": new_roles,
+        "new_resources": new_resources,
+    }
+
+
+def compile_table(suite_text: str, app_text: str = "", app_name: str | None = None) -> dict:
+    """Compile suite (and optional app refinement) markdown into a permission table."""
+    suite = parse_grid(suite_text)
+    if app_text:
+        app = parse_grid(app_text)
+        grid = merge_grids(suite, app)
+        diff = diff_grids(suite, app)
+    else:
+        app = None
+        grid = suite
+        diff = None
+
+    actions = ordered_actions(grid)
+
+    def names(g, res, role):
+        return [a for a in actions if a in g.get(res, {}).get(role, ())]
+
+    table = {
+        "version": TABLE_VERSION,
+        "app": app_name,
+        "actions": actions,
+        "roles": grid["roles"],
+        "resources": grid["resources"],
+        "matrix": {
+            res: {role: names(grid["allow"], res, role) for role in grid["roles"]}
+            for res in grid["resources"]
+        },
+        "conditional": {
+            res: {role: names(grid["conditional"], res, role) for role in grid["roles"]
+                  if names(grid["conditional"], res, role)}
+            for res in grid["resources"]
+        },
+        "packed": pack(grid, actions),
+    }
+    if diff is not None:
+        table["diff"] = diff
+    unknown = [("suite", *u) for u in suite["unknown"]] + [("app", *u) for u in (app["unknown"] if app else [])]
+    if unknown:
+        table["unknown_operations"] = [
+            {"source": source, "resource": res, "role": role, "token": token} for source, res, role, token in unknown
+        ]
+    return table
+
+
+def compile_app(spec_dir: Path, app_name: str | None = None) -> dict:
+    """Compile the permission table for an app (or the suite alone) from a spec dir."""
+    def read(path: Path) -> str:
+        return path.read_text(encoding="utf-8", errors="replace") if path.is_file() else ""
+
+    suite_text = read(spec_dir / "suite" / "role-permission-matrix.md")
+    app_text = read(spec_dir / "apps" / app_name / "role-refinement.md") if app_name else ""
+    return compile_table(suite_text, app_text, app_name)
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+def lookup(table: dict):
+    """Build an O(1) `can(role, action, resource, strict=False)` check for a table.
+
+    Names are matched case-insensitively. With `strict=True`, conditional
+    grants (own records only, footnoted) count as denied.
+    """
+    n_roles = len(table["roles"])
+    role_idx = {r.casefold(): i for i, r in enumerate(table["roles"])}
+    res_idx = {r.casefold(): i for i, r in enumerate(table["resources"])}
+    bit = {a: 1 << i for i, a in enumerate(table["actions"])}
+    allow = table["packed"]["allow"]
+    cond = table["packed"]["conditional"]
+
+    def can(role: str, action: str, resource: str, strict: bool = False) -> bool:
+        r = role_idx.get(role.casefold())
+        x = res_idx.get(resource.casefold())
+        b = bit.get(normalize_action(action))
+        if r is None or x is None or b is None:
+            return False
+        word = x * n_roles + r
+        if not allow[word] & b:
+            return False
+        return not (strict and cond[word] & b)
+
+    return can
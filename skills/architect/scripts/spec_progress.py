@@ -0,0 +1,1605 @@
+"""Single-walk progress scanner for the webapp pipeline (Steps 1-17).
+
+Walks the spec/ tree once with os.scandir, keeps the directory listing in
+an in-memory snapshot, and answers every progress question — blueprint
+Steps 1-9 and architect Steps 10-17 — from that snapshot. No per-step
+stat calls or repeated directory listings: each directory is listed
+exactly once, whatever the number of apps.
+
+Repeated checks reuse spec/.progress-cache.json: each directory's listing
+is stored with its mtime and inode, and on the next run only directories
+whose (mtime, inode) changed are listed again — the rest cost one stat.
+Adding, removing or renaming a file always bumps its directory's mtime,
+so the cached listings stay exact for existence checks.
+
+A step counts as complete only when its file has content: at least
+MIN_CONTENT_BYTES, the headings its reference Output Specification
+requires (REQUIRED_HEADINGS), and not a known template stub. Verdicts are
+cached by content hash, and file hashes by (size, mtime), so unchanged
+files are neither re-read nor re-checked. The cache also records the
+(size, mtime) of the .blueprint-meta.json it last brought up to date;
+while that file and every step file are unchanged, the meta file is
+neither rebuilt nor re-verified. A --no-cache run is an independent scan:
+it lists, reads and hashes everything afresh.
+
+Other tools can call get_progress() in-process for the same data as
+`check-progress.py --json`. The module keeps its import-time cost to os and
+time: json and argparse load only when a code path needs them, and paths
+are plain strings so pathlib (and the urllib/ipaddress chain behind it)
+never loads.
+
+Each plugin that reports progress ships its own copy of this module, since
+an installed plugin cannot reach outside its directory: scripts/ for
+webapp-blueprint and skills/architect/scripts/ for webapp-architect. The
+copies must stay identical; bench-progress.py fails when they differ.
+"""
+
+import os
+import time
+
+CACHE_FILENAME = ".progress-cache.json"
+CACHE_VERSION = 3
+
+# Directories modified this close to the previous scan are relisted: a change
+# within the same mtime tick as the scan would otherwise go unnoticed
+# (coarse filesystems such as FAT have 2-second mtime resolution).
+RACY_WINDOW_NS = 2_000_000_000
+
+# Tier 1 suite-level files (Steps 1-5)
+SUITE_FILES = {
+    1: ("Domain Discovery", "domain-model.md"),
+    2: ("Role & Permission Matrix", "role-permission-matrix.md"),
+    3: ("UI Conventions", "ui-conventions.md"),
+    4: ("Navigation Shell", "navigation-shell.md"),
+    5: ("Suite API Conventions", "api-event-contracts.md"),
+}
+
+# Tier 2 per-app files (Steps 6-8)
+APP_FILES = {
+    6: ("App Archetype", "archetype.md"),
+    7: ("Domain Refinement", "domain-refinement.md"),
+    8: ("Role Refinement", "role-refinement.md"),
+}
+
+# Tier 3 per-app directories (Step 9)
+APP_DIRS = {
+    9: ("BDD Features", "features", ".feature.md"),
+}
+
+# Architect Tier 3 per-app single files (Steps 10, 12-14)
+APP_SPEC_FILES = {
+    10: ("Information Architecture", "ia-spec.md"),
+    12: ("State & Interaction", "state-interaction.md"),
+    13: ("API Contracts", "api-contracts.md"),
+    14: ("Authorization Policy", "authorization.md"),
+}
+
+# Architect Tier 3 per-app directories (Step 11)
+ARCHITECT_APP_DIRS = {
+    11: ("Page Patterns", "pages", ".md"),
+}
+
+# Reference directories holding the step templates, relative to the plugin
+# this copy ships in. The blueprint plugin (the repository root) holds its
+# own references (Steps 1-9) and the architect skill's (Steps 10-17); the
+# architect plugin installed on its own holds only the latter, and missing
+# directories are skipped.
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REFERENCE_DIRS = (
+    os.path.join(PLUGIN_DIR, "references"),
+    os.path.join(PLUGIN_DIR, "skills", "architect", "references"),
+)
+
+# Blueprint metadata maintained by the blueprint progress scan
+BLUEPRINT_META = ".blueprint-meta.json"
+BLUEPRINT_META_VERSION = "1.2"
+
+# Architect Tier 4 labels (Steps 15-17)
+TIER4_LABELS = {
+    15: "Spec Validator",
+    16: "Generation Briefs",
+    17: "Seed Data",
+}
+
+# Architect Tier 4 completion markers, relative to spec/ (Steps 15-17)
+TIER4_FILES = {
+    15: "validation/reports/{app}/completeness-score.md",
+    16: "apps/{app}/generation-briefs/_build-order.md",
+    17: "apps/{app}/seed-data.md",
+}
+
+
+# Step files smaller than this are placeholders, not written specs
+MIN_CONTENT_BYTES = 200
+
+# Headings each step's output must contain, taken from the Output
+# Specification of references/NN-*.md. A requirement is met by any markdown
+# heading (any level) containing it, case-insensitively.
+REQUIRED_HEADINGS = {
+    1: ("Entity Glossary", "Domain Event Catalog", "Aggregate Boundaries", "Business Rules"),
+    2: ("Role Definitions", "Permission Matrix"),
+    3: ("Layout Grid", "Spacing Scale", "Breakpoints"),
+    4: ("Shell Layout", "Primary Navigation"),
+    5: ("API Style", "Authentication", "Pagination"),
+    6: ("App Identity", "Selected Archetype"),
+    7: ("Owned Entities", "Business Rules"),
+    8: ("Active Roles", "Permission Matrix"),
+    9: ("Feature", "Scenario"),
+    10: ("Site Map", "URL Schema", "Navigation Model"),
+    11: ("Page Identity", "Data Requirements", "Layout"),
+    12: ("State Architecture", "Server State"),
+    13: ("Endpoint", "Shared Schemas"),
+    14: ("Route-Level Policies", "API-Level Policies"),
+    15: ("Completeness Score",),
+    16: ("Build Order", "Build Sequence"),
+    17: ("Entities", "Role Coverage"),
+}
+
+# Placeholder bodies agents and editors leave behind (compared after
+# normalize_content, ignoring case). Document templates from the skills'
+# references are added to the stubs at first use.
+STUB_TEXTS = ("", "todo", "# todo", "tbd", "# tbd", "wip", "placeholder", "coming soon", "# coming soon")
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+class SpecSnapshot:
+    """In-memory listing of a spec/ tree built from one os.scandir walk.
+
+    `dirs` maps each directory path relative to the spec root ("" for the
+    root, "apps/portal/features" for nested ones) to a pair of
+    (set of file names, sorted list of subdirectory names). `stamps` holds
+    each directory's (mtime_ns, inode) at the time it was listed.
+
+    `file_hashes` maps checked step files to (size, mtime_ns, content hash)
+    and `verdicts` maps "step:hash" to that content's issues; both carry
+    over between scans, as does `meta_stamp`, the (size, mtime_ns) of the
+    .blueprint-meta.json last brought up to date. `meta_current` is set once
+    this scan has confirmed or rewritten that file. With check_content
+    False, existence is enough.
+    """
+
+    def __init__(self, spec_dir: "str | os.PathLike"):
+        self.spec_dir = os.fspath(spec_dir)
+        self.dirs: dict[str, tuple[set[str], list[str]]] = {}
+        self.stamps: dict[str, tuple[int, int]] = {}
+        self.scanned_at_ns = time.time_ns()
+        self.rescanned = 0
+        self.reused = 0
+        self.consistent = True
+        self.check_content = True
+        self.file_hashes: dict[str, tuple[int, int, str]] = {}
+        self.verdicts: dict[str, list[str]] = {}
+        self.content_dirty = False
+        self.cache_loaded = False
+        self.meta_stamp: tuple[int, int] | None = None
+        self.loaded_meta_stamp: tuple[int, int] | None = None
+        self.meta_current = False
+        self._issues: dict[str, list[str] | None] = {}
+        self._json: dict[str, dict | None] = {}
+
+    @classmethod
+    def scan(cls, spec_dir: "str | os.PathLike", previous: "SpecSnapshot | None" = None) -> "SpecSnapshot":
+        """Walk spec_dir once and record every directory's files and subdirs.
+
+        With a previous snapshot, directories whose (mtime, inode) still match
+        and were not modified within RACY_WINDOW_NS of that scan reuse the
+        previous listing instead of being listed again.
+        """
+        snap = cls(spec_dir)
+        racy_after = previous.scanned_at_ns - RACY_WINDOW_NS if previous else 0
+        if previous is not None:
+            snap.check_content = previous.check_content
+            snap.file_hashes = dict(previous.file_hashes)
+            snap.verdicts = dict(previous.verdicts)
+            snap.meta_stamp = snap.loaded_meta_stamp = previous.meta_stamp
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            try:
+                st = os.stat(snap.path(rel))
+            except OSError:
+                # A subdirectory listed as present has vanished: the listing
+                # it came from is out of date
+                if rel and previous is not None and rel in previous.dirs:
+                    snap.consistent = False
+                continue
+            stamp = (st.st_mtime_ns, st.st_ino)
+            if previous is not None and previous.stamps.get(rel) == stamp and st.st_mtime_ns < racy_after:
+                files, subdirs = previous.dirs[rel]
+                snap.reused += 1
+            else:
+                files, subdirs = snap.list_dir(rel)
+                snap.rescanned += 1
+            snap.dirs[rel] = (files, subdirs)
+            snap.stamps[rel] = stamp
+            stack.extend(f"{rel}/{d}" if rel else d for d in subdirs)
+        return snap
+
+    def path(self, rel: str) -> str:
+        """Absolute path of a spec-relative path."""
+        return os.path.join(self.spec_dir, rel) if rel else self.spec_dir
+
+    def list_dir(self, rel: str) -> tuple[set[str], list[str]]:
+        """List one directory with a single scandir call (DirEntry type checks need no stat)."""
+        files: set[str] = set()
+        subdirs: list[str] = []
+        try:
+            with os.scandir(self.path(rel)) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        # Hidden directories (caches, VCS metadata) are not spec content
+                        if not entry.name.startswith("."):
+                            subdirs.append(entry.name)
+                    elif entry.is_file():
+                        files.add(entry.name)
+        except OSError:
+            pass
+        subdirs.sort()
+        return files, subdirs
+
+    def is_dir(self, rel: str) -> bool:
+        return rel in self.dirs
+
+    def is_file(self, rel: str) -> bool:
+        parent, _, name = rel.rpartition("/")
+        entry = self.dirs.get(parent)
+        return entry is not None and name in entry[0]
+
+    def count_files(self, rel_dir: str, suffix: str) -> int:
+        """Count files in a directory matching the given suffix."""
+        entry = self.dirs.get(rel_dir)
+        if entry is None:
+            return 0
+        return sum(1 for name in entry[0] if name.endswith(suffix))
+
+    def step_file_issues(self, rel: str, step: int) -> list[str] | None:
+        """None when a step file is missing, else its content issues ([] = complete)."""
+        if rel not in self._issues:
+            self._issues[rel] = self._check_step_file(rel, step)
+        return self._issues[rel]
+
+    def step_complete(self, rel: str, step: int) -> bool:
+        return self.step_file_issues(rel, step) == []
+
+    def _check_step_file(self, rel: str, step: int) -> list[str] | None:
+        if not self.is_file(rel):
+            return None
+        if not self.check_content:
+            return []
+        digest, text = self._hash_file(rel)
+        if digest is None:
+            return ["unreadable"]
+        key = f"{step}:{digest}"
+        if key not in self.verdicts:
+            # A file just hashed is checked from the text already read
+            text = text if text is not None else read_text(self.path(rel))
+            if text is None:
+                return ["unreadable"]
+            self.verdicts[key] = content_issues(text, step)
+            self.content_dirty = True
+        return self.verdicts[key]
+
+    def file_hash(self, rel: str) -> str | None:
+        """Content hash of a spec file, re-read only when its (size, mtime) changed."""
+        return self._hash_file(rel)[0]
+
+    def _hash_file(self, rel: str) -> tuple[str | None, str | None]:
+        """(content hash, text if the file had to be read) of a spec file."""
+        path = self.path(rel)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, None
+        known = self.file_hashes.get(rel)
+        # Reuse a hash only for files untouched since well before this scan,
+        # so a same-size rewrite within one mtime tick is still re-read
+        if (known and known[:2] == (st.st_size, st.st_mtime_ns)
+                and st.st_mtime_ns < self.scanned_at_ns - RACY_WINDOW_NS):
+            return known[2], None
+        text = read_text(path)
+        if text is None:
+            return None, None
+        digest = content_hash(text)
+        self.file_hashes[rel] = (st.st_size, st.st_mtime_ns, digest)
+        self.content_dirty = True
+        return digest, text
+
+    def count_step_files(self, rel_dir: str, suffix: str, step: int) -> tuple[int, int]:
+        """Count (complete, incomplete) files in a directory step."""
+        entry = self.dirs.get(rel_dir)
+        if entry is None:
+            return 0, 0
+        complete = incomplete = 0
+        for name in entry[0]:
+            if name.endswith(suffix):
+                if self.step_file_issues(f"{rel_dir}/{name}", step):
+                    incomplete += 1
+                else:
+                    complete += 1
+        return complete, incomplete
+
+    def subdirs(self, rel: str) -> list[str]:
+        entry = self.dirs.get(rel)
+        return list(entry[1]) if entry else []
+
+    def read_json(self, rel: str) -> dict | None:
+        """Load a JSON file from the spec tree if the snapshot says it exists (once per snapshot)."""
+        if not self.is_file(rel):
+            return None
+        if rel not in self._json:
+            import json
+
+            try:
+                with open(self.path(rel), encoding="utf-8") as f:
+                    self._json[rel] = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._json[rel] = None
+        return self._json[rel]
+
+    def file_stamp(self, rel: str) -> tuple[int, int] | None:
+        """(size, mtime_ns) of a spec file untouched since well before this scan, else None."""
+        try:
+            st = os.stat(self.path(rel))
+        except OSError:
+            return None
+        if st.st_mtime_ns >= self.scanned_at_ns - RACY_WINDOW_NS:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+
+# ---------------------------------------------------------------------------
+# Content checks
+# ---------------------------------------------------------------------------
+
+_stub_texts: dict[str, set[str]] | None = None
+
+
+def read_text(path: str) -> str | None:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def normalize_content(text: str) -> str:
+    """Strip each line and drop blank lines, so whitespace-only edits hash the same.
+
+    Case is kept: a case-only edit is a content change.
+    """
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def content_hash(text: str) -> str:
+    import hashlib
+
+    return hashlib.sha1(normalize_content(text).encode("utf-8")).hexdigest()
+
+
+def iter_reference_templates():
+    """Yield fenced document templates (blocks starting with '# ') from the skills' references."""
+    for ref_dir in REFERENCE_DIRS:
+        try:
+            names = sorted(n for n in os.listdir(ref_dir) if n.endswith(".md"))
+        except OSError:
+            continue
+        for name in names:
+            text = read_text(os.path.join(ref_dir, name)) or ""
+            # Fence lines alternate between opening and closing a block; an
+            # opening segment holds the rest of its fence line, then the block
+            segments = ("\n" + text).split("\n```")
+            for opening in segments[1:-1:2]:
+                block = opening.partition("\n")[2]
+                if block.startswith("# "):
+                    yield block
+
+
+def stub_texts() -> dict[str, set[str]]:
+    """Normalized, lowercased stub contents (STUB_TEXTS plus unfilled reference templates) by first line."""
+    global _stub_texts
+    if _stub_texts is None:
+        _stub_texts = {}
+        for text in (*STUB_TEXTS, *iter_reference_templates()):
+            normalized = normalize_content(text).lower()
+            _stub_texts.setdefault(normalized.partition("\n")[0], set()).add(normalized)
+    return _stub_texts
+
+
+def is_stub(text: str) -> bool:
+    """Whether text is a known stub once normalized (see normalize_content), ignoring case.
+
+    A template with only its case changed is still unfilled, so unlike
+    content_hash this comparison lowercases.
+    """
+    # Only a file whose first line opens some stub is normalized in full
+    candidates = stub_texts().get(text.lstrip().partition("\n")[0].strip().lower())
+    return candidates is not None and normalize_content(text).lower() in candidates
+
+
+def content_issues(text: str, step: int) -> list[str]:
+    """Why a step file does not count as written ([] when it does)."""
+    if is_stub(text):
+        return ["template stub"]
+    issues = []
+    size = len(text.encode("utf-8"))
+    if size < MIN_CONTENT_BYTES:
+        issues.append(f"only {size} bytes")
+    headings = [line.lstrip("#").strip().lower() for line in text.splitlines() if line.startswith("#")]
+    missing = [h for h in REQUIRED_HEADINGS.get(step, ()) if not any(h.lower() in found for found in headings)]
+    if missing:
+        issues.append(f"missing headings: {', '.join(missing)}")
+    return issues
+
+
+def describe_issues(issues: list[str] | None) -> str:
+    """Report suffix for a step file that exists but is not yet written."""
+    return f" — incomplete ({'; '.join(issues)})" if issues else ""
+
+
+def describe_count(info: dict) -> str:
+    """File count for a directory step, noting files that are not yet written."""
+    if info.get("incomplete"):
+        return f"{info['count']} files, {info['incomplete']} incomplete"
+    return f"{info['count']} files"
+
+
+# ---------------------------------------------------------------------------
+# Progress cache
+# ---------------------------------------------------------------------------
+
+def load_cache(spec_dir: "str | os.PathLike") -> SpecSnapshot | None:
+    """Load spec/.progress-cache.json as a previous snapshot.
+
+    Returns None — forcing a full scan — when the cache is missing, from
+    another version or spec root, or fails its structural self-check
+    (malformed entries, or a listed subdirectory with no entry of its own).
+    """
+    import json
+
+    spec_dir = os.fspath(spec_dir)
+    try:
+        with open(os.path.join(spec_dir, CACHE_FILENAME), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return None
+    if data.get("spec_dir") != spec_dir or not isinstance(data.get("scanned_at_ns"), int):
+        return None
+
+    snap = SpecSnapshot(spec_dir)
+    snap.scanned_at_ns = data["scanned_at_ns"]
+    entries = data.get("dirs")
+    if not isinstance(entries, dict) or "" not in entries:
+        return None
+    try:
+        for rel, entry in entries.items():
+            files, subdirs = entry["files"], entry["subdirs"]
+            if not all(isinstance(n, str) for n in files + subdirs):
+                return None
+            snap.dirs[rel] = (set(files), sorted(subdirs))
+            snap.stamps[rel] = (int(entry["mtime_ns"]), int(entry["ino"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+    for rel, (_, subdirs) in snap.dirs.items():
+        if any((f"{rel}/{d}" if rel else d) not in snap.dirs for d in subdirs):
+            return None
+    try:
+        for rel, (size, mtime_ns, digest) in data.get("file_hashes", {}).items():
+            snap.file_hashes[rel] = (int(size), int(mtime_ns), str(digest))
+        for key, issues in data.get("verdicts", {}).items():
+            if not isinstance(issues, list):
+                return None
+            snap.verdicts[key] = [str(i) for i in issues]
+        stamp = data.get("meta_stamp")
+        snap.meta_stamp = (int(stamp[0]), int(stamp[1])) if stamp else None
+    except (AttributeError, TypeError, ValueError, IndexError):
+        return None
+    return snap
+
+
+def save_cache(snap: SpecSnapshot):
+    """Write the snapshot to spec/.progress-cache.json (best effort).
+
+    The file is rewritten in place rather than renamed over, so updating an
+    existing cache does not bump the spec root's own mtime. A torn write is
+    caught by load_cache and costs one full scan.
+    """
+    import json
+
+    data = {
+        "version": CACHE_VERSION,
+        "spec_dir": snap.spec_dir,
+        "scanned_at_ns": snap.scanned_at_ns,
+        "dirs": {
+            rel: {
+                "mtime_ns": snap.stamps[rel][0],
+                "ino": snap.stamps[rel][1],
+                "files": sorted(files),
+                "subdirs": subdirs,
+            }
+            for rel, (files, subdirs) in sorted(snap.dirs.items())
+        },
+        # Hashes of files that no longer exist are dropped; verdicts are
+        # keyed by content and stay valid wherever that content reappears
+        "file_hashes": {rel: list(v) for rel, v in sorted(snap.file_hashes.items()) if snap.is_file(rel)},
+        "verdicts": snap.verdicts,
+        "meta_stamp": list(snap.meta_stamp) if snap.meta_stamp else None,
+    }
+    try:
+        with open(snap.path(CACHE_FILENAME), "w", encoding="utf-8") as f:
+            # dumps() uses the C encoder; dump() streams through the pure-Python one
+            f.write(json.dumps(data, separators=(",", ":")))
+    except OSError:
+        pass
+
+
+def scan_spec(spec_dir: "str | os.PathLike", use_cache: bool = True, check_content: bool = True) -> SpecSnapshot:
+    """Snapshot spec_dir, reusing the progress cache when enabled.
+
+    Content checks run lazily as steps are queried, so callers save the
+    cache afterwards with finish_scan().
+    """
+    previous = load_cache(spec_dir) if use_cache else None
+    snap = SpecSnapshot.scan(spec_dir, previous=previous)
+    if not snap.consistent:
+        snap = SpecSnapshot.scan(spec_dir)
+    snap.cache_loaded = previous is not None
+    snap.check_content = check_content
+    return snap
+
+
+def finish_scan(snap: SpecSnapshot, use_cache: bool = True):
+    """Write the progress cache if the scan or content checks changed anything."""
+    # Nothing relisted or re-hashed means the cache on disk already matches
+    changed = snap.rescanned or snap.content_dirty or snap.meta_stamp != snap.loaded_meta_stamp
+    if use_cache and (not snap.cache_loaded or changed):
+        save_cache(snap)
+
+
+# ---------------------------------------------------------------------------
+# Blueprint view (Steps 1-9)
+# ---------------------------------------------------------------------------
+
+def detect_apps(snap: SpecSnapshot) -> list[str]:
+    """Discover app directories under spec/apps/."""
+    return snap.subdirs("apps")
+
+
+def check_tier1(snap: SpecSnapshot) -> dict[int, bool]:
+    """Check Tier 1 suite-level completion."""
+    return {step: snap.step_complete(f"suite/{fname}", step) for step, (_, fname) in SUITE_FILES.items()}
+
+
+def check_app(snap: SpecSnapshot, app_name: str) -> dict:
+    """Check Tier 2-3 completion for a single app."""
+    app_dir = f"apps/{app_name}"
+    result = {"tier2": {}, "tier3": {}, "issues": {}}
+
+    # Tier 2
+    for step, (_, fname) in APP_FILES.items():
+        issues = snap.step_file_issues(f"{app_dir}/{fname}", step)
+        result["tier2"][step] = issues == []
+        if issues:
+            result["issues"][step] = issues
+
+    # Tier 3 — directories with multiple files (Step 9)
+    for step, (_, dirname, suffix) in APP_DIRS.items():
+        n, incomplete = snap.count_step_files(f"{app_dir}/{dirname}", suffix, step)
+        result["tier3"][step] = {"exists": n > 0, "count": n, "incomplete": incomplete}
+
+    return result
+
+
+def suggest_next(tier1: dict, apps: list[str], app_results: dict) -> str:
+    """Determine the lowest-numbered incomplete step."""
+    # Check Tier 1 first
+    for step in sorted(SUITE_FILES):
+        if not tier1[step]:
+            return f"Step {step} — {SUITE_FILES[step][0]}"
+
+    if not apps:
+        return "No apps detected. Create spec/apps/<app_name>/ and run Step 6 — App Archetype"
+
+    # Check each app in order
+    for app in apps:
+        r = app_results[app]
+        for step in sorted(r["tier2"]):
+            if not r["tier2"][step]:
+                return f"Step {step} — {APP_FILES[step][0]} (app: {app})"
+        for step in sorted(r["tier3"]):
+            if not r["tier3"][step]["exists"]:
+                label = APP_DIRS.get(step, (None,))[0]
+                return f"Step {step} — {label} (app: {app})"
+
+    return "All 9 steps complete! Run webapp-architect for technical specification."
+
+
+def print_blueprint_report(snap: SpecSnapshot):
+    """Print the blueprint (Steps 1-9) progress report."""
+    tier1 = check_tier1(snap)
+    apps = detect_apps(snap)
+    app_results = {app: check_app(snap, app) for app in apps}
+
+    total_steps = 5  # Tier 1 suite steps
+    completed_steps = sum(1 for v in tier1.values() if v)
+
+    print("=== Webapp Blueprint Pipeline Progress ===\n")
+    print("Tier 1 — Suite Level:")
+    for step in sorted(SUITE_FILES):
+        mark = "✓" if tier1[step] else " "
+        label, fname = SUITE_FILES[step]
+        issues = describe_issues(snap.step_file_issues(f"suite/{fname}", step))
+        print(f"  [{mark}] Step {step}: {label} (suite/{fname}){issues}")
+
+    if apps:
+        print(f"\nDetected Apps: {', '.join(apps)}")
+    else:
+        print("\nNo apps detected under spec/apps/")
+
+    for app in apps:
+        r = app_results[app]
+        app_total = 4  # Steps 6-9
+        app_completed = 0
+
+        print(f"\nApp: {app}")
+
+        print("  Tier 2:")
+        for step in sorted(r["tier2"]):
+            mark = "✓" if r["tier2"][step] else " "
+            if r["tier2"][step]:
+                app_completed += 1
+            print(f"    [{mark}] Step {step}: {APP_FILES[step][0]}{describe_issues(r['issues'].get(step))}")
+
+        print("  Tier 3:")
+        for step in sorted(r["tier3"]):
+            info = r["tier3"][step]
+            label = APP_DIRS[step][0]
+            mark = "✓" if info["exists"] else " "
+            if info["exists"]:
+                app_completed += 1
+            print(f"    [{mark}] Step {step}: {label} ({describe_count(info)})")
+
+        total_steps += app_total
+        completed_steps += app_completed
+
+    print(f"\nProgress: {completed_steps}/{total_steps} steps complete")
+
+    suggestion = suggest_next(tier1, apps, app_results)
+    print(f"Suggested Next Step: {suggestion}")
+
+
+# ---------------------------------------------------------------------------
+# Architect view (Steps 10-17)
+# ---------------------------------------------------------------------------
+
+def check_prerequisites(snap: SpecSnapshot) -> dict:
+    """Check that .blueprint-meta.json exists and Steps 1-9 are complete."""
+    result = {"exists": False, "complete": False, "meta": None, "stale": []}
+
+    if not snap.is_file(BLUEPRINT_META):
+        return result
+
+    result["exists"] = True
+    meta = snap.read_json(BLUEPRINT_META)
+    if isinstance(meta, dict):
+        result["meta"] = meta
+        steps = meta.get("steps_completed", [])
+        result["complete"] = all(s in steps for s in range(1, 10))
+        result["stale"] = blueprint_meta_staleness(snap, meta)
+
+    return result
+
+
+def check_domain_files(snap: SpecSnapshot) -> dict:
+    """Check essential domain files exist (fallback if no .blueprint-meta.json)."""
+    apps = detect_apps(snap)
+    return {
+        "domain_model": snap.step_complete("suite/domain-model.md", 1),
+        "has_apps": any(snap.step_complete(f"apps/{app}/archetype.md", 6) for app in apps),
+        "has_features": any(snap.count_step_files(f"apps/{app}/features", ".feature.md", 9)[0] > 0 for app in apps),
+    }
+
+
+def check_architect_app(snap: SpecSnapshot, app_name: str) -> dict:
+    """Check Steps 10-17 completion for a single app."""
+    app_dir = f"apps/{app_name}"
+    result = {"tier3": {}, "tier4": {}, "issues": {}}
+
+    # Tier 3 — single files (Steps 10, 12-14)
+    for step, (_, fname) in APP_SPEC_FILES.items():
+        issues = snap.step_file_issues(f"{app_dir}/{fname}", step)
+        result["tier3"][step] = {"exists": issues == [], "count": None}
+        if issues:
+            result["issues"][step] = issues
+
+    # Tier 3 — directories (Step 11)
+    for step, (_, dirname, suffix) in ARCHITECT_APP_DIRS.items():
+        n, incomplete = snap.count_step_files(f"{app_dir}/{dirname}", suffix, step)
+        result["tier3"][step] = {"exists": n > 0, "count": n, "incomplete": incomplete}
+
+    # Tier 4 — validation report, generation briefs, seed data (Steps 15-17)
+    for step, template in TIER4_FILES.items():
+        issues = snap.step_file_issues(template.format(app=app_name), step)
+        result["tier4"][step] = issues == []
+        if issues:
+            result["issues"][step] = issues
+
+    return result
+
+
+def suggest_next_architect(apps: list[str], app_results: dict) -> str:
+    """Determine the lowest-numbered incomplete step across all apps (Steps 10-17)."""
+    if not apps:
+        return "No apps detected. Ensure spec/apps/<app_name>/ exists with archetype.md."
+
+    for app in apps:
+        r = app_results[app]
+        for step in sorted(r["tier3"]):
+            if not r["tier3"][step]["exists"]:
+                label = ARCHITECT_APP_DIRS.get(step, (None,))[0] or APP_SPEC_FILES.get(step, (None,))[0]
+                return f"Step {step} — {label} (app: {app})"
+        for step in sorted(r["tier4"]):
+            if not r["tier4"][step]:
+                label = TIER4_LABELS.get(step, f"Step {step}")
+                return f"Step {step} — {label} (app: {app})"
+
+    return "All steps (10-17) complete!"
+
+
+def print_architect_report(snap: SpecSnapshot):
+    """Print the architect (Steps 10-17) progress report."""
+    prereq = check_prerequisites(snap)
+    domain_files = check_domain_files(snap)
+
+    print("=== Webapp Architect Pipeline Progress (Steps 10-17) ===\n")
+
+    print("Prerequisites (Steps 1-9):")
+    if prereq["exists"]:
+        if prereq["complete"]:
+            print("  [✓] .blueprint-meta.json — all 9 steps completed")
+        else:
+            completed = prereq["meta"].get("steps_completed", []) if prereq["meta"] else []
+            print(f"  [!] .blueprint-meta.json exists but only steps {completed} completed")
+            print("      Run webapp-blueprint to complete remaining domain discovery steps.")
+        if prereq["stale"]:
+            print(f"  [!] .blueprint-meta.json is stale — {len(prereq['stale'])} step file(s) differ from what it recorded:")
+            for item in prereq["stale"][:5]:
+                print(f"      {item}")
+            if len(prereq["stale"]) > 5:
+                print(f"      ... and {len(prereq['stale']) - 5} more")
+            print("      Run webapp-blueprint's check-progress.py --write-meta to refresh it.")
+    else:
+        print("  [!] .blueprint-meta.json not found")
+        # Fall back to checking files directly
+        if domain_files["domain_model"] and domain_files["has_apps"] and domain_files["has_features"]:
+            print("      Domain files detected — Steps 1-9 may be complete but metadata is missing.")
+            print("      Consider running webapp-blueprint to generate .blueprint-meta.json.")
+        else:
+            print("      Run webapp-blueprint first to complete domain discovery (Steps 1-9).")
+            if not domain_files["domain_model"]:
+                print("      Missing: suite/domain-model.md")
+            if not domain_files["has_apps"]:
+                print("      Missing: at least one app with archetype.md")
+            if not domain_files["has_features"]:
+                print("      Missing: at least one app with .feature.md files")
+
+    # --- Check architect metadata ---
+    if snap.is_file(".architect-meta.json"):
+        arch_meta = snap.read_json(".architect-meta.json")
+        tech = arch_meta.get("tech_stack", {}) if isinstance(arch_meta, dict) else {}
+        if tech:
+            print(f"\n  Tech Stack: {tech.get('framework', '?')} / {tech.get('styling', '?')} / {tech.get('api', '?')}")
+    else:
+        print("\n  Tech stack not yet declared (.architect-meta.json missing)")
+
+    # --- Detect and check apps ---
+    apps = detect_apps(snap)
+    app_results = {app: check_architect_app(snap, app) for app in apps}
+
+    if apps:
+        print(f"\nDetected Apps: {', '.join(apps)}")
+    else:
+        print("\nNo apps detected under spec/apps/")
+
+    for app in apps:
+        r = app_results[app]
+        print(f"\nApp: {app}")
+
+        print("  Tier 3 (Steps 10-14):")
+        for step in sorted(r["tier3"]):
+            info = r["tier3"][step]
+            if info["count"] is not None:
+                label = ARCHITECT_APP_DIRS[step][0]
+                mark = "✓" if info["exists"] else " "
+                print(f"    [{mark}] Step {step}: {label} ({describe_count(info)})")
+            else:
+                label = APP_SPEC_FILES[step][0]
+                mark = "✓" if info["exists"] else " "
+                print(f"    [{mark}] Step {step}: {label}{describe_issues(r['issues'].get(step))}")
+
+        print("  Tier 4 (Steps 15-17):")
+        for step in sorted(r["tier4"]):
+            label = TIER4_LABELS.get(step, f"Step {step}")
+            mark = "✓" if r["tier4"][step] else " "
+            print(f"    [{mark}] Step {step}: {label}{describe_issues(r['issues'].get(step))}")
+
+    suggestion = suggest_next_architect(apps, app_results)
+    print(f"\nSuggested Next Step: {suggestion}")
+
+
+# ---------------------------------------------------------------------------
+# Structured status
+# ---------------------------------------------------------------------------
+
+PROGRESS_VERSION = 1
+VIEWS = ("blueprint", "architect", "all")
+
+
+def step_entry(step: int, label: str, complete: bool, path: str, count: int | None = None,
+               issues: list[str] | None = None, incomplete: int = 0) -> dict:
+    """One step's status.
+
+    `count` (written files) and `incomplete` (stub files) are set for
+    directory steps (9, 11); `issues` for a file that exists but is not
+    yet written.
+    """
+    entry = {"step": step, "label": label, "complete": complete, "path": path}
+    if count is not None:
+        entry["count"] = count
+    if incomplete:
+        entry["incomplete"] = incomplete
+    if issues:
+        entry["issues"] = issues
+    return entry
+
+
+def blueprint_status(snap: SpecSnapshot) -> dict:
+    """Structured Steps 1-9 status: suite steps, per-app steps, totals and next step."""
+    tier1 = check_tier1(snap)
+    apps = detect_apps(snap)
+    app_results = {app: check_app(snap, app) for app in apps}
+
+    suite = [step_entry(step, label, tier1[step], f"suite/{fname}", issues=snap.step_file_issues(f"suite/{fname}", step))
+             for step, (label, fname) in sorted(SUITE_FILES.items())]
+    app_steps = {}
+    for app in apps:
+        r = app_results[app]
+        steps = [step_entry(step, APP_FILES[step][0], r["tier2"][step], f"apps/{app}/{APP_FILES[step][1]}",
+                            issues=r["issues"].get(step))
+                 for step in sorted(r["tier2"])]
+        steps += [step_entry(step, APP_DIRS[step][0], info["exists"], f"apps/{app}/{APP_DIRS[step][1]}", info["count"],
+                             incomplete=info["incomplete"])
+                  for step, info in sorted(r["tier3"].items())]
+        app_steps[app] = steps
+
+    all_steps = suite + [e for steps in app_steps.values() for e in steps]
+    return {
+        "suite": suite,
+        "apps": app_steps,
+        "completed": sum(1 for e in all_steps if e["complete"]),
+        "total": len(all_steps),
+        "next_step": suggest_next(tier1, apps, app_results),
+    }
+
+
+def architect_status(snap: SpecSnapshot) -> dict:
+    """Structured Steps 10-17 status: prerequisites, tech stack, per-app steps and next step."""
+    prereq = check_prerequisites(snap)
+    arch_meta = snap.read_json(".architect-meta.json")
+    tech = arch_meta.get("tech_stack") if isinstance(arch_meta, dict) else None
+    apps = detect_apps(snap)
+    app_results = {app: check_architect_app(snap, app) for app in apps}
+
+    app_steps = {}
+    for app in apps:
+        r = app_results[app]
+        steps = []
+        for step, info in sorted(r["tier3"].items()):
+            if step in ARCHITECT_APP_DIRS:
+                label, dirname, _ = ARCHITECT_APP_DIRS[step]
+                steps.append(step_entry(step, label, info["exists"], f"apps/{app}/{dirname}", info["count"],
+                                        incomplete=info["incomplete"]))
+            else:
+                label, fname = APP_SPEC_FILES[step]
+                steps.append(step_entry(step, label, info["exists"], f"apps/{app}/{fname}", issues=r["issues"].get(step)))
+        steps += [step_entry(step, TIER4_LABELS[step], done, TIER4_FILES[step].format(app=app), issues=r["issues"].get(step))
+                  for step, done in sorted(r["tier4"].items())]
+        app_steps[app] = steps
+
+    all_steps = [e for steps in app_steps.values() for e in steps]
+    return {
+        "prerequisites": {
+            "meta_found": prereq["exists"],
+            "complete": prereq["complete"],
+            "steps_completed": prereq["meta"].get("steps_completed", []) if prereq["meta"] else [],
+            "stale_files": prereq["stale"],
+            "domain_files": check_domain_files(snap),
+        },
+        "tech_stack": tech or None,
+        "apps": app_steps,
+        "completed": sum(1 for e in all_steps if e["complete"]),
+        "total": len(all_steps),
+        "next_step": suggest_next_architect(apps, app_results),
+    }
+
+
+def get_progress(spec_dir: "str | os.PathLike", view: str = "all", use_cache: bool = True,
+                 check_content: bool = True, update_meta: bool = False, plan_workers: int | None = None) -> dict:
+    """Return structured pipeline status for a spec directory.
+
+    The in-process equivalent of `check-progress.py --json`. The result has
+    `found` (False when spec_dir does not exist), plus `blueprint`
+    (Steps 1-9) and/or `architect` (Steps 10-17) sections depending on
+    `view`. Per-app steps are lists of {step, label, complete, path[, count,
+    incomplete, issues]}. With check_content False a step is complete as
+    soon as its file exists. With update_meta (blueprint views only),
+    .blueprint-meta.json is refreshed first, as `check-progress.py
+    --write-meta` does, and `meta_updated` says whether it was rewritten.
+    With plan_workers, a `plan` section (see plan_pipeline) schedules the
+    remaining steps for that many concurrent workers.
+    """
+    if view not in VIEWS:
+        raise ValueError(f"Unknown view '{view}' (expected one of: {', '.join(VIEWS)})")
+    spec_dir = os.path.realpath(spec_dir)
+    result = {"version": PROGRESS_VERSION, "spec_dir": spec_dir, "view": view, "found": os.path.isdir(spec_dir)}
+    if not result["found"]:
+        return result
+
+    snap = scan_spec(spec_dir, use_cache=use_cache, check_content=check_content)
+    meta_updated = maybe_update_meta(snap, view, update_meta)
+    result = snapshot_progress(snap, view)
+    if update_meta:
+        result["meta_updated"] = meta_updated
+    if plan_workers is not None:
+        result["plan"] = plan_progress(snap, view, plan_workers)
+    finish_scan(snap, use_cache)
+    return result
+
+
+def snapshot_progress(snap: SpecSnapshot, view: str = "all") -> dict:
+    """Structured pipeline status (as returned by get_progress) for an existing snapshot."""
+    result = {"version": PROGRESS_VERSION, "spec_dir": snap.spec_dir, "view": view, "found": True}
+    if view in ("blueprint", "all"):
+        result["blueprint"] = blueprint_status(snap)
+    if view in ("architect", "all"):
+        result["architect"] = architect_status(snap)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Planner
+# ---------------------------------------------------------------------------
+
+# Steps each step reads, from references/pipeline.md and the architect's
+# references/pipeline.md. Steps 1-5 are suite-wide; Steps 6-17 run once per
+# app and depend on the suite steps and on earlier steps of the same app, so
+# different apps never block each other once Tier 1 is done.
+STEP_DEPENDENCIES = {
+    1: (),
+    2: (1,),
+    3: (1,),
+    4: (1, 2, 3),
+    5: (1,),
+    6: (1, 2, 3, 4, 5),
+    7: (6,),
+    8: (7,),
+    9: (6, 7, 8),
+    10: (6, 7, 9),
+    11: (6, 9, 10),
+    12: (9, 11),
+    13: (5, 7, 11, 12),
+    14: (8, 10, 13),
+    15: tuple(range(1, 15)),
+    16: tuple(range(1, 16)),
+    17: (1, 9, 13, 16),
+}
+
+DEFAULT_WORKERS = 4
+
+
+def plan_pipeline(progress: dict, workers: int = DEFAULT_WORKERS) -> dict:
+    """Plan the remaining steps as a dependency DAG across every app.
+
+    `progress` is a get_progress() result with a `blueprint` section (view
+    'blueprint' plans Steps 1-9, view 'all' Steps 1-17). Every step counts
+    as one unit of work. Returns the steps that can start now (`unblocked`),
+    the longest chain of remaining steps (`critical_path`), and a schedule
+    for `workers` concurrent workers: tasks are started round by round,
+    longest remaining chain first, and a worker keeps the app it worked on
+    last when it can. `rounds` is the schedule's length; no schedule can be
+    shorter than the critical path.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    tasks = {(None, e["step"]): dict(e, app=None) for e in progress["blueprint"]["suite"]}
+    for section in ("blueprint", "architect"):
+        for app, entries in progress.get(section, {}).get("apps", {}).items():
+            tasks.update(((app, e["step"]), dict(e, app=app)) for e in entries)
+
+    # Dependencies always have lower step numbers, so step order is topological
+    order = sorted(tasks, key=lambda key: (key[1], key[0] or ""))
+    deps = {}
+    for app, step in order:
+        keys = ((None if dep in SUITE_FILES else app, dep) for dep in STEP_DEPENDENCIES[step])
+        deps[(app, step)] = [key for key in keys if key in tasks]
+    remaining = [key for key in order if not tasks[key]["complete"]]
+    pending = set(remaining)
+
+    # Longest chain of remaining steps ending at (head) and starting at (tail) each step
+    head, via = {}, {}
+    for key in remaining:
+        before = [dep for dep in deps[key] if dep in pending]
+        via[key] = max(before, key=head.get, default=None)
+        head[key] = 1 + (head[via[key]] if via[key] else 0)
+    dependents = {key: [] for key in remaining}
+    for key in remaining:
+        for dep in deps[key]:
+            if dep in pending:
+                dependents[dep].append(key)
+    tail = {}
+    for key in reversed(remaining):
+        tail[key] = 1 + max((tail[d] for d in dependents[key]), default=0)
+
+    critical = []
+    key = max(remaining, key=head.get, default=None)
+    while key:
+        critical.append(key)
+        key = via[key]
+    critical.reverse()
+
+    # List scheduling in unit rounds, longest tail first
+    waiting = {key: sum(1 for dep in deps[key] if dep in pending) for key in remaining}
+    ready = [key for key in remaining if not waiting[key]]
+    unblocked = list(ready)
+    assignment = [[] for _ in range(workers)]
+    last_app = {}
+    rounds = 0
+    while ready:
+        rounds += 1
+        ready.sort(key=lambda k: (-tail[k], k[1], k[0] or ""))
+        batch, ready = ready[:workers], ready[workers:]
+        free = list(range(workers))
+        placed = {}
+        for key in batch:
+            worker = last_app.get(key[0])
+            if worker in free:
+                free.remove(worker)
+                placed[key] = worker
+        for key in batch:
+            if key not in placed:
+                placed[key] = free.pop(0)
+        for key in batch:
+            assignment[placed[key]].append(dict(plan_task(tasks[key]), round=rounds))
+            last_app[key[0]] = placed[key]
+            for dependent in dependents[key]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    ready.append(dependent)
+
+    return {
+        "workers": workers,
+        "total": len(tasks),
+        "remaining": len(remaining),
+        "unblocked": [plan_task(tasks[key]) for key in unblocked],
+        "critical_path": [plan_task(tasks[key]) for key in critical],
+        "rounds": rounds,
+        "assignment": [{"worker": i + 1, "tasks": worker_tasks} for i, worker_tasks in enumerate(assignment)],
+    }
+
+
+def plan_task(entry: dict) -> dict:
+    """The identifying fields of a step entry, as listed in a plan."""
+    return {"step": entry["step"], "label": entry["label"], "app": entry["app"], "path": entry["path"]}
+
+
+def plan_progress(snap: SpecSnapshot, view: str = "all", workers: int = DEFAULT_WORKERS) -> dict:
+    """Plan Steps 1-9 (blueprint view) or Steps 1-17 (other views) for a snapshot."""
+    return plan_pipeline(snapshot_progress(snap, "blueprint" if view == "blueprint" else "all"), workers)
+
+
+def describe_task(task: dict) -> str:
+    """'Step N — Label (app: name)', as in the suggested next step."""
+    app = f" (app: {task['app']})" if task["app"] else ""
+    return f"Step {task['step']} — {task['label']}{app}"
+
+
+def short_task(task: dict) -> str:
+    """Compact 'Step N (app)' form used in chains."""
+    return f"Step {task['step']} ({task['app']})" if task["app"] else f"Step {task['step']}"
+
+
+def print_plan(plan: dict):
+    """Print unblocked steps, the critical path and the worker assignment."""
+    print(f"=== Pipeline Plan ({plan['workers']} worker{'s' if plan['workers'] != 1 else ''}) ===\n")
+    print(f"Remaining: {plan['remaining']} of {plan['total']} steps")
+    if not plan["remaining"]:
+        print("Nothing left to schedule.")
+        return
+    if plan["total"] == len(SUITE_FILES):
+        print("No apps detected yet — per-app steps are planned once spec/apps/<app_name>/ exists.")
+
+    print(f"\nUnblocked now ({len(plan['unblocked'])}):")
+    for task in plan["unblocked"]:
+        print(f"  - {describe_task(task)}")
+
+    print(f"\nCritical path ({len(plan['critical_path'])} steps):")
+    print("  " + " → ".join(short_task(task) for task in plan["critical_path"]))
+
+    print(f"\nAssignment ({plan['rounds']} rounds; a round is one step per worker):")
+    for worker in plan["assignment"]:
+        chain = ", ".join(f"r{task['round']} {short_task(task)}" for task in worker["tasks"]) or "idle"
+        print(f"  Worker {worker['worker']}: {chain}")
+
+
+# ---------------------------------------------------------------------------
+# Blueprint metadata
+# ---------------------------------------------------------------------------
+
+def iso_now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def blueprint_step_files(snap: SpecSnapshot) -> dict[str, tuple[int, str | None]]:
+    """Blueprint step files present on disk: relative path -> (step, app or None)."""
+    files = {}
+    for step, (_, fname) in SUITE_FILES.items():
+        if snap.is_file(f"suite/{fname}"):
+            files[f"suite/{fname}"] = (step, None)
+    for app in detect_apps(snap):
+        for step, (_, fname) in APP_FILES.items():
+            if snap.is_file(f"apps/{app}/{fname}"):
+                files[f"apps/{app}/{fname}"] = (step, app)
+        for step, (_, dirname, suffix) in APP_DIRS.items():
+            entry = snap.dirs.get(f"apps/{app}/{dirname}")
+            for name in sorted(entry[0]) if entry else ():
+                if name.endswith(suffix):
+                    files[f"apps/{app}/{dirname}/{name}"] = (step, app)
+    return files
+
+
+def update_blueprint_meta(snap: SpecSnapshot) -> bool:
+    """Bring .blueprint-meta.json in line with the Steps 1-9 files on disk.
+
+    Records per-step completion (per app for Steps 6-9), every step file's
+    content hash, size and mtime, and when each step last changed. Keys the
+    file already has (suite_name, ...) are kept. The content checks'
+    verdict goes to `steps_detected`; `steps_completed`, which the blueprint
+    skill writes as it finishes steps, only gains detected steps and never
+    loses one. The file is rewritten — atomically — only when something
+    other than `updated_at` changes. Returns True when it was written.
+
+    When the cached scan relisted no directory, re-hashed no step file and
+    the meta file is the one the previous run left (same size and mtime),
+    nothing it records can have changed and it is not rebuilt.
+    """
+    step_files = blueprint_step_files(snap)
+    for rel, (step, _) in step_files.items():
+        snap.step_file_issues(rel, step)  # stats each file; re-hashes only changed ones
+    stamp = snap.file_stamp(BLUEPRINT_META) if snap.is_file(BLUEPRINT_META) else None
+    if snap.cache_loaded and not snap.rescanned and not snap.content_dirty and stamp and stamp == snap.meta_stamp:
+        snap.meta_current = True
+        return False
+
+    previous = snap.read_json(BLUEPRINT_META)
+    previous = previous if isinstance(previous, dict) else {}
+    prev_steps = previous.get("steps") if isinstance(previous.get("steps"), dict) else {}
+    prev_files = previous.get("files") if isinstance(previous.get("files"), dict) else {}
+    now = iso_now()
+    status = blueprint_status(snap)
+
+    files = {}
+    for rel, (step, app) in step_files.items():
+        digest = snap.file_hash(rel)
+        size, mtime_ns, _ = snap.file_hashes.get(rel, (0, 0, None))
+        files[rel] = {"step": step, "app": app, "hash": digest, "size": size, "mtime_ns": mtime_ns,
+                      "complete": snap.step_complete(rel, step)}
+
+    steps = {}
+    apps = sorted(status["apps"])
+    for step in range(1, 10):
+        if step in SUITE_FILES:
+            entry = {"complete": status["suite"][step - 1]["complete"]}
+        else:
+            per_app = {app: next(e["complete"] for e in status["apps"][app] if e["step"] == step) for app in apps}
+            entry = {"complete": bool(apps) and all(per_app.values()), "apps": per_app}
+        entry["files"] = sorted(rel for rel, f in files.items() if f["step"] == step)
+        # A step "changed" when its completion or any of its files' hashes did
+        signature = [entry["complete"], entry.get("apps"), [(rel, files[rel]["hash"]) for rel in entry["files"]]]
+        prev = prev_steps.get(str(step)) if isinstance(prev_steps.get(str(step)), dict) else {}
+        prev_signature = [prev.get("complete"), prev.get("apps"),
+                          [(rel, (prev_files.get(rel) or {}).get("hash")) for rel in prev.get("files", [])]]
+        entry["changed_at"] = prev.get("changed_at") if signature == prev_signature and prev.get("changed_at") else now
+        steps[str(step)] = entry
+
+    steps_detected = [step for step in range(1, 10) if steps[str(step)]["complete"]]
+    recorded = previous.get("steps_completed")
+    recorded = [s for s in recorded if isinstance(s, int)] if isinstance(recorded, list) else []
+    steps_completed = sorted(set(recorded) | set(steps_detected))
+    meta = dict(previous)
+    meta.update({
+        "version": BLUEPRINT_META_VERSION,
+        "skill": "webapp-blueprint",
+        "completed_at": (previous.get("completed_at") or now) if set(range(1, 10)) <= set(steps_completed) else None,
+        "updated_at": previous.get("updated_at"),
+        "apps": apps,
+        "steps_completed": steps_completed,
+        "steps_detected": steps_detected,
+        "steps": steps,
+        "files": files,
+    })
+    if meta == previous:
+        snap.meta_stamp = stamp
+        snap.meta_current = True
+        return False
+    meta["updated_at"] = now
+
+    import json
+
+    path = snap.path(BLUEPRINT_META)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(meta, indent=2, ensure_ascii=False) + "\n")
+        os.replace(tmp, path)
+    except OSError:
+        return False
+    snap.dirs[""][0].add(BLUEPRINT_META)
+    snap._json[BLUEPRINT_META] = meta
+    snap.meta_stamp = snap.file_stamp(BLUEPRINT_META)  # None until it ages past the racy window
+    snap.meta_current = True
+    return True
+
+
+def maybe_update_meta(snap: SpecSnapshot, view: str, enabled: bool = True) -> bool:
+    """Refresh .blueprint-meta.json from a blueprint view scan with content checks on."""
+    if enabled and snap.check_content and view in ("blueprint", "all"):
+        return update_blueprint_meta(snap)
+    return False
+
+
+def blueprint_meta_staleness(snap: SpecSnapshot, meta: dict) -> list[str]:
+    """Step files that differ from what .blueprint-meta.json recorded ([] = current).
+
+    A recorded file whose size and mtime still match is trusted without
+    reading it; otherwise its content hash decides. Meta files written
+    before per-file hashes were recorded cannot be checked and count as
+    current, as does one this scan has just confirmed or rewritten.
+    """
+    recorded = meta.get("files")
+    if not isinstance(recorded, dict) or snap.meta_current:
+        return []
+    on_disk = blueprint_step_files(snap)
+    stale = []
+    for rel in sorted(set(recorded) | set(on_disk)):
+        rec = recorded.get(rel)
+        if rel not in on_disk:
+            stale.append(f"{rel} (removed)")
+            continue
+        if not isinstance(rec, dict):
+            stale.append(f"{rel} (new)")
+            continue
+        try:
+            st = os.stat(snap.path(rel))
+        except OSError:
+            stale.append(f"{rel} (unreadable)")
+            continue
+        if (st.st_size, st.st_mtime_ns) == (rec.get("size"), rec.get("mtime_ns")):
+            continue
+        if snap.file_hash(rel) != rec.get("hash"):
+            stale.append(f"{rel} (changed)")
+    return stale
+
+
+# ---------------------------------------------------------------------------
+# Multiple spec roots
+# ---------------------------------------------------------------------------
+
+# Scans are dominated by stat/scandir latency (GIL released), so more
+# threads than cores pays off, especially on network mounts
+DEFAULT_JOBS = 16
+
+
+def expand_spec_roots(patterns: list[str]) -> tuple[list[str], list[str]]:
+    """Expand spec root paths and glob patterns (`**` allowed).
+
+    Returns (roots, unmatched): roots are resolved, de-duplicated and in
+    argument order (glob matches sorted); unmatched lists patterns that
+    matched no directory. Plain paths are kept even if missing so the
+    report can say so.
+    """
+    roots, unmatched, seen = [], [], set()
+    for pattern in patterns:
+        pattern = os.path.expanduser(pattern)
+        if glob_magic(pattern):
+            import glob
+
+            matches = [m for m in sorted(glob.glob(pattern, recursive=True)) if os.path.isdir(m)]
+            if not matches:
+                unmatched.append(pattern)
+        else:
+            matches = [pattern]
+        for match in matches:
+            root = os.path.realpath(match)
+            if root not in seen:
+                seen.add(root)
+                roots.append(root)
+    return roots, unmatched
+
+
+def glob_magic(pattern: str) -> bool:
+    return any(c in pattern for c in "*?[")
+
+
+def get_progress_many(spec_dirs: list[str], view: str = "all", jobs: int = DEFAULT_JOBS, **kwargs) -> list[dict]:
+    """get_progress() for several spec roots, scanned concurrently on a thread pool.
+
+    Results come back in spec_dirs order; keyword arguments are passed to
+    get_progress for every root.
+    """
+    if len(spec_dirs) <= 1 or jobs <= 1:
+        return [get_progress(d, view=view, **kwargs) for d in spec_dirs]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(spec_dirs))) as pool:
+        return list(pool.map(lambda d: get_progress(d, view=view, **kwargs), spec_dirs))
+
+
+def aggregate_progress(results: list[dict]) -> dict:
+    """Totals across per-root get_progress() results."""
+    found = [r for r in results if r["found"]]
+    aggregate = {
+        "roots": len(results),
+        "found": len(found),
+        "missing": [r["spec_dir"] for r in results if not r["found"]],
+        "apps": 0,
+    }
+    for key in ("blueprint", "architect"):
+        sections = [r[key] for r in found if key in r]
+        if sections:
+            aggregate[key] = {
+                "completed": sum(s["completed"] for s in sections),
+                "total": sum(s["total"] for s in sections),
+                "complete_roots": sum(1 for s in sections if s["total"] and s["completed"] == s["total"]),
+            }
+    aggregate["apps"] = sum(len(next(r[k] for k in ("blueprint", "architect") if k in r)["apps"]) for r in found)
+    return aggregate
+
+
+def percent(completed: int, total: int) -> str:
+    return f"{completed * 100 // total}%" if total else "-"
+
+
+def print_multi_report(results: list[dict], aggregate: dict, view: str, base: str | None = None):
+    """Print one summary line per spec root followed by suite-wide totals."""
+    sections = [key for key in ("blueprint", "architect") if view in (key, "all")]
+    headers = {"blueprint": "Steps 1-9", "architect": "Steps 10-17"}
+    base = base or os.getcwd()
+
+    def label(spec_dir: str) -> str:
+        rel = os.path.relpath(spec_dir, base)
+        return spec_dir if rel.startswith("..") else rel
+
+    width = max([len("Spec Root")] + [len(label(r["spec_dir"])) for r in results])
+    print(f"=== Webapp Pipeline Progress — {aggregate['roots']} spec roots ===\n")
+    print(f"{'Spec Root':<{width}}  Apps  " + "".join(f"{headers[k]:<16}" for k in sections) + "Next")
+    for r in results:
+        if not r["found"]:
+            print(f"{label(r['spec_dir']):<{width}}     -  " + "".join(f"{'-':<16}" for _ in sections) + "spec directory not found")
+            continue
+        apps = len(r[sections[0]]["apps"])
+        cells = "".join(f"{s['completed']:>3}/{s['total']:<4} {percent(s['completed'], s['total']):>4}   "
+                        for s in (r[k] for k in sections))
+        # The earliest pipeline with work left names the next step
+        pending = [r[k] for k in sections if r[k]["completed"] < r[k]["total"]] or [r[sections[-1]]]
+        print(f"{label(r['spec_dir']):<{width}}  {apps:>4}  {cells}{pending[0]['next_step']}")
+
+    print(f"\nTotal: {aggregate['found']} of {aggregate['roots']} spec roots found, {aggregate['apps']} apps")
+    for key in sections:
+        if key in aggregate:
+            a = aggregate[key]
+            print(f"  {headers[key]}: {a['completed']}/{a['total']} steps complete ({percent(a['completed'], a['total'])}), "
+                  f"{a['complete_roots']} root(s) fully complete")
+    if aggregate["missing"]:
+        print(f"  Missing spec roots: {len(aggregate['missing'])}")
+
+
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+CLEAR_SCREEN = "\x1b[H\x1b[J"
+
+
+def render_dashboard(progress: dict) -> list[str]:
+    """Render per-app step completion as dashboard lines (one row per app)."""
+    sections = [progress[key] for key in ("blueprint", "architect") if key in progress]
+    apps = sorted({app for section in sections for app in section["apps"]})
+    lines = [f"=== Webapp Pipeline Dashboard ({progress['spec_dir']}) ===", ""]
+
+    if "blueprint" in progress:
+        suite = progress["blueprint"]["suite"]
+        marks = " ".join("✓" if e["complete"] else "·" for e in suite)
+        done = sum(1 for e in suite if e["complete"])
+        lines += [f"Suite (Steps 1-5): {marks}  {done}/{len(suite)}", ""]
+    if "architect" in progress:
+        prereq = progress["architect"]["prerequisites"]
+        state = "complete" if prereq["complete"] else ("incomplete" if prereq["meta_found"] else "missing")
+        lines += [f"Prerequisites (.blueprint-meta.json): {state}", ""]
+
+    if not apps:
+        lines.append("No apps detected under spec/apps/")
+    else:
+        steps = [e["step"] for section in sections for e in next(iter(section["apps"].values()))]
+        width = max(len("App"), *(len(app) for app in apps))
+        lines.append(f"{'App':<{width}}  " + " ".join(f"{step:>2}" for step in steps) + "   Done")
+        for app in apps:
+            entries = [e for section in sections for e in section["apps"].get(app, [])]
+            done = sum(1 for e in entries if e["complete"])
+            marks = " ".join(" ✓" if e["complete"] else " ·" for e in entries)
+            lines.append(f"{app:<{width}}  {marks}   {done}/{len(entries)} ({done * 100 // len(entries)}%)")
+
+    lines.append("")
+    for key in ("blueprint", "architect"):
+        if key in progress:
+            lines.append(f"Next ({key}): {progress[key]['next_step']}")
+    return lines
+
+
+def watch(spec_dir: "str | os.PathLike", view: str = "all", interval: float = 1.0,
+          use_cache: bool = True, as_json: bool = False, check_content: bool = True, update_meta: bool = False):
+    """Poll the spec tree and redraw the dashboard whenever step status changes.
+
+    Keeps one snapshot and refreshes it with SpecSnapshot.scan(previous=...),
+    so each poll costs one stat per unchanged directory and relists only the
+    directories that changed. With as_json, prints one JSON object per line
+    on every change instead of drawing. Runs until interrupted.
+    """
+    import json
+    import sys
+
+    spec_dir = os.path.realpath(spec_dir)
+    start = time.perf_counter()
+    snap = scan_spec(spec_dir, use_cache=use_cache, check_content=check_content)
+    scan_ms = (time.perf_counter() - start) * 1000
+    # On a terminal the dashboard is redrawn in place every poll; otherwise
+    # (piped output, --json) a frame is printed only when the status changes
+    redraw = sys.stdout.isatty() and not as_json
+    last_body = None
+    try:
+        while True:
+            maybe_update_meta(snap, view, update_meta)
+            progress = snapshot_progress(snap, view)
+            if as_json:
+                body = json.dumps(progress, ensure_ascii=False)
+            else:
+                body = "\n".join(render_dashboard(progress))
+            if redraw or body != last_body:
+                if as_json:
+                    print(body, flush=True)
+                else:
+                    footer = (f"Refreshed {time.strftime('%H:%M:%S')} — relisted {snap.rescanned} of "
+                              f"{len(snap.dirs)} directories in {scan_ms:.1f} ms. Ctrl+C to exit.")
+                    print((CLEAR_SCREEN if redraw else "") + body + "\n\n" + footer, flush=True)
+            last_body = body
+
+            time.sleep(interval)
+            start = time.perf_counter()
+            snap = SpecSnapshot.scan(spec_dir, previous=snap)
+            if not snap.consistent:
+                snap = SpecSnapshot.scan(spec_dir)
+            scan_ms = (time.perf_counter() - start) * 1000
+    except KeyboardInterrupt:
+        pass
+    finally:
+        finish_scan(snap, use_cache)
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+def main(default_view: str = "blueprint"):
+    """Shared entry point for both skills' check-progress.py scripts."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check webapp pipeline progress (Steps 1-17)")
+    parser.add_argument("--project-dir", default=None, help="Project root directory (sets --spec-dir default to <project-dir>/spec)")
+    parser.add_argument("--spec-dir", nargs="+", default=None,
+                        help="Path(s) or glob(s) of spec directories, e.g. 'products/*/spec' (default: ./spec or <project-dir>/spec)")
+    parser.add_argument("--view", choices=VIEWS, default=default_view,
+                        help=f"Which steps to report: blueprint (1-9), architect (10-17) or all (default: {default_view})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Ignore and do not write spec/{CACHE_FILENAME}; list every directory")
+    parser.add_argument("--presence-only", action="store_true",
+                        help="Count a step as complete when its file exists, skipping the size, heading and stub checks")
+    parser.add_argument("--write-meta", action="store_true",
+                        help=f"Create or refresh spec/{BLUEPRINT_META} when its content changed (blueprint and all views)")
+    parser.add_argument("--json", action="store_true", help="Print structured per-app, per-step status as JSON")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep polling and redraw a per-app dashboard on changes (with --json: one JSON line per change)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Polling interval for --watch in seconds (default: 1.0)")
+    parser.add_argument("--plan", action="store_true",
+                        help="Also plan the remaining steps: unblocked steps, critical path and a worker assignment")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Concurrent workers or agents to plan for; implies --plan (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Spec roots scanned concurrently when several are given (default: {DEFAULT_JOBS})")
+    args = parser.parse_args()
+    plan_workers = args.workers if args.workers is not None else (DEFAULT_WORKERS if args.plan else None)
+    if plan_workers is not None and plan_workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.spec_dir:
+        spec_dirs, unmatched = expand_spec_roots(args.spec_dir)
+        for pattern in unmatched:
+            print(f"No spec directories match: {pattern}")
+        if not spec_dirs:
+            return
+    elif args.project_dir is not None:
+        spec_dirs = [os.path.join(os.path.realpath(args.project_dir), "spec")]
+    else:
+        spec_dirs = [os.path.realpath("./spec")]
+
+    if len(spec_dirs) > 1 or (args.spec_dir and any(map(glob_magic, args.spec_dir))):
+        if args.watch or plan_workers is not None:
+            parser.error("--watch and --plan take a single spec root")
+        results = get_progress_many(spec_dirs, view=args.view, jobs=args.jobs, use_cache=not args.no_cache,
+                                    check_content=not args.presence_only, update_meta=args.write_meta)
+        aggregate = aggregate_progress(results)
+        if args.json:
+            import json
+
+            print(json.dumps({"version": PROGRESS_VERSION, "aggregate": aggregate, "roots": results},
+                             indent=2, ensure_ascii=False))
+        else:
+            print_multi_report(results, aggregate, args.view, base=args.project_dir)
+        return
+    spec_dir = spec_dirs[0]
+
+    if args.watch:
+        if plan_workers is not None:
+            parser.error("--plan cannot be combined with --watch")
+        if not os.path.isdir(spec_dir):
+            print(f"Spec directory not found: {spec_dir}")
+            return
+        watch(spec_dir, view=args.view, interval=args.interval, use_cache=not args.no_cache, as_json=args.json,
+              check_content=not args.presence_only, update_meta=args.write_meta)
+        return
+
+    if args.json:
+        import json
+
+        progress = get_progress(spec_dir, view=args.view, use_cache=not args.no_cache,
+                                check_content=not args.presence_only, update_meta=args.write_meta,
+                                plan_workers=plan_workers)
+        print(json.dumps(progress, indent=2, ensure_ascii=False))
+        return
+
+    if not os.path.isdir(spec_dir):
+        print(f"Spec directory not found: {spec_dir}")
+        if args.view == "architect":
+            print("No pipeline progress to report. Run webapp-blueprint first to complete Steps 1-9.")
+        else:
+            print("No pipeline progress to report. Start with Step 1 — Domain Discovery.")
+        return
+
+    snap = scan_spec(spec_dir, use_cache=not args.no_cache, check_content=not args.presence_only)
+    meta_updated = maybe_update_meta(snap, args.view, args.write_meta)
+    if args.view in ("blueprint", "all"):
+        print_blueprint_report(snap)
+    if args.view == "all":
+        print()
+    if args.view in ("architect", "all"):
+        print_architect_report(snap)
+    if plan_workers is not None:
+        print()
+        print_plan(plan_progress(snap, args.view, plan_workers))
+    if meta_updated:
+        print(f"\nUpdated {BLUEPRINT_META}: a step's completion or a step file's content changed.")
+    elif not args.write_meta and args.view == "blueprint" and check_prerequisites(snap)["stale"]:
+        print(f"\n{BLUEPRINT_META} is stale; run with --write-meta to refresh it.")
+    finish_scan(snap, use_cache=not args.no_cache)
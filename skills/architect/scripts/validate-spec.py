@@ -6,14 +6,50 @@ and completeness. Writes validation reports to spec/validation/reports/{app}/.
 """
 
 import argparse
+import json
 import os
 import re
+from functools import cached_property
 from pathlib import Path
 
+from permission_table import compile_table
+
 
 # ---------------------------------------------------------------------------
-# Extraction helpers — heuristic regex patterns for markdown specs
+# Extraction helpers — heuristic, line-based patterns for markdown specs
 # ---------------------------------------------------------------------------
+#
+# Every helper scans the text once, line by line or token by token. Regexes
+# are only ever applied with .match() at a fixed position or as a single
+# character class run, never with a MULTILINE `^\s*` (which lets `\s` cross
+# newlines and rescans every blank line) or nested quantifiers, so extraction
+# time stays linear in the input size. See scripts/bench-extractors.py.
+
+_NAME_RUN_RE = re.compile(r"[\w \t-]*")
+_DOTTED_RUN_RE = re.compile(r"[\w.-]*")
+_WORD_RE = re.compile(r"\w+")
+_WORD_CHAR_RE = re.compile(r"\w")
+_LIST_ITEM_RE = re.compile(r"[-*]\s+\[?([^\]\n]+)\]?")
+_SECTION_MARKER_RE = re.compile(r"connected\s+pages|navigation|links\s+to", re.IGNORECASE)
+_LABEL_END_RE = re.compile(r"[: \t]*(?=\n|\Z)")
+_TOKEN_REF_RE = re.compile(r"`--([\w-]+)")
+
+# Name suffixes that mark a <Tag> as a UI component reference
+COMPONENT_SUFFIXES = (
+    "Card", "Button", "Table", "List", "Form", "Modal", "Panel", "Widget", "Nav", "Header",
+    "Footer", "Sidebar", "Menu", "Dialog", "Drawer", "Badge", "Alert", "Banner", "Chart",
+    "Grid", "Layout", "Container", "Section", "View", "Page", "Tab", "Tabs", "Input",
+    "Select", "Dropdown", "Picker", "Search", "Filter", "Sort", "Pagination", "Avatar",
+    "Icon", "Image", "Logo", "Link", "Tooltip", "Popover", "Snackbar", "Toast", "Spinner",
+    "Loader", "Skeleton", "Placeholder", "Divider", "Separator", "Breadcrumb", "Stepper",
+    "Progress", "Rating", "Switch", "Toggle", "Checkbox", "Radio", "Slider", "Upload",
+    "Calendar", "Timeline", "Accordion", "Carousel", "Collapse", "Tree",
+)
+_COMPONENT_SUFFIX_RE = re.compile("|".join(COMPONENT_SUFFIXES))
+
+# Suffixes that mark a `CodeSpan` as a component reference
+CODE_REF_SUFFIXES = ("Component", "Widget", "Card", "Table", "List", "Form", "Modal", "Panel")
+
 
 def read_file(path: Path) -> str:
     """Read a file and return its contents, or empty string if missing."""
@@ -22,33 +58,100 @@ def read_file(path: Path) -> str:
     return ""
 
 
-def extract_heading_items(text: str, pattern: str) -> list[str]:
-    """Extract items from markdown headings matching a pattern.
+def is_word_char(ch: str) -> bool:
+    """Check if a single character is a regex word character (\\w)."""
+    return bool(ch) and _WORD_CHAR_RE.match(ch) is not None
+
+
+def leading_name(text: str) -> str | None:
+    """Return the multi-word name at the start of text, or None.
 
-    Looks for lines like '## Entity: OrderItem' or '## Role: Admin' and
-    returns the captured group.
+    A name starts and ends with a word character and may contain spaces,
+    tabs and hyphens in between ('Order Item', 'line-item'), at least two
+    characters long.
     """
-    return re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
+    run = _NAME_RUN_RE.match(text).group(0).rstrip(" \t-")
+    if len(run) >= 2 and is_word_char(run[0]):
+        return run
+    return None
+
+
+def iter_headings(text: str):
+    """Yield the title text of each level 1-4 ATX heading ('## Title')."""
+    for line in text.splitlines():
+        if not line.startswith("#"):
+            continue
+        level = len(line) - len(line.lstrip("#"))
+        rest = line[level:]
+        if level <= 4 and rest[:1].isspace():
+            yield rest.strip()
+
+
+def extract_heading_items(text: str, prefix: str, required: bool = False, word_only: bool = False) -> list[str]:
+    """Extract item names from markdown headings with an optional label prefix.
+
+    Looks for lines like '## Entity: OrderItem' or '## Role: Admin'. With
+    `required=False`, plain headings ('### OrderItem') also count. With
+    `word_only=True` the name is a single \\w+ word ('## Component: Card').
+    """
+    items = []
+    for title in iter_headings(text):
+        candidates = []
+        if title.lower().startswith(prefix.lower()):
+            candidates.append(title[len(prefix):].lstrip())
+        if not required:
+            candidates.append(title)
+        for body in candidates:
+            if word_only:
+                m = _WORD_RE.match(body)
+                name = m.group(0) if m else None
+            else:
+                name = leading_name(body)
+            if name:
+                items.append(name)
+                break
+    return items
+
+
+def extract_bold_list_items(text: str) -> list[str]:
+    """Extract names from bold list items: '- **EntityName**'."""
+    items = []
+    for line in text.splitlines():
+        s = line.lstrip()
+        if s[:1] not in ("-", "*") or not s[1:2].isspace():
+            continue
+        body = s[1:].lstrip()
+        if not body.startswith("**"):
+            continue
+        run = _NAME_RUN_RE.match(body, 2).group(0)
+        if (len(run) >= 2 and is_word_char(run[0]) and is_word_char(run[-1])
+                and body.startswith("**", 2 + len(run))):
+            items.append(run)
+    return items
 
 
 def extract_entities(text: str) -> list[str]:
     """Extract entity names from domain model markdown."""
-    # Match headings: ## Entity: Name, ### Name, or table rows | Name |
-    entities = extract_heading_items(text, r"^#{1,4}\s+(?:Entity:\s*)?(\w[\w\s-]*\w)")
+    # Match headings: ## Entity: Name, ### Name
+    entities = extract_heading_items(text, "Entity:")
     # Also look for bold items in lists: - **EntityName**
-    entities += re.findall(r"^\s*[-*]\s+\*\*(\w[\w\s-]*\w)\*\*", text, re.MULTILINE)
+    entities += extract_bold_list_items(text)
     return list(dict.fromkeys(e.strip() for e in entities))  # dedupe, preserve order
 
 
 def extract_roles(text: str) -> list[str]:
     """Extract role names from role/permission matrix markdown."""
-    roles = extract_heading_items(text, r"^#{1,4}\s+(?:Role:\s*)?(\w[\w\s-]*\w)")
-    roles += re.findall(r"^\s*[-*]\s+\*\*(\w[\w\s-]*\w)\*\*", text, re.MULTILINE)
+    roles = extract_heading_items(text, "Role:")
+    roles += extract_bold_list_items(text)
     # Table header roles: | | Admin | Editor | Viewer |
-    header_match = re.search(r"^\|[^|]*\|(.+)\|", text, re.MULTILINE)
-    if header_match:
-        cells = [c.strip() for c in header_match.group(1).split("|") if c.strip()]
-        roles += cells
+    for line in text.splitlines():
+        if not line.startswith("|"):
+            continue
+        second = line.find("|", 1)
+        last = line.rfind("|")
+        if second != -1 and last > second + 1:
+            roles += [c.strip() for c in line[second + 1:last].split("|") if c.strip()]
+            break
     return list(dict.fromkeys(r.strip() for r in roles))
 
 
@@ -64,9 +167,21 @@ def extract_component_refs(text: str) -> list[str]:
     Looks for patterns like <ComponentName>, `ComponentName`, or
     ## Component: Name headings.
     """
-    refs = re.findall(r"<(\w+(?:Card|Button|Table|List|Form|Modal|Panel|Widget|Nav|Header|Footer|Sidebar|Menu|Dialog|Drawer|Badge|Alert|Banner|Chart|Grid|Layout|Container|Section|View|Page|Tab|Tabs|Input|Select|Dropdown|Picker|Search|Filter|Sort|Pagination|Avatar|Icon|Image|Logo|Link|Tooltip|Popover|Snackbar|Toast|Spinner|Loader|Skeleton|Placeholder|Divider|Separator|Breadcrumb|Stepper|Progress|Rating|Switch|Toggle|Checkbox|Radio|Slider|Upload|Calendar|Timeline|Accordion|Carousel|Collapse|Tree)\w*)", text)
-    refs += extract_heading_items(text, r"^#{1,4}\s+(?:Component:\s*)(\w+)")
-    refs += re.findall(r"`(\w+(?:Component|Widget|Card|Table|List|Form|Modal|Panel))`", text)
+    tag_refs = []
+    code_refs = []
+    closed = -1  # index of the last backtick consumed as a closing delimiter
+    for m in _WORD_RE.finditer(text):
+        start, end = m.span()
+        word = m.group(0)
+        before = text[start - 1] if start else ""
+        if before == "<" and _COMPONENT_SUFFIX_RE.search(word, 1):
+            tag_refs.append(word)
+        elif before == "`" and start - 1 != closed and text[end:end + 1] == "`" and any(
+            word.endswith(sfx) and len(word) > len(sfx) for sfx in CODE_REF_SUFFIXES
+        ):
+            code_refs.append(word)
+            closed = end
+    refs = tag_refs + extract_heading_items(text, "Component:", required=True, word_only=True) + code_refs
     return list(dict.fromkeys(r.strip() for r in refs))
 
 
@@ -78,20 +193,163 @@ def extract_api_endpoints(text: str) -> list[str]:
 
 
 def extract_connected_pages(text: str) -> list[str]:
-    """Extract 'Connected Pages' references from page specs."""
-    section = re.search(r"(?:Connected\s+Pages|Navigation|Links\s+To)[:\s]*\n((?:\s*[-*].*\n)*)", text, re.IGNORECASE)
-    if not section:
-        return []
-    return re.findall(r"[-*]\s+\[?([^\]\n]+)\]?", section.group(1))
+    """Extract 'Connected Pages' references from page specs.
+
+    Finds the first line ending in a 'Connected Pages', 'Navigation' or
+    'Links To' label and collects the list items that follow it (blank
+    lines between items are allowed).
+    """
+    for m in _SECTION_MARKER_RE.finditer(text):
+        # Only ':' and blanks may follow the label; the anchored match stops
+        # at the first other character instead of copying the rest of the line
+        label_end = _LABEL_END_RE.match(text, m.end())
+        if label_end is None:
+            continue
+        eol = label_end.end()
+        targets = []
+        for item in text[eol + 1:].splitlines():
+            s = item.lstrip()
+            if not s:
+                continue
+            if s[0] not in "-*":
+                break
+            targets += _LIST_ITEM_RE.findall(s)
+        return targets
+    return []
 
 
 def extract_design_tokens(text: str) -> list[str]:
     """Extract design token names from design system spec."""
-    tokens = re.findall(r"`--([\w-]+)`", text)
-    tokens += re.findall(r"^\s*[-*]\s+`?([\w-]+(?:\.[\w-]+)+)`?", text, re.MULTILINE)
+    # `--token-name` custom properties (the token run must close the code span)
+    tokens = []
+    pos = 0
+    while (m := _TOKEN_REF_RE.search(text, pos)) is not None:
+        pos = m.end()
+        if text[pos:pos + 1] == "`":
+            tokens.append(m.group(1))
+            pos += 1
+    # Dotted token paths in list items: - `color.primary.500`
+    for line in text.splitlines():
+        s = line.lstrip()
+        if s[:1] not in ("-", "*") or not s[1:2].isspace():
+            continue
+        body = s[1:].lstrip()
+        if body.startswith("`"):
+            body = body[1:]
+        run = _DOTTED_RUN_RE.match(body).group(0)
+        run = run.split("..", 1)[0].rstrip(".")
+        if run and not run.startswith(".") and "." in run:
+            tokens.append(run)
     return list(dict.fromkeys(tokens))
 
 
+def extract_scenarios(text: str) -> list[tuple[str, list[str]]]:
+    """Split a .feature.md file into (scenario title, step lines) pairs.
+
+    Background steps are prepended to every scenario since they run before
+    each one. Examples tables are kept so outline rows that contain paths
+    still count toward the scenario.
+    """
+    background: list[str] = []
+    scenarios: list[tuple[str, list[str]]] = []
+    current: list[str] | None = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            title = stripped.lstrip("#").strip()
+            if title.startswith(("Scenario:", "Scenario Outline:")):
+                current = list(background)
+                scenarios.append((title.split(":", 1)[1].strip(), current))
+            elif title.lower().startswith("background"):
+                current = background
+            else:
+                current = None
+            continue
+        if current is not None and stripped and not stripped.startswith(">"):
+            current.append(stripped)
+    return scenarios
+
+
+def route_key(path: str) -> tuple[str, ...]:
+    """Split a route or URL path into segments, with params as '*' wildcards."""
+    path = path.split("?", 1)[0].split("#", 1)[0].rstrip(".,;)`'\"")
+    segments = []
+    for seg in path.strip("/").split("/"):
+        if not seg:
+            continue
+        if seg.startswith(":") or (seg.startswith(("{", "[")) and seg.endswith(("}", "]"))):
+            segments.append("*")
+        else:
+            segments.append(seg.lower())
+    return tuple(segments)
+
+
+def build_route_trie(patterns: list[str]) -> dict:
+    """Build a segment trie over route patterns; param segments become '*' nodes."""
+    trie: dict = {}
+    for pattern in patterns:
+        node = trie
+        for seg in route_key(pattern):
+            node = node.setdefault(seg, {})
+        node.setdefault("$", []).append(pattern)
+    return trie
+
+
+def match_route(trie: dict, path: str) -> list[str]:
+    """Return every pattern in the trie that a concrete or pattern path matches."""
+    matches: list[str] = []
+    stack = [(trie, 0)]
+    segments = route_key(path)
+    while stack:
+        node, i = stack.pop()
+        if i == len(segments):
+            matches.extend(node.get("$", ()))
+            continue
+        seg = segments[i]
+        if seg in node:
+            stack.append((node[seg], i + 1))
+        if seg != "*" and "*" in node:
+            stack.append((node["*"], i + 1))
+    return matches
+
+
+PATH_MENTION_RE = re.compile(r"(?:^|[\s\"'(`])(/[\w/:.{}\[\]-]*)")
+
+
+def build_scenario_index(feature_files: list[Path], routes: list[str], endpoints: list[str]) -> dict:
+    """Index which BDD scenarios mention each IA route and API endpoint.
+
+    Makes a single pass over all feature files; every path-like token in a
+    scenario's steps is resolved against a segment trie of the known routes
+    and endpoints, so `/orders/42` in a step counts toward `/orders/:id`.
+
+    Returns {"routes": {route: [ref, ...]}, "endpoints": {endpoint: [ref, ...]}}
+    where each ref is {"feature": file name, "scenario": title}.
+    """
+    route_trie = build_route_trie(routes)
+    endpoint_trie = build_route_trie(endpoints)
+    index: dict[str, dict[str, list[dict[str, str]]]] = {
+        "routes": {r: [] for r in routes},
+        "endpoints": {e: [] for e in endpoints},
+    }
+
+    for ff in feature_files:
+        for title, steps in extract_scenarios(read_file(ff)):
+            ref = {"feature": ff.name, "scenario": title}
+            hit_routes: set[str] = set()
+            hit_endpoints: set[str] = set()
+            for step in steps:
+                for path in PATH_MENTION_RE.findall(step):
+                    hit_routes.update(match_route(route_trie, path))
+                    hit_endpoints.update(match_route(endpoint_trie, path))
+            for r in hit_routes:
+                index["routes"][r].append(ref)
+            for e in hit_endpoints:
+                index["endpoints"][e].append(ref)
+
+    return index
+
+
 def list_files(directory: Path, suffix: str = ".md") -> list[Path]:
     """List files in a directory matching a suffix."""
     if not directory.is_dir():
@@ -107,198 +365,440 @@ def stem_name(path: Path) -> str:
     return name
 
 
+# ---------------------------------------------------------------------------
+# Archetype check profiles
+# ---------------------------------------------------------------------------
+
+# Every check the validator knows, in execution order
+CHECK_IDS = [
+    "entities", "roles", "features", "pages", "components", "apis",
+    "authorization", "states", "navigation", "design_system", "scenarios",
+    "core_files",
+]
+
+# Per-archetype profiles: checks to skip entirely and score weights for the
+# rest (default weight 1.0). Keys match the archetype names from Step 6.
+CHECK_PROFILES = {
+    "CRUD Manager": {
+        "skip": set(),
+        "weights": {"apis": 1.5, "authorization": 1.5},
+    },
+    "Dashboard / Analytics": {
+        # Drill-down views rarely declare connected pages; entities are
+        # aggregated rather than owned
+        "skip": {"navigation"},
+        "weights": {"entities": 0.5, "components": 1.5, "states": 1.5},
+    },
+    "Workflow Engine": {
+        "skip": set(),
+        "weights": {"roles": 1.5, "authorization": 1.5, "states": 1.5},
+    },
+    "Content Platform": {
+        "skip": set(),
+        "weights": {"components": 1.5, "states": 1.5},
+    },
+    "Communication Hub": {
+        # Real-time channels are not REST endpoints the scenarios can name
+        "skip": set(),
+        "weights": {"apis": 0.5, "scenarios": 0.5, "states": 1.5},
+    },
+    "Configuration / Admin": {
+        "skip": {"design_system"},
+        "weights": {"components": 0.5, "navigation": 0.5, "authorization": 2.0},
+    },
+}
+
+DEFAULT_PROFILE = {"name": "Default", "skip": set(), "weights": {}}
+
+# Keywords that identify an archetype in archetype.md free text
+ARCHETYPE_KEYWORDS = [
+    ("CRUD Manager", ("crud",)),
+    ("Dashboard / Analytics", ("dashboard", "analytics")),
+    ("Workflow Engine", ("workflow",)),
+    ("Content Platform", ("content platform", "content")),
+    ("Communication Hub", ("communication", "messaging")),
+    ("Configuration / Admin", ("configuration", "admin")),
+]
+
+
+# Values that mean "no archetype" (typically an empty Secondary)
+NO_ARCHETYPE = {"", "none", "n/a", "na", "-", "—", "–"}
+
+_RATIONALE_SEP_RE = re.compile(r"\s+[—–-]\s+|\s*\(")
+_SPACING_RE = re.compile(r"\s*/\s*|\s+")
+
+
+def archetype_key(name: str) -> str:
+    """Case- and spacing-insensitive form of an archetype name ('dashboard/analytics')."""
+    return _SPACING_RE.sub(lambda m: "/" if "/" in m.group() else " ", name.strip().lower())
+
+
+def match_archetype(text: str) -> str | None:
+    """Map an archetype value (e.g. 'Dashboard / Analytics — KPI views') to an archetype name.
+
+    The name before the rationale is matched against the archetype names
+    first; keywords are only a fallback, tried on the name and then on the
+    whole value, so words in the rationale cannot outrank the stated name.
+    "None" and "N/A" mean no archetype.
+    """
+    name = _RATIONALE_SEP_RE.split(text.strip(), maxsplit=1)[0].strip().strip(".")
+    if name.lower() in NO_ARCHETYPE:
+        return None
+    key = archetype_key(name)
+    for archetype in CHECK_PROFILES:
+        if key == archetype_key(archetype):
+            return archetype
+    for candidate in (name.lower(), text.lower()):
+        for archetype, keywords in ARCHETYPE_KEYWORDS:
+            if any(k in candidate for k in keywords):
+                return archetype
+    return None
+
+
+def detect_archetypes(text: str) -> tuple[str | None, str | None]:
+    """Read the primary and secondary archetype from archetype.md."""
+    primary = secondary = None
+    for line in text.splitlines():
+        stripped = line.strip().lstrip("-* ").replace("**", "")
+        label, _, value = stripped.partition(":")
+        label = label.strip().lower()
+        if label == "primary" and primary is None:
+            primary = match_archetype(value)
+        elif label == "secondary" and secondary is None:
+            secondary = match_archetype(value)
+    return primary, secondary
+
+
+def select_profile(archetype_text: str) -> dict:
+    """Pick the check profile for an app from its archetype.md text.
+
+    Hybrid apps skip only checks that both archetypes skip and take the
+    larger weight of the two for every check.
+    """
+    primary, secondary = detect_archetypes(archetype_text)
+    if primary is None:
+        return dict(DEFAULT_PROFILE)
+    profile = CHECK_PROFILES[primary]
+    skip = set(profile["skip"])
+    weights = dict(profile["weights"])
+    name = primary
+    if secondary and secondary != primary:
+        other = CHECK_PROFILES[secondary]
+        skip &= other["skip"]
+        for check, w in other["weights"].items():
+            weights[check] = max(weights.get(check, 1.0), w)
+        name = f"{primary} + {secondary}"
+    return {"name": name, "skip": skip, "weights": weights}
+
+
 # ---------------------------------------------------------------------------
 # Validation checks
 # ---------------------------------------------------------------------------
 
-def validate(spec_dir: Path, app_name: str) -> dict:
-    """Run all validation checks and return structured results."""
-    suite = spec_dir / "suite"
-    app_dir = spec_dir / "apps" / app_name
-    gaps = []          # missing artifacts
-    contradictions = []  # inconsistent cross-references
-    scores = {"completeness": [], "consistency": [], "coverage": []}
+class SpecContext:
+    """Lazily loaded spec files and extracted items shared between checks.
+
+    Each file is read at most once and each derived list is computed only
+    when a check that needs it runs, so skipped checks cost nothing.
+    """
 
-    # --- 1. Entity Consistency ---
-    suite_entities = extract_entities(read_file(suite / "domain-model.md"))
-    app_entities = extract_entities(read_file(app_dir / "domain-refinement.md"))
-    app_entity_text = read_file(app_dir / "domain-refinement.md")
+    def __init__(self, spec_dir: Path, app_name: str):
+        self.app_name = app_name
+        self.suite = spec_dir / "suite"
+        self.app_dir = spec_dir / "apps" / app_name
+        self.gaps: list[str] = []
+        self.contradictions: list[str] = []
+        self.scores: dict[str, list[tuple[float, float]]] = {
+            "completeness": [], "consistency": [], "coverage": [],
+        }
+        self.weight = 1.0
+        self._text: dict[Path, str] = {}
+
+    def read(self, path: Path) -> str:
+        if path not in self._text:
+            self._text[path] = read_file(path)
+        return self._text[path]
+
+    def score(self, category: str, value: float):
+        self.scores[category].append((value, self.weight))
+
+    @cached_property
+    def feature_files(self) -> list[Path]:
+        return list_files(self.app_dir / "features", ".feature.md")
+
+    @cached_property
+    def ia_routes(self) -> list[str]:
+        return extract_routes(self.read(self.app_dir / "ia-spec.md"))
+
+    @cached_property
+    def page_files(self) -> list[Path]:
+        return list_files(self.app_dir / "pages")
+
+    @cached_property
+    def page_stems(self) -> list[str]:
+        return [stem_name(f) for f in self.page_files]
+
+    @cached_property
+    def all_page_text(self) -> str:
+        return "".join(self.read(pf) + "\n" for pf in self.page_files)
+
+    @cached_property
+    def component_files(self) -> list[Path]:
+        return list_files(self.app_dir / "components")
+
+    @cached_property
+    def api_defined(self) -> list[str]:
+        return extract_api_endpoints(self.read(self.app_dir / "api-contracts.md"))
+
+
+def check_entities(ctx: SpecContext):
+    """1. Entity Consistency."""
+    suite_entities = extract_entities(ctx.read(ctx.suite / "domain-model.md"))
+    app_entity_text = ctx.read(ctx.app_dir / "domain-refinement.md")
+    app_entities = extract_entities(app_entity_text)
 
     if not suite_entities:
-        gaps.append("No entities found in suite/domain-model.md")
-    if not app_entities and (app_dir / "domain-refinement.md").is_file():
-        gaps.append(f"No entities found in apps/{app_name}/domain-refinement.md")
+        ctx.gaps.append("No entities found in suite/domain-model.md")
+    if not app_entities and (ctx.app_dir / "domain-refinement.md").is_file():
+        ctx.gaps.append(f"No entities found in apps/{ctx.app_name}/domain-refinement.md")
 
     for entity in app_entities:
         if entity not in suite_entities and "app-specific" not in app_entity_text.lower():
-            contradictions.append(
+            ctx.contradictions.append(
                 f"Entity '{entity}' in app domain-refinement is not in suite domain-model "
                 f"and not marked as app-specific"
             )
     if suite_entities:
         matched = sum(1 for e in app_entities if e in suite_entities)
-        scores["consistency"].append(matched / len(app_entities) if app_entities else 1.0)
+        ctx.score("consistency", matched / len(app_entities) if app_entities else 1.0)
+
 
-    # --- 2. Role Consistency ---
-    suite_roles = extract_roles(read_file(suite / "role-permission-matrix.md"))
-    app_roles = extract_roles(read_file(app_dir / "role-refinement.md"))
-    app_role_text = read_file(app_dir / "role-refinement.md")
+def check_roles(ctx: SpecContext):
+    """2. Role Consistency, including permission escalation against the suite matrix."""
+    suite_role_text = ctx.read(ctx.suite / "role-permission-matrix.md")
+    suite_roles = extract_roles(suite_role_text)
+    app_role_text = ctx.read(ctx.app_dir / "role-refinement.md")
+    app_roles = extract_roles(app_role_text)
 
     if not suite_roles:
-        gaps.append("No roles found in suite/role-permission-matrix.md")
-    if not app_roles and (app_dir / "role-refinement.md").is_file():
-        gaps.append(f"No roles found in apps/{app_name}/role-refinement.md")
+        ctx.gaps.append("No roles found in suite/role-permission-matrix.md")
+    if not app_roles and (ctx.app_dir / "role-refinement.md").is_file():
+        ctx.gaps.append(f"No roles found in apps/{ctx.app_name}/role-refinement.md")
 
     for role in app_roles:
         if role not in suite_roles and "app-specific" not in app_role_text.lower():
-            contradictions.append(
+            ctx.contradictions.append(
                 f"Role '{role}' in app role-refinement is not in suite role-permission-matrix "
                 f"and not marked as app-specific"
             )
     if suite_roles:
         matched = sum(1 for r in app_roles if r in suite_roles)
-        scores["consistency"].append(matched / len(app_roles) if app_roles else 1.0)
-
-    # --- 3. Feature Coverage ---
-    feature_files = list_files(app_dir / "features", ".feature.md")
-    if not feature_files:
-        gaps.append(f"No .feature.md files in apps/{app_name}/features/")
-    scores["completeness"].append(1.0 if feature_files else 0.0)
-    feature_names = [stem_name(f) for f in feature_files]
-
-    # --- 4. Page Coverage ---
-    ia_text = read_file(app_dir / "ia-spec.md")
-    ia_routes = extract_routes(ia_text)
-    page_files = list_files(app_dir / "pages")
-    page_stems = [stem_name(f) for f in page_files]
-
-    if ia_routes and not page_files:
-        gaps.append(f"IA spec defines {len(ia_routes)} routes but no page specs exist")
+        ctx.score("consistency", matched / len(app_roles) if app_roles else 1.0)
+
+    # App-level permissions must not exceed the suite-level grants
+    if suite_roles and app_role_text:
+        permissions = compile_table(suite_role_text, app_role_text, ctx.app_name)
+        escalations = permissions["diff"]["escalations"]
+        for e in escalations:
+            ctx.contradictions.append(
+                f"Role '{e['role']}' may {e['action']} '{e['resource']}' in app role-refinement "
+                f"but the suite role-permission-matrix denies it"
+            )
+        for u in permissions.get("unknown_operations", []):
+            ctx.gaps.append(
+                f"Unknown operation '{u['token']}' for role '{u['role']}' on '{u['resource']}' in the permission tables"
+            )
+        cells = sum(len(acts) for per_role in permissions["matrix"].values() for acts in per_role.values())
+        if cells:
+            ctx.score("consistency", 1.0 - len(escalations) / cells)
+
+
+def check_features(ctx: SpecContext):
+    """3. Feature Coverage."""
+    if not ctx.feature_files:
+        ctx.gaps.append(f"No .feature.md files in apps/{ctx.app_name}/features/")
+    ctx.score("completeness", 1.0 if ctx.feature_files else 0.0)
+
+
+def check_pages(ctx: SpecContext):
+    """4. Page Coverage."""
+    ia_routes = ctx.ia_routes
+    page_stems = ctx.page_stems
+
+    if ia_routes and not ctx.page_files:
+        ctx.gaps.append(f"IA spec defines {len(ia_routes)} routes but no page specs exist")
+    matched = 0
     for route in ia_routes:
         # Derive expected page name from route: /dashboard/settings → dashboard-settings
         slug = route.strip("/").replace("/", "-").replace(":", "")
-        if slug and not any(slug in ps or ps in slug for ps in page_stems):
-            gaps.append(f"Route '{route}' from ia-spec.md has no matching page spec")
+        if any(slug in ps or ps in slug for ps in page_stems):
+            matched += 1
+        elif slug:
+            ctx.gaps.append(f"Route '{route}' from ia-spec.md has no matching page spec")
     if ia_routes:
-        matched = sum(1 for r in ia_routes if any(
-            r.strip("/").replace("/", "-").replace(":", "") in ps or
-            ps in r.strip("/").replace("/", "-").replace(":", "")
-            for ps in page_stems
-        ))
-        scores["coverage"].append(matched / len(ia_routes) if ia_routes else 1.0)
-    scores["completeness"].append(1.0 if page_files else 0.0)
-
-    # --- 5. Component Coverage ---
-    all_page_text = ""
-    for pf in page_files:
-        all_page_text += read_file(pf) + "\n"
-    component_refs = extract_component_refs(all_page_text)
-    component_files = list_files(app_dir / "components")
-    component_stems = [stem_name(f).lower() for f in component_files]
+        ctx.score("coverage", matched / len(ia_routes))
+    ctx.score("completeness", 1.0 if ctx.page_files else 0.0)
+
 
+def check_components(ctx: SpecContext):
+    """5. Component Coverage."""
+    component_refs = extract_component_refs(ctx.all_page_text)
+    component_stems = [stem_name(f).lower() for f in ctx.component_files]
+
+    matched = 0
     for comp in component_refs:
-        if comp.lower() not in component_stems and not any(comp.lower() in cs for cs in component_stems):
-            gaps.append(f"Component '{comp}' referenced in page specs has no matching component spec")
+        if comp.lower() in component_stems or any(comp.lower() in cs for cs in component_stems):
+            matched += 1
+        else:
+            ctx.gaps.append(f"Component '{comp}' referenced in page specs has no matching component spec")
     if component_refs:
-        matched = sum(1 for c in component_refs if c.lower() in component_stems or
-                       any(c.lower() in cs for cs in component_stems))
-        scores["coverage"].append(matched / len(component_refs))
-    scores["completeness"].append(1.0 if component_files else 0.0)
+        ctx.score("coverage", matched / len(component_refs))
+    ctx.score("completeness", 1.0 if ctx.component_files else 0.0)
+
 
-    # --- 6. API Coverage ---
-    state_text = read_file(app_dir / "state-interaction.md")
-    api_text = read_file(app_dir / "api-contracts.md")
-    page_api_refs = extract_api_endpoints(all_page_text + state_text)
-    api_defined = extract_api_endpoints(api_text)
+def check_apis(ctx: SpecContext):
+    """6. API Coverage."""
+    state_text = ctx.read(ctx.app_dir / "state-interaction.md")
+    page_api_refs = extract_api_endpoints(ctx.all_page_text + state_text)
+    api_defined = ctx.api_defined
 
     for ep in page_api_refs:
         if ep not in api_defined:
-            gaps.append(f"API endpoint '{ep}' referenced in specs but not defined in api-contracts.md")
+            ctx.gaps.append(f"API endpoint '{ep}' referenced in specs but not defined in api-contracts.md")
     if page_api_refs:
         matched = sum(1 for ep in page_api_refs if ep in api_defined)
-        scores["consistency"].append(matched / len(page_api_refs))
-    scores["completeness"].append(1.0 if (app_dir / "api-contracts.md").is_file() else 0.0)
+        ctx.score("consistency", matched / len(page_api_refs))
+    ctx.score("completeness", 1.0 if (ctx.app_dir / "api-contracts.md").is_file() else 0.0)
 
-    # --- 7. Authorization Coverage ---
-    auth_text = read_file(app_dir / "authorization.md")
-    all_routes = ia_routes + api_defined
+
+def check_authorization(ctx: SpecContext):
+    """7. Authorization Coverage."""
+    auth_text = ctx.read(ctx.app_dir / "authorization.md")
+    all_routes = ctx.ia_routes + ctx.api_defined
     if all_routes and not auth_text:
-        gaps.append("Routes and endpoints exist but authorization.md is empty or missing")
+        ctx.gaps.append("Routes and endpoints exist but authorization.md is empty or missing")
     for route in all_routes:
         if route not in auth_text:
-            gaps.append(f"Route/endpoint '{route}' not found in authorization.md")
+            ctx.gaps.append(f"Route/endpoint '{route}' not found in authorization.md")
     if all_routes:
         matched = sum(1 for r in all_routes if r in auth_text)
-        scores["coverage"].append(matched / len(all_routes))
-    scores["completeness"].append(1.0 if (app_dir / "authorization.md").is_file() else 0.0)
+        ctx.score("coverage", matched / len(all_routes))
+    ctx.score("completeness", 1.0 if (ctx.app_dir / "authorization.md").is_file() else 0.0)
+
 
-    # --- 8. State Coverage ---
+def check_states(ctx: SpecContext):
+    """8. State Coverage."""
     state_keywords = ["loading", "error", "empty"]
-    for pf in page_files:
-        page_text = read_file(pf).lower()
+    found = 0
+    for pf in ctx.page_files:
+        page_text = ctx.read(pf).lower()
         missing_states = [s for s in state_keywords if s not in page_text]
+        found += len(state_keywords) - len(missing_states)
         if missing_states:
-            gaps.append(
+            ctx.gaps.append(
                 f"Page spec '{pf.name}' missing state definitions: {', '.join(missing_states)}"
             )
-    if page_files:
-        total_checks = len(page_files) * len(state_keywords)
-        found = sum(
-            1 for pf in page_files
-            for s in state_keywords
-            if s in read_file(pf).lower()
-        )
-        scores["coverage"].append(found / total_checks if total_checks else 1.0)
-
-    # --- 9. Navigation Consistency ---
-    for pf in page_files:
-        connected = extract_connected_pages(read_file(pf))
-        for target in connected:
+    if ctx.page_files:
+        ctx.score("coverage", found / (len(ctx.page_files) * len(state_keywords)))
+
+
+def check_navigation(ctx: SpecContext):
+    """9. Navigation Consistency."""
+    nav_total = 0
+    nav_found = 0
+    for pf in ctx.page_files:
+        for target in extract_connected_pages(ctx.read(pf)):
+            nav_total += 1
             target_slug = target.strip().lower().replace(" ", "-")
-            if not any(target_slug in ps.lower() for ps in page_stems):
-                contradictions.append(
+            if any(target_slug in ps.lower() for ps in ctx.page_stems):
+                nav_found += 1
+            else:
+                ctx.contradictions.append(
                     f"Page '{pf.name}' references connected page '{target}' which has no spec file"
                 )
-    # Count for consistency score
-    nav_total = 0
-    nav_found = 0
-    for pf in page_files:
-        connected = extract_connected_pages(read_file(pf))
-        nav_total += len(connected)
-        nav_found += sum(1 for t in connected if any(
-            t.strip().lower().replace(" ", "-") in ps.lower() for ps in page_stems
-        ))
     if nav_total:
-        scores["consistency"].append(nav_found / nav_total)
-
-    # --- 10. Design System Compliance ---
-    design_text = read_file(suite / "design-system.md")
-    design_tokens = extract_design_tokens(design_text)
-    if design_tokens:
-        all_component_text = ""
-        for cf in component_files:
-            all_component_text += read_file(cf) + "\n"
-        comp_token_refs = extract_design_tokens(all_component_text)
-        for token in comp_token_refs:
-            if token not in design_tokens:
-                contradictions.append(
-                    f"Component spec references design token '{token}' not found in design-system.md"
-                )
-        if comp_token_refs:
-            matched = sum(1 for t in comp_token_refs if t in design_tokens)
-            scores["consistency"].append(matched / len(comp_token_refs))
+        ctx.score("consistency", nav_found / nav_total)
+
 
-    # --- Check core file completeness ---
+def check_design_system(ctx: SpecContext):
+    """10. Design System Compliance."""
+    design_tokens = extract_design_tokens(ctx.read(ctx.suite / "design-system.md"))
+    if not design_tokens:
+        return
+    all_component_text = "".join(ctx.read(cf) + "\n" for cf in ctx.component_files)
+    comp_token_refs = extract_design_tokens(all_component_text)
+    for token in comp_token_refs:
+        if token not in design_tokens:
+            ctx.contradictions.append(
+                f"Component spec references design token '{token}' not found in design-system.md"
+            )
+    if comp_token_refs:
+        matched = sum(1 for t in comp_token_refs if t in design_tokens)
+        ctx.score("consistency", matched / len(comp_token_refs))
+
+
+def check_scenarios(ctx: SpecContext):
+    """11. Scenario Coverage."""
+    ctx.scenario_index = build_scenario_index(ctx.feature_files, ctx.ia_routes, ctx.api_defined)
+    for kind, label in (("routes", "Route"), ("endpoints", "API endpoint")):
+        refs = ctx.scenario_index[kind]
+        for target, scenarios in refs.items():
+            if not scenarios:
+                ctx.gaps.append(f"{label} '{target}' is not exercised by any BDD scenario")
+        if refs:
+            touched = sum(1 for scenarios in refs.values() if scenarios)
+            ctx.score("coverage", touched / len(refs))
+
+
+def check_core_files(ctx: SpecContext):
+    """Core spec file completeness."""
     core_files = [
         "archetype.md", "domain-refinement.md", "role-refinement.md",
         "ia-spec.md", "state-interaction.md", "api-contracts.md", "authorization.md",
     ]
     for fname in core_files:
-        if not (app_dir / fname).is_file():
-            gaps.append(f"Missing core spec file: apps/{app_name}/{fname}")
-        scores["completeness"].append(1.0 if (app_dir / fname).is_file() else 0.0)
+        exists = (ctx.app_dir / fname).is_file()
+        if not exists:
+            ctx.gaps.append(f"Missing core spec file: apps/{ctx.app_name}/{fname}")
+        ctx.score("completeness", 1.0 if exists else 0.0)
+
+
+CHECKS = {
+    "entities": check_entities,
+    "roles": check_roles,
+    "features": check_features,
+    "pages": check_pages,
+    "components": check_components,
+    "apis": check_apis,
+    "authorization": check_authorization,
+    "states": check_states,
+    "navigation": check_navigation,
+    "design_system": check_design_system,
+    "scenarios": check_scenarios,
+    "core_files": check_core_files,
+}
+
+
+def validate(spec_dir: Path, app_name: str, profile: dict | None = None) -> dict:
+    """Run the checks enabled by the app's archetype profile and return structured results."""
+    ctx = SpecContext(spec_dir, app_name)
+    ctx.scenario_index = {"routes": {}, "endpoints": {}}
+    if profile is None:
+        profile = select_profile(ctx.read(ctx.app_dir / "archetype.md"))
+
+    for check_id in CHECK_IDS:
+        if check_id in profile["skip"]:
+            continue
+        ctx.weight = profile["weights"].get(check_id, 1.0)
+        CHECKS[check_id](ctx)
 
-    return {"gaps": gaps, "contradictions": contradictions, "scores": scores}
+    return {
+        "gaps": ctx.gaps,
+        "contradictions": ctx.contradictions,
+        "scores": ctx.scores,
+        "scenario_index": ctx.scenario_index,
+        "profile": profile,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -306,9 +806,14 @@ def validate(spec_dir: Path, app_name: str) -> dict:
 # ---------------------------------------------------------------------------
 
 def compute_scores(raw: dict) -> dict:
-    """Compute final 0-100 scores from raw validation results."""
+    """Compute final 0-100 scores from raw validation results.
+
+    Each raw score is a (value, weight) pair; weights come from the app's
+    archetype check profile.
+    """
     def avg(lst):
-        return (sum(lst) / len(lst) * 100) if lst else 0.0
+        total_weight = sum(w for _, w in lst)
+        return (sum(v * w for v, w in lst) / total_weight * 100) if total_weight else 0.0
 
     completeness = avg(raw["scores"]["completeness"])
     consistency = avg(raw["scores"]["consistency"])
@@ -356,8 +861,12 @@ def write_contradiction_report(path: Path, contradictions: list[str], app_name:
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def write_completeness_report(path: Path, final_scores: dict, gaps: list, contradictions: list, app_name: str):
+def write_completeness_report(path: Path, final_scores: dict, gaps: list, contradictions: list, app_name: str,
+                              profile: dict | None = None):
     """Write the completeness score markdown file."""
+    profile = profile or DEFAULT_PROFILE
+    skipped = ", ".join(c for c in CHECK_IDS if c in profile["skip"]) or "none"
+    weighted = ", ".join(f"{c} \u00d7{w:g}" for c, w in sorted(profile["weights"].items())) or "none"
     lines = [
         f"# Completeness Score — {app_name}\n",
         "## Scores\n",
@@ -373,6 +882,11 @@ def write_completeness_report(path: Path, final_scores: dict, gaps: list, contra
         "- **Consistency** (35%): Ratio of valid cross-references to total cross-references",
         "- **Coverage** (25%): Ratio of fully specified items to total items",
         "",
+        "## Check Profile\n",
+        f"- Archetype profile: {profile['name']}",
+        f"- Skipped checks: {skipped}",
+        f"- Weighted checks: {weighted}",
+        "",
         "## Summary\n",
         f"- Gaps found: {len(gaps)}",
         f"- Contradictions found: {len(contradictions)}",
@@ -397,6 +911,7 @@ def main():
     parser.add_argument("--project-dir", default=None, help="Project root directory (sets --spec-dir default to <project-dir>/spec)")
     parser.add_argument("--spec-dir", default=None, help="Path to spec directory (default: ./spec or <project-dir>/spec)")
     parser.add_argument("--app", required=True, help="App name to validate (must exist under spec/apps/)")
+    parser.add_argument("--all-checks", action="store_true", help="Ignore the archetype check profile and run every check with equal weight")
     args = parser.parse_args()
 
     if args.project_dir is not None:
@@ -414,7 +929,7 @@ def main():
         return
 
     # Run validation
-    results = validate(spec_dir, args.app)
+    results = validate(spec_dir, args.app, DEFAULT_PROFILE if args.all_checks else None)
     final_scores = compute_scores(results)
 
     # Write reports
@@ -423,10 +938,19 @@ def main():
 
     write_gap_report(report_dir / "gap-report.md", results["gaps"], args.app)
     write_contradiction_report(report_dir / "contradiction-report.md", results["contradictions"], args.app)
-    write_completeness_report(report_dir / "completeness-score.md", final_scores, results["gaps"], results["contradictions"], args.app)
+    write_completeness_report(
+        report_dir / "completeness-score.md", final_scores, results["gaps"], results["contradictions"],
+        args.app, results["profile"],
+    )
+    with open(report_dir / "scenario-index.json", "w", encoding="utf-8") as f:
+        json.dump(results["scenario_index"], f, indent=2)
+        f.write("\n")
 
     # Print summary to stdout
     print(f"=== Validation Report for '{args.app}' ===\n")
+    profile = results["profile"]
+    skipped = ", ".join(c for c in CHECK_IDS if c in profile["skip"])
+    print(f"Check profile: {profile['name']}" + (f" (skipped: {skipped})" if skipped else "") + "\n")
     print(f"Completeness : {final_scores['completeness']:5.1f}%")
     print(f"Consistency  : {final_scores['consistency']:5.1f}%")
     print(f"Coverage     : {final_scores['coverage']:5.1f}%")
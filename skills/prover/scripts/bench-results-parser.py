@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark scenario extraction on synthetic Playwright reports.
+
+Builds reports of N/4, N/2 and N tests (default N = 100,000), each spec run
+in two browser projects, nested `--depth` describe blocks deep and listed
+twice (under the top-level suites and again under config.projects). Times
+extract_scenarios on the decoded report and stream_scenarios on the file,
+checks that both count every spec exactly once, and fails if the cost per
+test at N grows beyond `--max-growth` times the cost at N/4 — a quadratic
+walk doubles its per-test cost with every doubling of the report.
+
+Usage:
+    python3 scripts/bench-results-parser.py [--tests 100000] [--depth 50] [--max-growth 1.5]
+
+Exit codes:
+    0 — Linear, and every spec counted once
+    1 — Per-test cost grew beyond the limit, or a scenario count is wrong
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+PROJECTS = ("chromium", "firefox")
+SPECS_PER_FILE = 50
+
+
+def load_parser():
+    """Import parse-playwright-results.py (hyphenated, so not importable by name)."""
+    sys.path.insert(0, str(SCRIPT_DIR))
+    spec = importlib.util.spec_from_file_location("parse_playwright_results", SCRIPT_DIR / "parse-playwright-results.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_report(tests: int, depth: int) -> tuple[dict, int]:
+    """Synthetic report with `tests` tests; returns (report, number of specs)."""
+    specs = tests // len(PROJECTS)
+    suites = []
+    for start in range(0, specs, SPECS_PER_FILE):
+        file = f"features/f{start // SPECS_PER_FILE:05d}.feature.spec.js"
+        suite = {
+            "title": f"Feature: Feature {start // SPECS_PER_FILE}",
+            "file": file,
+            "specs": [
+                {
+                    "title": f"Scenario {i}",
+                    "file": file,
+                    "line": 10 + i,
+                    "tests": [
+                        {"projectName": project, "results": [{"status": "passed" if i % 10 else "failed",
+                                                              "duration": 100, "errors": [], "attachments": []}]}
+                        for project in PROJECTS
+                    ],
+                }
+                for i in range(start, min(start + SPECS_PER_FILE, specs))
+            ],
+        }
+        for level in range(depth):
+            suite = {"title": f"Describe {level}", "file": file, "specs": [], "suites": [suite]}
+        suites.append({"title": file, "file": file, "specs": [], "suites": [suite]})
+    report = {
+        "config": {"projects": [{"name": PROJECTS[0], "suites": suites}, {"name": PROJECTS[1]}]},
+        "suites": suites,
+        "errors": [],
+    }
+    return report, specs
+
+
+def best_time(fn, repeat: int) -> tuple[float, object]:
+    """Best-of-`repeat` wall time in seconds of fn() and its last result.
+
+    The cyclic GC is paused while timing, as in the parser's main().
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Playwright results extraction for linear time")
+    parser.add_argument("--tests", type=int, default=100_000, help="Tests in the largest report (default: 100000)")
+    parser.add_argument("--depth", type=int, default=50, help="Nested describe blocks around each feature (default: 50)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions; the best run counts (default: 3)")
+    parser.add_argument("--max-growth", type=float, default=1.5,
+                        help="Maximum per-test cost at N relative to N/4 (default: 1.5)")
+    args = parser.parse_args()
+
+    results_parser = load_parser()
+    sizes = [args.tests // 4, args.tests // 2, args.tests]
+    walkers = {"extract_scenarios": {}, "stream_scenarios": {}}
+    wrong_counts = []
+
+    print(f"=== Results Parser Benchmark (depth {args.depth}, every spec listed twice) ===\n")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.json")
+        for size in sizes:
+            report, specs = build_report(size, args.depth)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(report))
+            runs = {
+                "extract_scenarios": lambda: results_parser.extract_scenarios(report),
+                "stream_scenarios": lambda: list(results_parser.stream_scenarios(path)),
+            }
+            for name, fn in runs.items():
+                seconds, scenarios = best_time(fn, args.repeat)
+                walkers[name][size] = seconds * 1e6 / size
+                if len(scenarios) != specs:
+                    wrong_counts.append(f"{name} on {size} tests: {len(scenarios)} scenarios, expected {specs}")
+            print(f"  {size:>8} tests: " + "   ".join(f"{name} {per_test[size]:6.2f} us/test"
+                                                   for name, per_test in walkers.items()))
+
+    print()
+    failures = list(wrong_counts)
+    for name, per_test in walkers.items():
+        growth = per_test[sizes[-1]] / per_test[sizes[0]]
+        mark = "✓" if growth <= args.max_growth else "!"
+        print(f"  [{mark}] {name:<18} per-test cost x{growth:.2f} from {sizes[0]} to {sizes[-1]} tests")
+        if growth > args.max_growth:
+            failures.append(f"{name}: per-test cost grew x{growth:.2f} (limit x{args.max_growth})")
+
+    if failures:
+        print(f"\nFailed ({len(failures)}):")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\nExtraction is linear and counts every spec once.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
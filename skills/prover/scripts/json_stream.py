@@ -0,0 +1,179 @@
+"""Incremental pull reader for large JSON documents (stdlib only).
+
+Reads a JSON file in chunks and hands it out one event at a time instead
+of building the whole document. The caller walks the outer structure with
+iter_object() (one event per key) and iter_array() (one event per
+element), and for every key or element either descends further or calls
+read_value() to decode that value in full. Only the current chunk and the
+values the caller asks for are held in memory.
+
+read_value() decodes with json's C scanner (JSONDecoder.raw_decode), so
+the bulk of a document is parsed at native speed; only the structure the
+caller walks is tokenized in Python. A value that does not fit in the
+buffer is retried after reading at least as much again, so a large value
+costs amortized linear time.
+
+Usage:
+    with open(path, encoding="utf-8") as f:
+        reader = JSONStream(f)
+        for key in reader.iter_object():
+            if key == "items":
+                for _ in reader.iter_array():
+                    handle(reader.read_value())
+            else:
+                reader.read_value()  # skip
+"""
+
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Iterator, TextIO
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # characters
+
+WHITESPACE = " \t\n\r"
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONStream:
+    """Pull reader over a text stream holding one JSON document.
+
+    Every key yielded by iter_object() and every element yielded by
+    iter_array() must be consumed — by read_value(), iter_object() or
+    iter_array() — before the iterator is advanced. Malformed input raises
+    ValueError with the character offset in the file.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.consumed = 0  # characters dropped from the front of buf
+        self._decoder = json.JSONDecoder()
+
+    # -- buffer ------------------------------------------------------------
+
+    def _fill(self, at_least: int = 0) -> bool:
+        """Read more input (at least `at_least` characters); False at end of input."""
+        if self.eof:
+            return False
+        data = self.stream.read(max(self.chunk_size, at_least))
+        if self.pos:
+            self.consumed += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def _error(self, message: str, offset: int | None = None) -> ValueError:
+        offset = self.offset() if offset is None else offset
+        return ValueError(f"{message} at character {offset}")
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at end of input)."""
+        while True:
+            buf, pos = self.buf, self.pos
+            if pos < len(buf) and buf[pos] not in WHITESPACE:
+                return buf[pos]
+            pos = _WHITESPACE_RE.match(buf, pos).end()
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def _next_char(self) -> str:
+        char = self.peek()
+        if not char:
+            raise self._error("Unexpected end of input")
+        self.pos += 1
+        return char
+
+    def _expect(self, char: str):
+        if self._next_char() != char:
+            self.pos -= 1
+            raise self._error(f"Expecting '{char}'")
+
+    def offset(self) -> int:
+        """Characters read so far, for progress and error messages."""
+        return self.consumed + self.pos
+
+    def end(self):
+        """Check that nothing but whitespace follows the document."""
+        if self.peek():
+            raise self._error("Extra data")
+
+    # -- values ------------------------------------------------------------
+
+    def read_string(self) -> str:
+        """Decode the next value, which must be a string."""
+        self._expect('"')
+        while True:
+            try:
+                value, end = scanstring(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                offset = self.consumed + e.pos
+                if self._fill(len(self.buf) - self.pos):
+                    continue
+                raise self._error(e.msg, offset) from None
+            self.pos = end
+            return value
+
+    def read_value(self) -> Any:
+        """Decode the next value (of any type) in full and return it."""
+        if not self.peek():
+            raise self._error("Expecting value")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                offset = self.consumed + e.pos
+                if self._fill(len(self.buf) - self.pos):
+                    continue
+                raise self._error(e.msg, offset) from None
+            # A number running to the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield the keys of the next value, which must be an object."""
+        self._expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self.read_string()
+            self._expect(":")
+            yield key
+            char = self._next_char()
+            if char == "}":
+                return
+            if char != ",":
+                self.pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def iter_array(self) -> Iterator[int]:
+        """Yield the index of each element of the next value, which must be an array."""
+        self._expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            char = self._next_char()
+            if char == "]":
+                return
+            if char != ",":
+                self.pos -= 1
+                raise self._error("Expecting ',' delimiter")
@@ -10,21 +10,96 @@ Usage:
         --app admin-portal \
         --project-dir .
 
+The results file is streamed with json_stream.JSONStream: suites are
+walked as they are read, each spec is decoded on its own and folded into
+the per-feature grouping straight away, so memory is bounded by the number
+of scenarios rather than the size of results.json.
+
+Sharded runs (`npx playwright test --shard i/N`) write one results file
+per shard. Pass them all, or a glob, to --results-file: the files are
+parsed in parallel worker processes (--jobs) and merged into one cycle,
+with each scenario taking its worst status across shards, so the meta
+file is updated once per cycle.
+
+    python3 parse-playwright-results.py \
+        --results-file 'test-results/shard-*.json' \
+        --meta-file .prover-meta.json --cycle 4 --app admin-portal
+
 Exit codes:
     0 — All scenarios passed
     1 — Some scenarios failed or are exhausted
-    2 — File/parse error
+    2 — File/parse error, or the meta file stayed locked past --lock-timeout
 """
 
 import argparse
+import contextlib
+import gc
+import glob
+import hashlib
 import json
+import math
 import os
+import random
+import re
+import shlex
+import statistics
 import sys
+import tempfile
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from json_stream import JSONStream
+from trace_digest import digest_trace
 
 EXHAUSTION_THRESHOLD = 3
 
+# How long to wait for another parser holding the meta file lock
+LOCK_TIMEOUT = 60.0  # seconds
+LOCK_POLL = 0.05
+
+META_VERSION = "1.2"
+
+# History entries kept per scenario in .prover-meta.json; the full history
+# goes to the append-only cycle log
+HISTORY_WINDOW = 10
+HISTORY_LOG = ".prover-history.jsonl"
+
+# A scenario whose history window shows at least this flakiness score over
+# at least FLAKY_MIN_RUNS runs is quarantined (see flaky_score)
+FLAKY_THRESHOLD = 0.5
+FLAKY_MIN_RUNS = 3
+
+# A passing run is a slowdown when it is above its baseline's p95 and at
+# least SLOWDOWN_THRESHOLD (as a fraction) above the baseline median, by
+# SLOWDOWN_MIN_DELTA ms or more, with SLOWDOWN_MIN_SAMPLES earlier passing runs
+SLOWDOWN_THRESHOLD = 0.5
+SLOWDOWN_MIN_SAMPLES = 3
+SLOWDOWN_MIN_DELTA = 250  # ms
+
+# Error signatures (see error_signature): message lines and stack frames
+# that make up a failure's fingerprint, and what is normalized away
+SIGNATURE_LINES = 5
+SIGNATURE_FRAMES = 3
+CLUSTER_SHOWN = 10  # scenarios listed per cluster in the summary
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+FRAME_RE = re.compile(r"^\s*at\s+(.*)$")
+PATH_RE = re.compile(r"(?:[A-Za-z]:)?(?:[\\/][\w.@+-]+)*[\\/]([\w.@+-]+\.\w+)")
+UUID_RE = re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b")
+HEX_ID_RE = re.compile(r"\b(?=[0-9a-fA-F]*\d)(?=[0-9a-fA-F]*[a-fA-F])[0-9a-fA-F]{8,}\b")
+NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+HTTP_STATUS_RE = re.compile(r"(?i)\b(?:status|http|code|respon\w*|expected|received)\W{0,12}([1-5]\d\d)(?![\d.])")
+
+# Characters with a meaning in a JavaScript RegExp (Playwright's --grep)
+GREP_SPECIAL_RE = re.compile(r"[.*+?^${}()|[\]\\/]")
+
 STATUS_MAP = {
     "passed": "PASSED",
     "failed": "FAILED",
@@ -33,6 +108,9 @@ STATUS_MAP = {
     "interrupted": "ERROR",
 }
 
+# Worst status wins: ERROR > FAILED > NOT_RUN > PASSED
+STATUS_PRIORITY = {"PASSED": 0, "NOT_RUN": 1, "FAILED": 2, "ERROR": 3}
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -41,7 +119,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--results-file",
         required=True,
-        help="Path to Playwright JSON reporter output (e.g., test-results/results.json)",
+        nargs="+",
+        help="Playwright JSON reporter output (e.g., test-results/results.json); "
+        "several files or a quoted glob are merged into one cycle",
     )
     parser.add_argument(
         "--meta-file",
@@ -64,7 +144,84 @@ def parse_args() -> argparse.Namespace:
         default=".",
         help="Project root directory (default: current directory)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for parsing several results files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--history-window",
+        type=int,
+        default=HISTORY_WINDOW,
+        help=f"History entries kept per scenario in the meta file; at least "
+        f"{max(EXHAUSTION_THRESHOLD, SLOWDOWN_MIN_SAMPLES + 1)} and --flaky-min-runs (default: {HISTORY_WINDOW})",
+    )
+    parser.add_argument(
+        "--history-log",
+        default=None,
+        help=f"Append-only per-cycle log; a .gz path is compressed (default: {HISTORY_LOG} next to the meta file)",
+    )
+    parser.add_argument(
+        "--no-trace-digest",
+        action="store_true",
+        help="Do not digest the trace.zip of failing scenarios into the meta file",
+    )
+    parser.add_argument(
+        "--flaky-threshold",
+        type=float,
+        default=FLAKY_THRESHOLD,
+        help=f"Flakiness score (0-1) at which a scenario is quarantined (default: {FLAKY_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--flaky-min-runs",
+        type=int,
+        default=FLAKY_MIN_RUNS,
+        help=f"Runs in the history window before a scenario can be quarantined (default: {FLAKY_MIN_RUNS})",
+    )
+    parser.add_argument(
+        "--slowdown-threshold",
+        type=float,
+        default=SLOWDOWN_THRESHOLD,
+        help="Fraction above the median duration (and above p95) that counts as a slowdown "
+        f"(default: {SLOWDOWN_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--rerun-manifest",
+        default=None,
+        help="Write the FAILED/ERROR scenarios to rerun next cycle to this JSON file (e.g., .prover-rerun.json)",
+    )
+    parser.add_argument(
+        "--rerun-sample",
+        type=int,
+        default=0,
+        help="Passing scenarios to add to the rerun manifest as a smoke check (default: 0)",
+    )
+    parser.add_argument(
+        "--lock-timeout",
+        type=float,
+        default=LOCK_TIMEOUT,
+        help=f"Seconds to wait for another parser updating the same meta file (default: {LOCK_TIMEOUT:g})",
+    )
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="Also record the cycle in this SQLite database for prover-report.py (e.g., .prover-history.db)",
+    )
+    args = parser.parse_args()
+    if args.flaky_min_runs < 1:
+        parser.error("--flaky-min-runs must be at least 1")
+    # Exhaustion and quarantine are judged from the history window, so it
+    # must hold enough runs for either to be reached
+    if args.history_window < EXHAUSTION_THRESHOLD:
+        parser.error(f"--history-window must be at least {EXHAUSTION_THRESHOLD} (the exhaustion threshold)")
+    if args.history_window < args.flaky_min_runs:
+        parser.error(f"--history-window ({args.history_window}) must be at least --flaky-min-runs ({args.flaky_min_runs})")
+    # The duration baseline comes from the runs before the latest one
+    if args.history_window <= SLOWDOWN_MIN_SAMPLES:
+        parser.error(f"--history-window must be at least {SLOWDOWN_MIN_SAMPLES + 1} "
+                     f"({SLOWDOWN_MIN_SAMPLES} earlier runs for the duration baseline, plus the latest)")
+    return args
 
 
 def load_json(path: str) -> dict[str, Any] | None:
@@ -80,17 +237,228 @@ def load_json(path: str) -> dict[str, Any] | None:
 
 
 def save_json(path: str, data: dict[str, Any]) -> None:
-    """Write JSON to file with pretty formatting."""
-    os.makedirs(os.path.dirname(path) if os.path.dirname(path) else ".", exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    """
+    Write JSON to file with pretty formatting, atomically.
+
+    The data goes to a temporary file in the same directory, which is
+    flushed to disk and renamed over `path`, so readers see either the old
+    or the new file and never a partly written one.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path: str, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on `path` + ".lock" for the with-block.
+
+    Waits at most `timeout` seconds for another holder, then raises
+    TimeoutError. The lock file is left in place: removing it would let a
+    waiting process lock a file that a newcomer has already replaced.
+    """
+    lock_path = path + ".lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    deadline = time.monotonic() + timeout
+    with open(lock_path, "a+") as f:
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{lock_path} still locked after {timeout:g}s") from None
+                time.sleep(LOCK_POLL)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def suite_feature(title: str, feature_name: str) -> str:
+    """Feature name for a suite: its own title if it is a feature-level suite, else the parent's."""
+    # Detect feature-level suite (title starts with "Feature:")
+    if title.startswith("Feature:") or (
+        not feature_name and title and not title.endswith(".feature")
+    ):
+        # Clean up feature title
+        return title.replace("Feature:", "").strip() or title
+    return feature_name
+
+
+def test_keys(spec: dict[str, Any], file: str | None) -> list[tuple]:
+    """
+    (file, line, project) identity of each test in a spec.
+
+    The same spec can be reported more than once (under the top-level
+    suites and again under config.projects); these keys let each test be
+    counted exactly once. Specs without a line number fall back to their
+    title so distinct specs never share a key.
+    """
+    file = spec.get("file") or file
+    line = spec.get("line")
+    where = line if line is not None else spec.get("title")
+    tests = spec.get("tests") or []
+    if not tests:
+        return [(file, where, None)]
+    return [(file, where, test.get("projectName") or test.get("projectId")) for test in tests]
+
+
+def test_id(key: tuple) -> str:
+    """JSON-safe form of a test_keys() key: "file:line", plus " [project]" when there is one."""
+    file, where, project = key
+    return f"{file}:{where} [{project}]" if project else f"{file}:{where}"
+
+
+def spec_scenario(
+    spec: dict[str, Any],
+    feature_name: str,
+    seen: set[tuple] | None = None,
+    file: str | None = None,
+) -> dict[str, Any] | None:
+    """
+    Reduce one Playwright spec (all its tests and retries) to a scenario result.
+
+    With `seen`, tests whose (file, line, project) key is already in the set
+    are skipped and the new keys are added; returns None if every test of
+    the spec was already counted. `file` is the enclosing suite's file, used
+    when the spec does not name its own.
+    """
+    scenario_title = spec.get("title", "Unknown")
+    tests = spec.get("tests", [])
+    spec_file = spec.get("file") or file
+    line = spec.get("line")
+    keys = test_keys(spec, file)
+    if seen is not None:
+        fresh = [key not in seen for key in keys]
+        if not any(fresh):
+            return None
+        seen.update(keys)
+        if tests and not all(fresh):
+            tests = [test for test, new in zip(tests, fresh) if new]
+            keys = [key for key, new in zip(keys, fresh) if new]
+
+    # A spec may have multiple tests (e.g., across projects/browsers)
+    # We take the worst status across all tests
+    worst_status = "PASSED"
+    total_duration = 0
+    error_msg = None
+    trace_path = None
+    flaky = False
+    test_durations = {test_id(key): 0 for key in keys}
+
+    for test, key in zip(tests, keys):
+        # Passed and failed attempts of the same test in one run (retries)
+        attempts = set()
+        if test.get("status") == "flaky":
+            flaky = True
+        for result in test.get("results", []):
+            raw_status = result.get("status", "failed")
+            mapped = STATUS_MAP.get(raw_status, "ERROR")
+            total_duration += result.get("duration", 0)
+            test_durations[test_id(key)] += result.get("duration", 0)
+            attempts.add(mapped)
+
+            if STATUS_PRIORITY.get(mapped, 3) > STATUS_PRIORITY.get(worst_status, 0):
+                worst_status = mapped
+
+            # Capture error from first failure
+            if mapped in ("FAILED", "ERROR") and error_msg is None:
+                errors = result.get("errors", [])
+                if errors:
+                    first_err = errors[0]
+                    if isinstance(first_err, dict):
+                        error_msg = first_err.get("message", str(first_err))
+                    elif isinstance(first_err, str):
+                        error_msg = first_err
+
+            # Capture trace path
+            for att in result.get("attachments", []):
+                if att.get("name") == "trace" and att.get("path"):
+                    trace_path = att["path"]
+        if "PASSED" in attempts and attempts & {"FAILED", "ERROR"}:
+            flaky = True
+
+    return {
+        "feature": feature_name or "Unknown Feature",
+        "scenario": scenario_title,
+        "status": worst_status,
+        "duration": total_duration,
+        "error": error_msg,
+        "trace": trace_path,
+        "location": f"{spec_file}:{line}" if spec_file and line is not None else None,
+        "tests": test_durations,
+        "flaky": flaky,
+    }
+
+
+def iter_suite_scenarios(
+    suites: list[dict],
+    feature_name: str = "",
+    seen: set[tuple] | None = None,
+    file: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield one scenario per spec in a decoded list of suites and their nested suites.
+
+    Walks depth-first with an explicit stack (no recursion, so describe
+    blocks can nest arbitrarily deep), visiting a suite's specs before its
+    child suites, in file order. `seen` de-duplicates as in spec_scenario.
+    """
+    stack = [(suite, feature_name, file) for suite in reversed(suites)]
+    while stack:
+        suite, parent_feature, parent_file = stack.pop()
+        if not isinstance(suite, dict):
+            continue
+        current_feature = suite_feature(suite.get("title", ""), parent_feature)
+        current_file = suite.get("file") or parent_file
+
+        # Process specs (scenarios)
+        for spec in suite.get("specs") or []:
+            scenario = spec_scenario(spec, current_feature, seen, current_file)
+            if scenario is not None:
+                yield scenario
+
+        # Nested suites, pushed in reverse so they are visited in order
+        stack.extend((child, current_feature, current_file) for child in reversed(suite.get("suites") or []))
 
 
 def extract_scenarios(results: dict[str, Any]) -> list[dict[str, Any]]:
     """
     Walk the Playwright JSON reporter structure and extract per-scenario results.
 
+    The top-level suites, any config.projects[].suites, and a root that is
+    itself a suite (has "specs") are walked in one pass. Each test is
+    counted once per (file, line, project), however many times the report
+    lists it.
+
     Returns a list of dicts:
         {
             "feature": "Feature Name",
@@ -99,105 +467,190 @@ def extract_scenarios(results: dict[str, Any]) -> list[dict[str, Any]]:
             "duration": 1234,
             "error": "error message" | None,
             "trace": "path/to/trace.zip" | None,
+            "location": "features/x.feature.spec.js:12" | None,
+            "tests": {"file:line [project]": duration, ...},  # each test counted
+            "flaky": True if a test both passed and failed across its retries,
         }
     """
-    scenarios = []
-
-    def walk_suites(suites: list[dict], feature_name: str = "") -> None:
-        for suite in suites:
-            title = suite.get("title", "")
-
-            # Detect feature-level suite (title starts with "Feature:")
-            current_feature = feature_name
-            if title.startswith("Feature:") or (
-                not feature_name and title and not title.endswith(".feature")
-            ):
-                # Clean up feature title
-                current_feature = title.replace("Feature:", "").strip() or title
-
-            # Process specs (scenarios)
-            for spec in suite.get("specs", []):
-                scenario_title = spec.get("title", "Unknown")
-
-                # A spec may have multiple tests (e.g., across projects/browsers)
-                # We take the worst status across all tests
-                worst_status = "PASSED"
-                total_duration = 0
-                error_msg = None
-                trace_path = None
-
-                for test in spec.get("tests", []):
-                    for result in test.get("results", []):
-                        raw_status = result.get("status", "failed")
-                        mapped = STATUS_MAP.get(raw_status, "ERROR")
-                        total_duration += result.get("duration", 0)
-
-                        # Track worst status: ERROR > FAILED > NOT_RUN > PASSED
-                        priority = {"PASSED": 0, "NOT_RUN": 1, "FAILED": 2, "ERROR": 3}
-                        if priority.get(mapped, 3) > priority.get(worst_status, 0):
-                            worst_status = mapped
-
-                        # Capture error from first failure
-                        if mapped in ("FAILED", "ERROR") and error_msg is None:
-                            errors = result.get("errors", [])
-                            if errors:
-                                first_err = errors[0]
-                                if isinstance(first_err, dict):
-                                    error_msg = first_err.get("message", str(first_err))
-                                elif isinstance(first_err, str):
-                                    error_msg = first_err
-
-                        # Capture trace path
-                        for att in result.get("attachments", []):
-                            if att.get("name") == "trace" and att.get("path"):
-                                trace_path = att["path"]
-
-                scenarios.append(
-                    {
-                        "feature": current_feature or "Unknown Feature",
-                        "scenario": scenario_title,
-                        "status": worst_status,
-                        "duration": total_duration,
-                        "error": error_msg,
-                        "trace": trace_path,
-                    }
-                )
-
-            # Recurse into nested suites
-            if suite.get("suites"):
-                walk_suites(suite["suites"], current_feature)
-
-    # The top-level structure has suites at the root or under projects
-    # Handle both structures
-    top_suites = results.get("suites", [])
-    if top_suites:
-        walk_suites(top_suites)
+    # A root with specs is a suite itself; otherwise its suites are the roots
+    roots = [results] if "specs" in results else list(results.get("suites") or [])
 
     # Also check projects (Playwright v1.40+ structure)
-    for project in results.get("config", {}).get("projects", []):
-        if "suites" in project:
-            walk_suites(project["suites"])
+    config = results.get("config") or {}
+    for project in config.get("projects", []) if isinstance(config, dict) else []:
+        if isinstance(project, dict) and project.get("suites"):
+            roots.extend(project["suites"])
 
-    # Handle the common structure where suites are nested under a root suite
-    if not scenarios:
-        # Try walking from the root differently
-        for key in ("suites", "specs"):
-            if key in results:
-                walk_suites(results[key] if isinstance(results[key], list) else [results])
-                if scenarios:
-                    break
+    return list(iter_suite_scenarios(roots, seen=set()))
+
+
+def stream_scenarios(path: str) -> Iterator[dict[str, Any]]:
+    """
+    Stream per-scenario results from a Playwright JSON reporter file.
+
+    Yields the same dicts as extract_scenarios while reading the file
+    incrementally: the suite tree is walked key by key and each spec is
+    decoded on its own, so only one spec (plus the small config section)
+    is held in memory at a time. Only the (file, line, project) keys of
+    counted tests are kept for de-duplication. Raises OSError or
+    ValueError if the file cannot be read or is not valid JSON; scenarios
+    yielded before the error have already been handed out.
+    """
+    seen: set[tuple] = set()
+    with open(path, "r", encoding="utf-8") as f:
+        reader = JSONStream(f)
+        config: Any = {}
+        root: dict[str, Any] = {}
+
+        for key in reader.iter_object():
+            if key == "suites" and reader.peek() == "[":
+                yield from stream_suites(reader, seen)
+            elif key == "config":
+                config = reader.read_value()
+            elif key in ("specs", "title", "file"):
+                # A root that is itself a suite (no "suites" wrapper)
+                root[key] = reader.read_value()
+            else:
+                reader.read_value()
+        reader.end()
+
+    if root.get("specs"):
+        yield from iter_suite_scenarios([root], seen=seen)
+
+    # Also check projects (Playwright v1.40+ structure)
+    projects = config.get("projects", []) if isinstance(config, dict) else []
+    for project in projects:
+        if isinstance(project, dict) and project.get("suites"):
+            yield from iter_suite_scenarios(project["suites"], seen=seen)
+
+
+def stream_suites(reader: JSONStream, seen: set[tuple]) -> Iterator[dict[str, Any]]:
+    """
+    Walk a streamed array of suites, yielding one scenario per spec.
+
+    Uses an explicit stack of open arrays and suite objects rather than
+    recursion. A suite's specs and child suites are streamed once its
+    title (and so its feature) is known; in the rare file where they come
+    before the title, they are decoded and walked once the suite closes.
+    """
+    # Frames: ["array", element iterator, feature, file] or
+    #         ["suite", key iterator, parent feature, feature or None, file, deferred values]
+    stack: list[list] = [["array", reader.iter_array(), "", None]]
+    while stack:
+        frame = stack[-1]
+        if frame[0] == "array":
+            if next(frame[1], None) is None:
+                stack.pop()
+            elif reader.peek() == "{":
+                stack.append(["suite", reader.iter_object(), frame[2], None, frame[3], []])
+            else:
+                reader.read_value()
+            continue
+
+        _, keys, parent, feature, file, deferred = frame
+        key = next(keys, None)
+        if key is None:
+            stack.pop()
+            if deferred:
+                feature = suite_feature("", parent) if feature is None else feature
+                for name, value in deferred:
+                    if name == "specs":
+                        for spec in value:
+                            scenario = spec_scenario(spec, feature, seen, file)
+                            if scenario is not None:
+                                yield scenario
+                    else:
+                        yield from iter_suite_scenarios(value, feature, seen, file)
+        elif key == "title":
+            title = reader.read_value()
+            frame[3] = suite_feature(title if isinstance(title, str) else "", parent)
+        elif key == "file":
+            value = reader.read_value()
+            frame[4] = value or file
+        elif key in ("specs", "suites") and reader.peek() == "[":
+            if feature is None:
+                deferred.append((key, reader.read_value()))
+            elif key == "specs":
+                for _ in reader.iter_array():
+                    scenario = spec_scenario(reader.read_value(), feature, seen, file)
+                    if scenario is not None:
+                        yield scenario
+            else:
+                stack.append(["array", reader.iter_array(), feature, file])
+        else:
+            reader.read_value()
+
+
+def resolve_results_files(patterns: list[str], project_dir: Path) -> list[Path]:
+    """
+    Expand --results-file arguments into a de-duplicated list of paths.
+
+    Relative paths are taken from the project directory. A pattern with
+    glob characters expands to its sorted matches and raises
+    FileNotFoundError if nothing matches; a plain path is kept as given so
+    a missing file is reported when it is read.
+    """
+    paths: list[Path] = []
+    for pattern in patterns:
+        full = pattern if os.path.isabs(pattern) else str(project_dir / pattern)
+        if any(char in pattern for char in "*?["):
+            matches = sorted(glob.glob(full))
+            if not matches:
+                raise FileNotFoundError(full)
+            paths.extend(Path(match) for match in matches)
+        else:
+            paths.append(Path(full))
+    return list(dict.fromkeys(paths))
 
-    return scenarios
+
+def read_results_file(path: str) -> list[dict[str, Any]]:
+    """Parse one results file in a worker process (see iter_results_files)."""
+    gc.disable()
+    try:
+        return list(stream_scenarios(path))
+    finally:
+        gc.enable()
+
+
+def future_scenarios(future: Future) -> Iterator[dict[str, Any]]:
+    """Scenarios of a worker's parse, waiting for it (and raising its error) on first use."""
+    yield from future.result()
+
+
+def iter_results_files(paths: list[Path], jobs: int) -> Iterator[tuple[Path, Iterable[dict[str, Any]]]]:
+    """
+    Yield (path, scenarios) for each results file, in the given order.
+
+    A single file (or --jobs 1) is streamed in this process. Several files
+    are parsed in parallel by up to `jobs` worker processes, but are still
+    handed out file by file in the given order, so the merged grouping does
+    not depend on which shard finishes first. A file's read or parse error
+    is raised while its scenarios are iterated.
+    """
+    if jobs <= 1 or len(paths) == 1:
+        for path in paths:
+            yield path, stream_scenarios(str(path))
+        return
+
+    pool = ProcessPoolExecutor(max_workers=min(jobs, len(paths)))
+    try:
+        futures = [pool.submit(read_results_file, str(path)) for path in paths]
+        for path, future in zip(paths, futures):
+            yield path, future_scenarios(future)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 def group_scenario_outlines(
-    scenarios: list[dict[str, Any]],
+    scenarios: Iterable[dict[str, Any]],
 ) -> dict[str, dict[str, dict[str, Any]]]:
     """
     Group scenarios by feature and base title.
 
     For Scenario Outlines, multiple results may share the same base title
     (with different example row suffixes). We group them and take the worst status.
+    `scenarios` may be any iterable, including stream_scenarios(), so the
+    grouping is built as results are read.
 
     Returns:
         {
@@ -207,51 +660,93 @@ def group_scenario_outlines(
                     "duration": 1234,
                     "error": "..." | None,
                     "trace": "..." | None,
+                    "locations": ["file:line", ...],  # every example row
+                    "tests": {"file:line [project]": duration, ...},
+                    "flaky": True | False,  # any row passed and failed across retries
                 }
             }
         }
     """
     grouped: dict[str, dict[str, dict[str, Any]]] = {}
-    priority = {"PASSED": 0, "NOT_RUN": 1, "FAILED": 2, "ERROR": 3}
-
     for s in scenarios:
-        feature = s["feature"]
-        # Strip example row indicators from scenario outline titles
-        # Common patterns: "Title (Example #1)", "Title -- row 0"
-        title = s["scenario"]
-        base_title = title
-        for sep in [" (Example #", " -- ", " [", " Example "]:
-            if sep in base_title:
-                base_title = base_title[: base_title.index(sep)]
-
-        if feature not in grouped:
-            grouped[feature] = {}
-
-        if base_title not in grouped[feature]:
-            grouped[feature][base_title] = {
-                "status": s["status"],
-                "duration": s["duration"],
-                "error": s["error"],
-                "trace": s["trace"],
-            }
-        else:
-            existing = grouped[feature][base_title]
-            # Take worst status
-            if priority.get(s["status"], 3) > priority.get(existing["status"], 0):
-                existing["status"] = s["status"]
-                if s["error"]:
-                    existing["error"] = s["error"]
-                if s["trace"]:
-                    existing["trace"] = s["trace"]
-            existing["duration"] += s["duration"]
-
+        add_scenario(grouped, s)
     return grouped
 
 
+def add_scenario(grouped: dict[str, dict[str, dict[str, Any]]], s: dict[str, Any]) -> None:
+    """Fold one scenario result into a grouping (see group_scenario_outlines)."""
+    feature = s["feature"]
+    # Strip example row indicators from scenario outline titles
+    # Common patterns: "Title (Example #1)", "Title -- row 0"
+    title = s["scenario"]
+    base_title = title
+    for sep in [" (Example #", " -- ", " [", " Example "]:
+        if sep in base_title:
+            base_title = base_title[: base_title.index(sep)]
+
+    if feature not in grouped:
+        grouped[feature] = {}
+
+    location = s.get("location")
+    if base_title not in grouped[feature]:
+        grouped[feature][base_title] = {
+            "status": s["status"],
+            "duration": s["duration"],
+            "error": s["error"],
+            "trace": s["trace"],
+            "locations": [location] if location else [],
+            "tests": dict(s.get("tests") or {}),
+            "flaky": s.get("flaky", False),
+        }
+    else:
+        existing = grouped[feature][base_title]
+        existing["flaky"] = existing["flaky"] or s.get("flaky", False)
+        for test, duration in (s.get("tests") or {}).items():
+            existing["tests"][test] = existing["tests"].get(test, 0) + duration
+        if location and location not in existing["locations"]:
+            existing["locations"].append(location)
+        # Take worst status
+        if STATUS_PRIORITY.get(s["status"], 3) > STATUS_PRIORITY.get(existing["status"], 0):
+            existing["status"] = s["status"]
+            if s["error"]:
+                existing["error"] = s["error"]
+            if s["trace"]:
+                existing["trace"] = s["trace"]
+        existing["duration"] += s["duration"]
+
+
+def digest_failure_traces(grouped: dict[str, dict[str, dict[str, Any]]], project_dir: Path) -> tuple[int, int, int]:
+    """
+    Attach a trace_digest to every FAILED or ERROR result that has a trace.
+
+    Relative trace paths are taken from the project directory; missing or
+    unreadable traces are skipped with a warning. Returns (traces digested,
+    bytes read, total size of those traces).
+    """
+    digested = bytes_read = trace_bytes = 0
+    for feature in grouped.values():
+        for result in feature.values():
+            if result["status"] not in ("FAILED", "ERROR") or not result["trace"]:
+                continue
+            path = result["trace"] if os.path.isabs(result["trace"]) else str(project_dir / result["trace"])
+            if not os.path.exists(path):
+                continue
+            try:
+                digest = digest_trace(path)
+            except (OSError, ValueError) as e:
+                print(f"WARNING: Cannot digest trace {path}: {e}", file=sys.stderr)
+                continue
+            bytes_read += digest.pop("bytes_read")
+            trace_bytes += digest.pop("trace_bytes")
+            result["trace_digest"] = digest
+            digested += 1
+    return digested, bytes_read, trace_bytes
+
+
 def create_empty_meta(app: str, cycle: int) -> dict[str, Any]:
     """Create an empty .prover-meta.json structure."""
     return {
-        "version": "1.0",
+        "version": META_VERSION,
         "skill": "webapp-prover",
         "app": app,
         "status": "in_progress",
@@ -263,109 +758,453 @@ def create_empty_meta(app: str, cycle: int) -> dict[str, Any]:
             "passed": 0,
             "failed": 0,
             "exhausted": 0,
+            "quarantined": 0,
             "not_run": 0,
         },
         "features": {},
     }
 
 
+def summary_bucket(status: str) -> str:
+    """Summary counter a scenario status counts towards."""
+    if status == "PASSED":
+        return "passed"
+    if status == "EXHAUSTED":
+        return "exhausted"
+    if status == "QUARANTINED":
+        return "quarantined"
+    if status in ("FAILED", "ERROR"):
+        return "failed"
+    return "not_run"
+
+
+def compute_summary(features: dict[str, Any]) -> dict[str, int]:
+    """Count every scenario's status from scratch."""
+    summary = {"total": 0, "passed": 0, "failed": 0, "exhausted": 0, "quarantined": 0, "not_run": 0}
+    for feat in features.values():
+        for sc in feat.get("scenarios", {}).values():
+            summary["total"] += 1
+            summary[summary_bucket(sc.get("status", "NOT_RUN"))] += 1
+    return summary
+
+
+def migrate_meta(meta: dict[str, Any], history_window: int) -> list[dict[str, Any]]:
+    """
+    Bring an older meta file up to META_VERSION.
+
+    Version 1.0 kept every history entry in the meta file and recomputed the
+    summary each cycle. The summary is recounted once here (later cycles
+    maintain it incrementally), each history is cut to the last
+    `history_window` entries, and all existing entries are returned so they
+    can be written to the cycle log, which did not exist before. Version
+    1.1 already has a log and only gains the "quarantined" counter.
+    """
+    records = []
+    has_log = "history_log" in meta
+    for feature_name, feat in meta.get("features", {}).items():
+        for scenario_name, sc in feat.get("scenarios", {}).items():
+            history = sc.get("history", [])
+            if not has_log:
+                records.extend(dict(entry, feature=feature_name, scenario=scenario_name) for entry in history)
+            sc["history"] = history[-history_window:] if history_window else []
+    records.sort(key=lambda r: r.get("cycle", 0))
+    meta["summary"] = compute_summary(meta.get("features", {}))
+    meta["version"] = META_VERSION
+    return records
+
+
+def normalize_error_text(text: str) -> str:
+    """Replace paths, IDs, numbers and timings in one line of an error with placeholders.
+
+    Directories are dropped but file names kept. HTTP statuses (a 1xx-5xx
+    number after "status", "HTTP", "response", "expected" and the like)
+    are kept, since a 404 and a 500 are different root causes.
+    """
+    text = PATH_RE.sub(r"\1", text)
+    text = UUID_RE.sub("<id>", text)
+    text = HEX_ID_RE.sub("<id>", text)
+    pieces, last = [], 0
+    for match in HTTP_STATUS_RE.finditer(text):
+        pieces.append(NUMBER_RE.sub("N", text[last:match.start(1)]))
+        pieces.append(match.group(1))
+        last = match.end(1)
+    pieces.append(NUMBER_RE.sub("N", text[last:]))
+    return " ".join("".join(pieces).split())
+
+
+def error_signature(error: str | None) -> str:
+    """
+    Fingerprint of a failure, shared by failures with the same root cause.
+
+    Hashes the first SIGNATURE_LINES lines of the message (the assertion,
+    locator, expected and received values, stopping at Playwright's call
+    log) and the top SIGNATURE_FRAMES stack frames without line numbers,
+    all passed through normalize_error_text.
+    """
+    lines, frames = [], []
+    for raw in ANSI_RE.sub("", error or "").splitlines():
+        frame = FRAME_RE.match(raw)
+        if frame:
+            if len(frames) < SIGNATURE_FRAMES:
+                frames.append(normalize_error_text(frame.group(1)))
+        elif frames or raw.strip().startswith("Call log:"):
+            break
+        elif raw.strip() and len(lines) < SIGNATURE_LINES:
+            lines.append(normalize_error_text(raw))
+    text = "\n".join(lines) + "\n--\n" + "\n".join(frames)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def error_headline(error: str | None) -> str:
+    """First non-empty line of an error, without color codes."""
+    for line in ANSI_RE.sub("", error or "").splitlines():
+        if line.strip():
+            return line.strip()
+    return "(no error message)"
+
+
+def cluster_failures(meta: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Group FAILED and ERROR scenarios by the error signature of their latest run.
+
+    Returns clusters, largest first: {"signature", "headline", "frame",
+    "scenarios": [{"feature", "scenario", "status"}]}, where headline and
+    frame come from the cluster's first scenario. Fixing a cluster's root
+    cause should clear all of its scenarios at once.
+    """
+    clusters: dict[str, dict[str, Any]] = {}
+    for feat_name, feat in meta.get("features", {}).items():
+        for sc_name, sc in feat.get("scenarios", {}).items():
+            if sc["status"] not in ("FAILED", "ERROR"):
+                continue
+            latest = sc["history"][-1] if sc.get("history") else {}
+            error = latest.get("error")
+            signature = latest.get("signature") or error_signature(error)
+            if signature not in clusters:
+                frame = next((m.group(1).strip() for m in map(FRAME_RE.match, (error or "").splitlines()) if m), "")
+                clusters[signature] = {
+                    "signature": signature,
+                    "headline": error_headline(error),
+                    "frame": frame,
+                    "scenarios": [],
+                }
+            clusters[signature]["scenarios"].append({"feature": feat_name, "scenario": sc_name, "status": sc["status"]})
+    return sorted(clusters.values(), key=lambda c: (-len(c["scenarios"]), c["headline"]))
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (0 < q <= 100) of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+def duration_baseline(history: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """
+    Median and p95 duration of the PASSED runs in a history, or None.
+
+    Failed runs are left out: timeouts and early aborts say nothing about
+    how fast the app is. None until SLOWDOWN_MIN_SAMPLES runs are known.
+    """
+    durations = [e["duration"] for e in history if e.get("status") == "PASSED" and e.get("duration") is not None]
+    if len(durations) < SLOWDOWN_MIN_SAMPLES:
+        return None
+    return {
+        "median": round(statistics.median(durations)),
+        "p95": round(percentile(durations, 95)),
+        "samples": len(durations),
+    }
+
+
+def is_slowdown(duration: float, baseline: dict[str, Any], threshold: float) -> bool:
+    """Whether a duration is significantly above a baseline (see SLOWDOWN_THRESHOLD)."""
+    return (
+        duration > baseline["p95"]
+        and duration >= baseline["median"] * (1 + threshold)
+        and duration - baseline["median"] >= SLOWDOWN_MIN_DELTA
+    )
+
+
+def detect_slowdowns(meta: dict[str, Any], cycle: int, threshold: float) -> dict[str, Any]:
+    """
+    Collect the cycle's slowdowns from the scenarios' latest history entries.
+
+    Scenario slowdowns are the entries update_meta marked "slowdown". A
+    feature is compared on the scenarios of it that passed this cycle and
+    have a baseline of at least SLOWDOWN_MIN_SAMPLES runs: their summed
+    duration against their summed medians and p95s, so a partial rerun is
+    compared like for like.
+    """
+    scenarios, features = [], []
+    for feat_name, feat in meta.get("features", {}).items():
+        duration = median = p95 = count = 0
+        for sc_name, sc in feat.get("scenarios", {}).items():
+            latest = sc["history"][-1] if sc.get("history") else {}
+            baseline = sc.get("duration_baseline")
+            if latest.get("cycle") != cycle or latest.get("status") != "PASSED" or not baseline:
+                continue
+            if baseline.get("samples", 0) < SLOWDOWN_MIN_SAMPLES:
+                continue  # too thin a baseline to compare against
+            duration += latest["duration"]
+            median += baseline["median"]
+            p95 += baseline["p95"]
+            count += 1
+            if latest.get("slowdown"):
+                scenarios.append({
+                    "feature": feat_name,
+                    "scenario": sc_name,
+                    "duration": latest["duration"],
+                    "median": baseline["median"],
+                    "p95": baseline["p95"],
+                    "ratio": latest["slowdown"],
+                })
+        if count and median and is_slowdown(duration, {"median": median, "p95": p95}, threshold):
+            features.append({
+                "feature": feat_name,
+                "duration": duration,
+                "median": median,
+                "p95": p95,
+                "ratio": round(duration / median, 2),
+                "scenarios": count,
+            })
+    scenarios.sort(key=lambda x: -x["ratio"])
+    features.sort(key=lambda x: -x["ratio"])
+    return {"cycle": cycle, "threshold": threshold, "features": features, "scenarios": scenarios}
+
+
+def trailing_failures(history: list[dict[str, Any]]) -> int:
+    """Number of FAILED/ERROR entries at the end of a history."""
+    count = 0
+    for entry in reversed(history):
+        if entry.get("status") not in ("FAILED", "ERROR"):
+            break
+        count += 1
+    return count
+
+
+def flaky_score(history: list[dict[str, Any]]) -> tuple[float, int]:
+    """
+    Flakiness of a scenario over its history window: (score, runs counted).
+
+    Only runs that passed or failed count. The score is the number of
+    pass/fail flips between consecutive runs plus the number of runs that
+    were flaky in themselves (a test passed and failed across retries),
+    divided by the number of runs, capped at 1. A flip to PASSED right
+    after a run with a recorded "fix" is the fix working, not noise, and
+    does not count.
+    """
+    runs = [entry for entry in history if entry.get("status") in ("PASSED", "FAILED", "ERROR")]
+    if not runs:
+        return 0.0, 0
+    noise = sum(1 for entry in runs if entry.get("flaky"))
+    for previous, current in zip(runs, runs[1:]):
+        passed, passed_before = current["status"] == "PASSED", previous["status"] == "PASSED"
+        if passed != passed_before and not (passed and previous.get("fix")):
+            noise += 1
+    return min(noise / len(runs), 1.0), len(runs)
+
+
 def update_meta(
     meta: dict[str, Any],
     grouped: dict[str, dict[str, dict[str, Any]]],
     cycle: int,
+    history_window: int = HISTORY_WINDOW,
+    cycle_log: list[dict[str, Any]] | None = None,
+    flaky_threshold: float = FLAKY_THRESHOLD,
+    flaky_min_runs: int = FLAKY_MIN_RUNS,
+    slowdown_threshold: float = SLOWDOWN_THRESHOLD,
 ) -> dict[str, Any]:
     """
     Update .prover-meta.json with results from the current cycle.
+
+    Each scenario keeps only its last `history_window` history entries; the
+    full record of this cycle (untruncated errors and durations) is appended
+    to `cycle_log` for the append-only cycle log. The summary counters are
+    adjusted as scenarios change status rather than recounted.
+
+    A scenario already recorded for `cycle` (another shard of the same
+    cycle, ingested separately) has the result merged into that cycle's
+    history entry, worst status winning, rather than a second entry. The
+    entry lists the tests ((file, line, project), see test_id) it counts;
+    tests already listed are not counted again, so parsing the same
+    results twice changes nothing.
+
+    A scenario whose latest run failed and whose flaky_score reaches
+    `flaky_threshold` over at least `flaky_min_runs` runs is QUARANTINED:
+    its results are still recorded and its consecutive failures still
+    counted, but it is not asked to be fixed. It leaves quarantine as soon
+    as it passes, so a fixed regression is not held there by its old flips,
+    and once it reaches EXHAUSTION_THRESHOLD consecutive failures, when it
+    is EXHAUSTED as usual. The cycle log records each run's own status
+    (PASSED, FAILED, ...), flagging quarantined runs, never the
+    QUARANTINED or EXHAUSTED verdict.
+
+    Each scenario's duration_baseline (median and p95 of its earlier
+    passing runs) is refreshed, a passing run well above it is marked
+    "slowdown" in its history entry, and meta["slowdowns"] lists this
+    cycle's slow scenarios and features (see detect_slowdowns), apart
+    from pass/fail status.
     """
     meta["current_cycle"] = cycle
+    meta["history_window"] = history_window
 
     features = meta.get("features", {})
+    summary = meta["summary"]
 
     for feature_name, scenarios in grouped.items():
         if feature_name not in features:
             features[feature_name] = {"source": "", "scenarios": {}}
 
         for scenario_name, result in scenarios.items():
-            scenario_data = features[feature_name]["scenarios"].get(
-                scenario_name,
-                {
-                    "status": "NOT_RUN",
-                    "history": [],
-                    "consecutive_failures": 0,
-                    "exhausted": False,
-                },
-            )
+            known = features[feature_name]["scenarios"].get(scenario_name)
+            scenario_data = known or {
+                "status": "NOT_RUN",
+                "history": [],
+                "consecutive_failures": 0,
+                "exhausted": False,
+            }
 
             # Skip exhausted scenarios
             if scenario_data.get("exhausted", False):
                 continue
-
-            # Build history entry
-            history_entry: dict[str, Any] = {
-                "cycle": cycle,
-                "status": result["status"],
-            }
-            if result["error"]:
-                # Truncate long error messages
-                error_text = result["error"]
-                if len(error_text) > 500:
-                    error_text = error_text[:500] + "..."
-                history_entry["error"] = error_text
-            if result["trace"]:
-                history_entry["trace"] = result["trace"]
-
-            scenario_data["history"].append(history_entry)
-            scenario_data["status"] = result["status"]
-
-            # Update consecutive failures
-            if result["status"] in ("FAILED", "ERROR"):
-                scenario_data["consecutive_failures"] = (
-                    scenario_data.get("consecutive_failures", 0) + 1
-                )
-                if scenario_data["consecutive_failures"] >= EXHAUSTION_THRESHOLD:
-                    scenario_data["exhausted"] = True
-                    scenario_data["status"] = "EXHAUSTED"
+            previous_status = scenario_data.get("status", "NOT_RUN")
+            history = scenario_data["history"]
+            signature = error_signature(result["error"]) if result["error"] else None
+
+            # A second ingestion of this cycle (a shard parsed separately, or
+            # the parser re-run) folds into the cycle's entry, worst status
+            # winning, instead of counting the cycle twice
+            merged = bool(history) and history[-1].get("cycle") == cycle
+            tests = result.get("tests") or {}
+            if merged:
+                history_entry = history[-1]
+                counted = history_entry.setdefault("tests", [])
+                fresh = [test for test in tests if test not in counted]
+                if tests and not fresh:
+                    continue  # the same tests parsed again: already counted
+                counted.extend(fresh)
+                duration = sum(tests[test] for test in fresh) if tests else result["duration"]
+                history_entry["duration"] = history_entry.get("duration", 0) + duration
+                replace = STATUS_PRIORITY.get(result["status"], 3) > STATUS_PRIORITY.get(history_entry["status"], 0)
+            else:
+                if history:
+                    history[-1].pop("tests", None)  # only the open cycle needs its test list
+                history_entry = {"cycle": cycle, "status": result["status"], "duration": result["duration"]}
+                if tests:
+                    history_entry["tests"] = list(tests)
+                history.append(history_entry)
+                if len(history) > history_window:
+                    del history[: len(history) - history_window]
+                replace = True
+
+            if replace:
+                history_entry["status"] = result["status"]
+                for key in ("error", "signature", "trace"):
+                    history_entry.pop(key, None)
+                if result["error"]:
+                    # Truncate long error messages; the signature uses the full text
+                    error_text = result["error"]
+                    if len(error_text) > 500:
+                        error_text = error_text[:500] + "..."
+                    history_entry["error"] = error_text
+                    history_entry["signature"] = signature
+                if result["trace"]:
+                    history_entry["trace"] = result["trace"]
+                # The digest describes the latest failing run only
+                if result.get("trace_digest"):
+                    scenario_data["trace_digest"] = result["trace_digest"]
+                else:
+                    scenario_data.pop("trace_digest", None)
+            if result.get("flaky"):
+                history_entry["flaky"] = True
+
+            # Duration baseline from the earlier runs; this run is compared to it
+            baseline = duration_baseline(history[:-1])
+            history_entry.pop("slowdown", None)
+            if baseline is None:
+                scenario_data.pop("duration_baseline", None)
+            else:
+                scenario_data["duration_baseline"] = baseline
+                duration = history_entry["duration"]
+                if history_entry["status"] == "PASSED" and is_slowdown(duration, baseline, slowdown_threshold):
+                    history_entry["slowdown"] = round(duration / max(baseline["median"], 1), 2)
+
+            scenario_data["status"] = history_entry["status"]
+            if result.get("locations"):
+                locations = scenario_data.get("locations", []) if merged else []
+                scenario_data["locations"] = locations + [loc for loc in result["locations"] if loc not in locations]
+
+            score, runs = flaky_score(scenario_data["history"])
+            scenario_data["flaky_score"] = round(score, 2)
+
+            # Update consecutive failures, quarantined or not
+            if history_entry["status"] in ("FAILED", "ERROR"):
+                if merged:
+                    # Count the failing run at the end of the history instead of
+                    # adding to a count this cycle may already include
+                    scenario_data["consecutive_failures"] = trailing_failures(history)
+                else:
+                    scenario_data["consecutive_failures"] = (
+                        scenario_data.get("consecutive_failures", 0) + 1
+                    )
             else:
                 scenario_data["consecutive_failures"] = 0
 
+            # A scenario failing EXHAUSTION_THRESHOLD times in a row is broken,
+            # not flaky: it leaves quarantine and exhausts like any other
+            scenario_data["quarantined"] = (
+                history_entry["status"] in ("FAILED", "ERROR") and runs >= flaky_min_runs and score >= flaky_threshold
+                and scenario_data["consecutive_failures"] < EXHAUSTION_THRESHOLD
+            )
+            if scenario_data["quarantined"]:
+                scenario_data["status"] = "QUARANTINED"
+            elif scenario_data["consecutive_failures"] >= EXHAUSTION_THRESHOLD:
+                scenario_data["exhausted"] = True
+                scenario_data["status"] = "EXHAUSTED"
+
             features[feature_name]["scenarios"][scenario_name] = scenario_data
 
-    meta["features"] = features
+            # Adjust the summary counters for this scenario's change
+            if known is None:
+                summary["total"] += 1
+            else:
+                summary[summary_bucket(previous_status)] -= 1
+            summary[summary_bucket(scenario_data["status"])] += 1
+
+            if cycle_log is not None:
+                # The run's own outcome, not the QUARANTINED/EXHAUSTED verdict
+                record = {
+                    "cycle": cycle,
+                    "feature": feature_name,
+                    "scenario": scenario_name,
+                    "status": history_entry["status"],
+                    "duration": history_entry["duration"],
+                }
+                if result["error"]:
+                    record["error"] = result["error"]
+                    record["signature"] = signature
+                if result["trace"]:
+                    record["trace"] = result["trace"]
+                if result.get("flaky"):
+                    record["flaky"] = True
+                if scenario_data["quarantined"]:
+                    record["quarantined"] = True
+                cycle_log.append(record)
 
-    # Recompute summary
-    total = 0
-    passed = 0
-    failed = 0
-    exhausted = 0
-    not_run = 0
+    meta["features"] = features
+    meta["slowdowns"] = detect_slowdowns(meta, cycle, slowdown_threshold)
 
-    for feat in features.values():
-        for sc in feat.get("scenarios", {}).values():
-            total += 1
-            status = sc.get("status", "NOT_RUN")
-            if status == "PASSED":
-                passed += 1
-            elif status == "EXHAUSTED":
-                exhausted += 1
-            elif status in ("FAILED", "ERROR"):
-                failed += 1
-            else:
-                not_run += 1
-
-    meta["summary"] = {
-        "total": total,
-        "passed": passed,
-        "failed": failed,
-        "exhausted": exhausted,
-        "not_run": not_run,
-    }
+    total = summary["total"]
+    passed = summary["passed"]
+    failed = summary["failed"]
+    exhausted = summary["exhausted"]
+    quarantined = summary["quarantined"]
 
     # Determine overall status
     if total == 0:
         meta["status"] = "in_progress"
     elif passed == total:
         meta["status"] = "passed"
-    elif failed == 0 and exhausted > 0:
+    elif failed == 0 and exhausted + quarantined > 0:
         meta["status"] = "partial"
     elif cycle >= meta.get("max_cycles", 10):
         meta["status"] = "failed"
@@ -375,77 +1214,235 @@ def update_meta(
     return meta
 
 
+def build_rerun_manifest(meta: dict[str, Any], cycle: int, sample: int = 0) -> dict[str, Any]:
+    """
+    Select the scenarios worth running next cycle.
+
+    Every FAILED or ERROR scenario that is not exhausted is included, and
+    every QUARANTINED one, so it keeps producing the evidence that can
+    release it. Up to `sample` PASSED scenarios chosen at random (seeded by
+    app and cycle, so the choice is reproducible and rotates between
+    cycles) are added unless nothing is failing or quarantined. `args` is the Playwright
+    selection to use: the scenarios' file:line locations when every one is
+    known, else a --grep pattern of their titles (which may also match
+    same-named scenarios in other features). An empty `scenarios` list
+    means there is nothing to rerun — not "run everything".
+    """
+    failing, quarantined, passing = [], [], []
+    for feat_name, feat in meta.get("features", {}).items():
+        for sc_name, sc in feat.get("scenarios", {}).items():
+            if sc.get("exhausted"):
+                continue
+            entry = {
+                "feature": feat_name,
+                "scenario": sc_name,
+                "status": sc["status"],
+                "locations": sc.get("locations", []),
+            }
+            if sc["status"] in ("FAILED", "ERROR"):
+                failing.append(entry)
+            elif sc["status"] == "QUARANTINED":
+                quarantined.append(entry)
+            elif sc["status"] == "PASSED":
+                passing.append(entry)
+
+    sampled: list[dict[str, Any]] = []
+    if (failing or quarantined) and sample > 0 and passing:
+        rng = random.Random(f"{meta.get('app', '')}:{cycle}")
+        sampled = rng.sample(passing, min(sample, len(passing)))
+
+    scenarios = failing + quarantined + sampled
+    locations = list(dict.fromkeys(loc for entry in scenarios for loc in entry["locations"]))
+    titles = sorted({entry["scenario"] for entry in scenarios})
+    grep = "|".join(GREP_SPECIAL_RE.sub(lambda m: "\\" + m.group(), title) for title in titles)
+    if not scenarios:
+        args: list[str] = []
+    elif all(entry["locations"] for entry in scenarios):
+        args = locations
+    else:
+        args = ["--grep", grep]
+
+    return {
+        "app": meta.get("app", ""),
+        "cycle": cycle,
+        "failing": len(failing),
+        "quarantined": len(quarantined),
+        "sampled": len(sampled),
+        "scenarios": scenarios,
+        "locations": locations,
+        "grep": grep,
+        "args": args,
+    }
+
+
+def append_cycle_log(path: str, records: list[dict[str, Any]]) -> None:
+    """
+    Append records to the cycle log, one JSON object per line.
+
+    A path ending in .gz is written gzip-compressed; each append adds a new
+    gzip member, which gzip readers (gzip.open, zcat) concatenate.
+    """
+    if not records:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    text = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    if path.endswith(".gz"):
+        import gzip
+
+        with gzip.open(path, "at", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(text)
+
+
 def main() -> int:
     args = parse_args()
 
     project_dir = Path(args.project_dir).resolve()
-    results_path = (
-        Path(args.results_file)
-        if os.path.isabs(args.results_file)
-        else project_dir / args.results_file
-    )
+    try:
+        results_paths = resolve_results_files(args.results_file, project_dir)
+    except FileNotFoundError as e:
+        print(f"ERROR: No results files match: {e}", file=sys.stderr)
+        return 2
     meta_path = (
         Path(args.meta_file)
         if os.path.isabs(args.meta_file)
         else project_dir / args.meta_file
     )
 
-    # Load Playwright results
-    results = load_json(str(results_path))
-    if results is None:
+    # Stream Playwright results, grouping scenarios as they are read; shards
+    # merge into the same grouping, worst status winning. The parse
+    # allocates millions of acyclic containers; pausing the cyclic garbage
+    # collector keeps it from rescanning the growing grouping over and over.
+    grouped: dict[str, dict[str, dict[str, Any]]] = {}
+    results_path = results_paths[0]
+    gc.disable()
+    try:
+        for results_path, scenarios in iter_results_files(results_paths, args.jobs):
+            for s in scenarios:
+                add_scenario(grouped, s)
+    except FileNotFoundError:
+        print(f"ERROR: Cannot read results file: {results_path}", file=sys.stderr)
+        return 2
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Failed to parse {results_path}: {e}", file=sys.stderr)
         print(f"ERROR: Cannot read results file: {results_path}", file=sys.stderr)
         return 2
+    finally:
+        gc.enable()
 
-    # Extract and group scenarios
-    scenarios = extract_scenarios(results)
-    if not scenarios:
+    if not grouped:
         print(
             "WARNING: No scenarios found in results file. "
             "Check that tests ran and the JSON reporter is configured.",
             file=sys.stderr,
         )
         # Still update meta to record the empty cycle
-        grouped: dict[str, dict[str, dict[str, Any]]] = {}
+
+    traces = (0, 0, 0)
+    if not args.no_trace_digest:
+        traces = digest_failure_traces(grouped, project_dir)
+
+    if args.history_log is None:
+        log_path = meta_path.parent / HISTORY_LOG
     else:
-        grouped = group_scenario_outlines(scenarios)
+        log_path = Path(args.history_log) if os.path.isabs(args.history_log) else project_dir / args.history_log
+    history_window = args.history_window
 
-    # Load or create meta
-    meta = load_json(str(meta_path))
-    if meta is None:
-        meta = create_empty_meta(args.app, args.cycle)
+    # Read-merge-write under the meta file lock: parsers for other shards,
+    # apps or jobs sharing the file wait here, but only for the update itself
+    cycle_log: list[dict[str, Any]] = []
+    try:
+        with file_lock(str(meta_path), args.lock_timeout):
+            # Load or create meta
+            meta = load_json(str(meta_path))
+            if meta is None:
+                meta = create_empty_meta(args.app, args.cycle)
+            elif meta.get("version") != META_VERSION or not isinstance(meta.get("summary"), dict):
+                cycle_log.extend(migrate_meta(meta, history_window))
+
+            # Update meta with results
+            meta = update_meta(
+                meta,
+                grouped,
+                args.cycle,
+                history_window,
+                cycle_log,
+                args.flaky_threshold,
+                args.flaky_min_runs,
+                max(args.slowdown_threshold, 0.0),
+            )
+            meta["history_log"] = os.path.relpath(log_path, meta_path.parent)
 
-    # Update meta with results
-    meta = update_meta(meta, grouped, args.cycle)
+            # Append this cycle to the log, then save meta
+            append_cycle_log(str(log_path), cycle_log)
+            save_json(str(meta_path), meta)
+    except TimeoutError as e:
+        print(f"ERROR: Meta file is locked by another parser: {e}", file=sys.stderr)
+        return 2
 
-    # Save meta
-    save_json(str(meta_path), meta)
+    # The optional database does its own locking
+    if args.db:
+        db_path = Path(args.db) if os.path.isabs(args.db) else project_dir / args.db
+        try:
+            import prover_store  # needs sqlite3, which some Python builds omit
+        except ImportError as e:
+            print(f"WARNING: Cycle not recorded in {db_path}: {e}", file=sys.stderr)
+        else:
+            try:
+                conn = prover_store.connect(str(db_path))
+                try:
+                    prover_store.record_results(conn, args.app, cycle_log)
+                finally:
+                    conn.close()
+            except (OSError, ValueError, prover_store.sqlite3.Error) as e:
+                print(f"WARNING: Cycle not recorded in {db_path}: {e}", file=sys.stderr)
+
+    rerun = None
+    if args.rerun_manifest:
+        rerun_path = (
+            Path(args.rerun_manifest)
+            if os.path.isabs(args.rerun_manifest)
+            else project_dir / args.rerun_manifest
+        )
+        rerun = build_rerun_manifest(meta, args.cycle, max(args.rerun_sample, 0))
+        save_json(str(rerun_path), rerun)
 
     # Print summary
     summary = meta["summary"]
     print(f"\n{'='*50}")
     print(f"  Prover Cycle {args.cycle} — {args.app}")
     print(f"{'='*50}")
-    print(f"  Total:     {summary['total']}")
-    print(f"  Passed:    {summary['passed']}")
-    print(f"  Failed:    {summary['failed']}")
-    print(f"  Exhausted: {summary['exhausted']}")
-    print(f"  Not Run:   {summary['not_run']}")
-    print(f"  Status:    {meta['status']}")
+    print(f"  Total:       {summary['total']}")
+    print(f"  Passed:      {summary['passed']}")
+    print(f"  Failed:      {summary['failed']}")
+    print(f"  Exhausted:   {summary['exhausted']}")
+    print(f"  Quarantined: {summary['quarantined']}")
+    print(f"  Not Run:     {summary['not_run']}")
+    print(f"  Status:      {meta['status']}")
+    if len(results_paths) > 1:
+        print(f"  Merged:      {len(results_paths)} results files")
+    if traces[0]:
+        print(f"  Traces:      {traces[0]} digested ({traces[1] / 1024:.0f} KB read of {traces[2] / 1048576:.1f} MB)")
     print(f"{'='*50}\n")
 
-    # Print failures for quick reference
+    # Print failures grouped by root cause, largest cluster first
     if summary["failed"] > 0:
-        print("FAILURES:")
-        for feat_name, feat in meta["features"].items():
-            for sc_name, sc in feat.get("scenarios", {}).items():
-                if sc["status"] in ("FAILED", "ERROR"):
-                    latest = sc["history"][-1] if sc["history"] else {}
-                    error = latest.get("error", "Unknown error")
-                    # Truncate for display
-                    if len(error) > 120:
-                        error = error[:120] + "..."
-                    print(f"  [{sc['status']}] {feat_name} > {sc_name}")
-                    print(f"         {error}")
+        clusters = cluster_failures(meta)
+        print(f"FAILURES ({summary['failed']} in {len(clusters)} clusters by error signature):")
+        for cluster in clusters:
+            headline = cluster["headline"]
+            # Truncate for display
+            if len(headline) > 120:
+                headline = headline[:120] + "..."
+            print(f"  [{len(cluster['scenarios'])}x] {cluster['signature']}  {headline}")
+            if cluster["frame"]:
+                print(f"         at {cluster['frame']}")
+            for sc in cluster["scenarios"][:CLUSTER_SHOWN]:
+                print(f"         [{sc['status']}] {sc['feature']} > {sc['scenario']}")
+            if len(cluster["scenarios"]) > CLUSTER_SHOWN:
+                print(f"         ... and {len(cluster['scenarios']) - CLUSTER_SHOWN} more with this signature")
         print()
 
     # Print exhausted scenarios
@@ -457,6 +1454,39 @@ def main() -> int:
                     print(f"  {feat_name} > {sc_name}")
         print()
 
+    # Print quarantined scenarios: flaky, so not for the fix loop
+    if summary["quarantined"] > 0:
+        print(f"QUARANTINED (flaky — score ≥ {args.flaky_threshold}, excluded from fixes):")
+        for feat_name, feat in meta["features"].items():
+            for sc_name, sc in feat.get("scenarios", {}).items():
+                if sc["status"] == "QUARANTINED":
+                    latest = sc["history"][-1]["status"] if sc["history"] else "NOT_RUN"
+                    print(f"  {sc.get('flaky_score', 0):.2f}  {feat_name} > {sc_name}  (latest: {latest})")
+        print()
+
+    # Print slowdowns, separate from pass/fail
+    slowdowns = meta["slowdowns"]
+    if slowdowns["features"] or slowdowns["scenarios"]:
+        print(f"SLOWDOWNS (≥ {slowdowns['threshold']:.0%} over median and above p95 of earlier passing runs):")
+        for item in slowdowns["features"]:
+            print(f"  x{item['ratio']:.2f}  {item['feature']}  {item['duration'] / 1000:.1f}s "
+                  f"(median {item['median'] / 1000:.1f}s, p95 {item['p95'] / 1000:.1f}s, {item['scenarios']} scenarios)")
+        for item in slowdowns["scenarios"]:
+            print(f"  x{item['ratio']:.2f}  {item['feature']} > {item['scenario']}  {item['duration'] / 1000:.1f}s "
+                  f"(median {item['median'] / 1000:.1f}s, p95 {item['p95'] / 1000:.1f}s)")
+        print()
+
+    if rerun is not None:
+        if rerun["scenarios"]:
+            print(f"RERUN: {rerun['failing']} failing + {rerun['quarantined']} quarantined + "
+                  f"{rerun['sampled']} sampled scenarios → {rerun_path}")
+            shown = " ".join(shlex.quote(arg) for arg in rerun["args"][:10])
+            more = f" ... (+{len(rerun['args']) - 10} more in the manifest)" if len(rerun["args"]) > 10 else ""
+            print(f"  npx playwright test {shown}{more}")
+        else:
+            print(f"RERUN: nothing to rerun → {rerun_path}")
+        print()
+
     # Exit code
     if summary["passed"] == summary["total"] and summary["total"] > 0:
         return 0
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Split the Playwright suite into shards of equal predicted duration.
+
+Playwright's --shard i/N splits the suite by test count, so one shard can
+end up with every slow scenario. This planner takes each scenario's
+duration from .prover-meta.json (the median duration of the passing
+runs in its history window) and assigns scenarios to N shards longest first, each to
+the currently lightest shard (LPT scheduling). The predicted makespan —
+the slowest shard — is printed next to the lower bound and the makespan
+of a count-based split in file order.
+
+The scenarios to plan are those in the meta file, or, with --list-file,
+those in `npx playwright test --list --reporter=json` output, so newly
+generated scenarios are included. A scenario without timing history is
+given the median duration of the timed ones (or --default-duration when
+nothing is timed yet). Scenario outline rows stay on one shard. With
+fewer scenarios than --shards, only one shard per scenario is planned,
+and the remaining shards up to --shards get an empty shard-N.txt so every
+worker finds its file. A worker must skip an empty or missing list:
+`npx playwright test` with no locations runs the whole suite.
+
+Each shard runs its scenarios by file:line:
+
+    if [ -s shard-1.txt ]; then npx playwright test $(cat shard-1.txt); fi
+
+Usage:
+    python3 scripts/plan-shards.py --meta-file .prover-meta.json --shards 4 \\
+        [--list-file test-results/list.json] [--out-dir test-results/shards] [--json]
+
+Exit codes:
+    0 — Plan written
+    2 — Meta or list file missing or unreadable, or nothing to plan
+"""
+
+import argparse
+import gc
+import heapq
+import importlib.util
+import json
+import os
+import statistics
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+DEFAULT_DURATION = 30_000  # ms, for scenarios when nothing has been timed yet
+
+
+def load_parser():
+    """Import parse-playwright-results.py (hyphenated, so not importable by name)."""
+    sys.path.insert(0, str(SCRIPT_DIR))
+    spec = importlib.util.spec_from_file_location("parse_playwright_results", SCRIPT_DIR / "parse-playwright-results.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def historical_duration(scenario: dict) -> float | None:
+    """
+    Median duration (ms) of the passing runs in the scenario's history
+    window, or None if it has none. Failed and timed-out runs stop early or
+    run to the timeout, so they would skew the estimate.
+    """
+    durations = [
+        entry["duration"] for entry in scenario.get("history", [])
+        if entry.get("status") == "PASSED" and entry.get("duration") is not None
+    ]
+    return statistics.median(durations) if durations else None
+
+
+def collect_jobs(meta: dict, listed: dict | None) -> tuple[list[dict], list[str]]:
+    """
+    Scenarios to schedule, with their locations and historical durations.
+
+    `listed` is the grouping of a --list-file; without it the meta file's
+    scenarios are planned. Returns (jobs, names of scenarios without a
+    file:line location, which cannot be assigned to a shard).
+    """
+    known = meta.get("features", {})
+    source = listed if listed is not None else {
+        feature: feat.get("scenarios", {}) for feature, feat in known.items()
+    }
+    jobs, unplaced = [], []
+    for feature, scenarios in source.items():
+        for name, scenario in scenarios.items():
+            locations = scenario.get("locations") or []
+            if not locations:
+                unplaced.append(f"{feature} > {name}")
+                continue
+            history = known.get(feature, {}).get("scenarios", {}).get(name, {})
+            jobs.append({
+                "feature": feature,
+                "scenario": name,
+                "locations": locations,
+                "duration": historical_duration(history),
+            })
+    return jobs, unplaced
+
+
+def fill_estimates(jobs: list[dict], default_duration: float) -> float:
+    """Give untimed jobs the median timed duration (or the default); returns the estimate used."""
+    timed = [job["duration"] for job in jobs if job["duration"] is not None]
+    estimate = statistics.median(timed) if timed else default_duration
+    for job in jobs:
+        job["estimated"] = job["duration"] is None
+        if job["estimated"]:
+            job["duration"] = estimate
+    return estimate
+
+
+def location_key(location: str) -> tuple[str, int]:
+    file, _, line = location.rpartition(":")
+    return (file, int(line)) if line.isdigit() else (location, 0)
+
+
+def lpt_shards(jobs: list[dict], shards: int) -> list[dict]:
+    """Longest-processing-time assignment: longest job first, onto the lightest shard."""
+    plan = [{"shard": i + 1, "duration": 0.0, "jobs": []} for i in range(shards)]
+    heap = [(0.0, i) for i in range(shards)]
+    order = sorted(jobs, key=lambda job: (-job["duration"], location_key(job["locations"][0])))
+    for job in order:
+        load, i = heapq.heappop(heap)
+        plan[i]["jobs"].append(job)
+        plan[i]["duration"] = load + job["duration"]
+        heapq.heappush(heap, (plan[i]["duration"], i))
+    for shard in plan:
+        shard["jobs"].sort(key=lambda job: location_key(job["locations"][0]))
+    return plan
+
+
+def count_split_makespan(jobs: list[dict], shards: int) -> float:
+    """Makespan of splitting the jobs, in file order, into runs of equal count (Playwright's --shard)."""
+    order = sorted(jobs, key=lambda job: location_key(job["locations"][0]))
+    size, extra = divmod(len(order), shards)
+    makespan, start = 0.0, 0
+    for i in range(shards):
+        end = start + size + (1 if i < extra else 0)
+        makespan = max(makespan, sum(job["duration"] for job in order[start:end]))
+        start = end
+    return makespan
+
+
+def plan(jobs: list[dict], shards: int) -> dict:
+    shard_plan = lpt_shards(jobs, shards)
+    total = sum(job["duration"] for job in jobs)
+    return {
+        "shards": [
+            {
+                "shard": shard["shard"],
+                "predicted_ms": round(shard["duration"]),
+                "scenarios": len(shard["jobs"]),
+                "locations": [loc for job in shard["jobs"] for loc in job["locations"]],
+                "estimated": sum(job["estimated"] for job in shard["jobs"]),
+            }
+            for shard in shard_plan
+        ],
+        "makespan_ms": round(max(shard["duration"] for shard in shard_plan)),
+        "lower_bound_ms": round(max(total / shards, max(job["duration"] for job in jobs))),
+        "count_split_makespan_ms": round(count_split_makespan(jobs, shards)),
+        "total_ms": round(total),
+    }
+
+
+def seconds(ms: float) -> str:
+    return f"{ms / 1000:.1f}s"
+
+
+def print_plan(result: dict):
+    print(f"=== Shard Plan ({len(result['shards'])} shards, {result['scenarios']} scenarios) ===\n")
+    for shard in result["shards"]:
+        estimated = f", {shard['estimated']} estimated" if shard["estimated"] else ""
+        print(f"  Shard {shard['shard']}: {seconds(shard['predicted_ms']):>9}  "
+              f"{shard['scenarios']} scenarios{estimated}")
+    print()
+    print(f"  Predicted makespan: {seconds(result['makespan_ms'])} "
+          f"(lower bound {seconds(result['lower_bound_ms'])}, "
+          f"count-based split {seconds(result['count_split_makespan_ms'])})")
+    untimed = result["scenarios"] - result["timed"]
+    if untimed:
+        print(f"  No history for {untimed} of {result['scenarios']} scenarios; "
+              f"each estimated at {seconds(result['estimate_ms'])}")
+    if result["unplaced"]:
+        print(f"\n  No file:line location, not assigned ({len(result['unplaced'])}):")
+        for name in result["unplaced"]:
+            print(f"    - {name}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Plan duration-balanced Playwright shards from prover history")
+    parser.add_argument("--meta-file", required=True, help="Path to .prover-meta.json")
+    parser.add_argument("--shards", type=int, required=True, help="Number of shards")
+    parser.add_argument("--list-file", default=None,
+                        help="Output of `npx playwright test --list --reporter=json`; plans every listed scenario")
+    parser.add_argument("--default-duration", type=float, default=DEFAULT_DURATION,
+                        help=f"Estimate in ms when no scenario has been timed (default: {DEFAULT_DURATION})")
+    parser.add_argument("--out-dir", default=None, help="Write shard-N.txt files (one file:line per line) here")
+    parser.add_argument("--project-dir", default=".", help="Project root directory (default: current directory)")
+    parser.add_argument("--json", action="store_true", help="Print the plan as JSON")
+    args = parser.parse_args()
+
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    project_dir = Path(args.project_dir).resolve()
+
+    def resolve(path: str) -> Path:
+        return Path(path) if os.path.isabs(path) else project_dir / path
+
+    results_parser = load_parser()
+    meta_path = resolve(args.meta_file)
+    meta = results_parser.load_json(str(meta_path))
+    if meta is None:
+        print(f"ERROR: Cannot read meta file: {meta_path}", file=sys.stderr)
+        return 2
+
+    listed = None
+    if args.list_file:
+        list_path = resolve(args.list_file)
+        gc.disable()
+        try:
+            listed = results_parser.group_scenario_outlines(results_parser.stream_scenarios(str(list_path)))
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Cannot read list file {list_path}: {e}", file=sys.stderr)
+            return 2
+        finally:
+            gc.enable()
+
+    jobs, unplaced = collect_jobs(meta, listed)
+    if not jobs:
+        print("ERROR: No scenarios with file:line locations to plan", file=sys.stderr)
+        return 2
+    timed = sum(job["duration"] is not None for job in jobs)
+    estimate = fill_estimates(jobs, args.default_duration)
+
+    shards = min(args.shards, len(jobs))
+    if shards < args.shards:
+        print(f"WARNING: Only {len(jobs)} scenarios to plan; planning {shards} shards instead of {args.shards}",
+              file=sys.stderr)
+    result = plan(jobs, shards)
+    result.update(scenarios=len(jobs), timed=timed, estimate_ms=round(estimate), unplaced=unplaced)
+
+    if args.out_dir:
+        out_dir = resolve(args.out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written = set()
+        for shard in result["shards"]:
+            path = out_dir / f"shard-{shard['shard']}.txt"
+            path.write_text("".join(f"{loc}\n" for loc in shard["locations"]))
+            written.add(path.name)
+        # Workers beyond the planned shards get an empty list to skip, rather
+        # than none (or a stale one from an earlier plan)
+        for index in range(shards + 1, args.shards + 1):
+            path = out_dir / f"shard-{index}.txt"
+            path.write_text("")
+            written.add(path.name)
+        # Shard lists left from an earlier plan with more shards
+        for stale in out_dir.glob("shard-*.txt"):
+            if stale.name not in written:
+                stale.unlink()
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print_plan(result)
+        if args.out_dir:
+            print(f"\n  Shard lists written to {out_dir}/shard-N.txt")
+            if shards < args.shards:
+                empty = f"{shards + 1}" if shards + 1 == args.shards else f"{shards + 1}-{args.shards}"
+                print(f"  Shard lists {empty} are empty: skip them (an empty list runs the whole suite)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Report on prover cycles recorded in a SQLite database.
+
+parse-playwright-results.py records each cycle with --db; --import-log
+back-fills a database from an existing .prover-history.jsonl.
+
+Usage:
+    python3 prover-report.py failures    --db .prover-history.db [--app admin-portal] [--since 3] [--limit 20]
+    python3 prover-report.py durations   --db .prover-history.db
+    python3 prover-report.py transitions --db .prover-history.db
+    python3 prover-report.py history     --db .prover-history.db --feature "User Login" --scenario "Valid credentials"
+    python3 prover-report.py summary     --db .prover-history.db --import-log .prover-history.jsonl
+
+Reports:
+    failures    — scenarios ranked by failing cycles, with the latest error
+    durations   — scenarios ranked by average duration
+    transitions — status changes between consecutive cycles, newest first
+    history     — every recorded cycle of one scenario
+    summary     — cycles and pass/fail counts per cycle
+
+Exit codes:
+    0 — Report printed
+    2 — Database error, or no results for the app
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+import prover_store
+
+REPORTS = ("failures", "durations", "transitions", "history", "summary")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report on prover cycles recorded in SQLite")
+    parser.add_argument("report", choices=REPORTS, help="Report to print")
+    parser.add_argument("--db", required=True, help="SQLite database written by parse-playwright-results.py --db")
+    parser.add_argument("--app", default=None, help="Application name (default: the only app in the database)")
+    parser.add_argument("--since", type=int, default=0, help="Only consider cycles from this one on (default: all)")
+    parser.add_argument("--limit", type=int, default=20, help="Rows to print (default: 20)")
+    parser.add_argument("--feature", default=None, help="Feature name (history report)")
+    parser.add_argument("--scenario", default=None, help="Scenario name (history report)")
+    parser.add_argument(
+        "--import-log",
+        default=None,
+        help="First load this JSONL cycle log (.gz allowed) into the database, as --app",
+    )
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON")
+    return parser.parse_args()
+
+
+def truncate(text: str | None, width: int = 100) -> str:
+    text = (text or "").replace("\n", " ")
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def print_rows(report: str, rows: list[dict]) -> None:
+    if not rows:
+        print("  (none)")
+        return
+    for r in rows:
+        if report == "failures":
+            print(f"  {r['failures']:>3}x  {r['feature']} > {r['scenario']}  (cycles {r['first_cycle']}-{r['last_cycle']})")
+            if r["last_error"]:
+                print(f"         {truncate(r['last_error'])}")
+        elif report == "durations":
+            print(f"  {r['avg_ms'] / 1000:7.1f}s avg  {r['max_ms'] / 1000:7.1f}s max  "
+                  f"{(r['last_ms'] or 0) / 1000:7.1f}s last  {r['feature']} > {r['scenario']} ({r['runs']} runs)")
+        elif report == "transitions":
+            print(f"  cycle {r['previous_cycle']:>3} -> {r['cycle']:<3} {r['previous_status']:>9} -> {r['status']:<9}"
+                  f"  {r['feature']} > {r['scenario']}")
+        elif report == "history":
+            duration = f"{r['duration'] / 1000:.1f}s" if r["duration"] is not None else "-"
+            print(f"  cycle {r['cycle']:>3}  {r['status']:<9} {duration:>8}  {truncate(r['error'], 80)}")
+        else:
+            print(f"  cycle {r['cycle']:>3}  {r['total']:>5} scenarios  {r['passed']:>5} passed  {r['failing']:>5} failing")
+
+
+def main() -> int:
+    args = parse_args()
+    if args.report == "history" and not (args.feature and args.scenario):
+        print("ERROR: the history report needs --feature and --scenario", file=sys.stderr)
+        return 2
+    if args.import_log and not args.app:
+        print("ERROR: --import-log needs --app", file=sys.stderr)
+        return 2
+    if not args.import_log and not os.path.exists(args.db):
+        print(f"ERROR: Cannot read database: {args.db}", file=sys.stderr)
+        return 2
+
+    try:
+        conn = prover_store.connect(args.db)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"ERROR: Cannot open {args.db}: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        if args.import_log:
+            if not os.path.exists(args.import_log):
+                print(f"ERROR: Cannot read cycle log: {args.import_log}", file=sys.stderr)
+                return 2
+            count = prover_store.record_results(conn, args.app, prover_store.read_log(args.import_log))
+            print(f"Imported {count} results from {args.import_log}", file=sys.stderr)
+
+        app = args.app
+        if app is None:
+            known = prover_store.apps(conn)
+            if len(known) != 1:
+                print(f"ERROR: --app is required; the database has {', '.join(known) or 'no apps'}", file=sys.stderr)
+                return 2
+            app = known[0]
+        first, last, count = prover_store.cycles(conn, app)
+        if not count:
+            print(f"ERROR: No results recorded for {app}", file=sys.stderr)
+            return 2
+
+        if args.report == "failures":
+            rows = prover_store.failure_report(conn, app, args.limit, args.since)
+        elif args.report == "durations":
+            rows = prover_store.duration_report(conn, app, args.limit, args.since)
+        elif args.report == "transitions":
+            rows = prover_store.transition_report(conn, app, args.limit, args.since)
+        elif args.report == "history":
+            rows = prover_store.scenario_history(conn, app, args.feature, args.scenario)
+        else:
+            rows = prover_store.cycle_summary(conn, app, args.since)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"ERROR: {args.db}: {e}", file=sys.stderr)
+        return 2
+    finally:
+        conn.close()
+
+    rows = [dict(row) for row in rows]
+    if args.json:
+        print(json.dumps(rows, indent=2, ensure_ascii=False))
+        return 0
+
+    title = f"{args.feature} > {args.scenario}" if args.report == "history" else args.report
+    print(f"\n=== {app}: {title} (cycles {max(first, args.since)}-{last}, {count} recorded) ===\n")
+    print_rows(args.report, rows)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""SQLite store for prover cycle results (stdlib sqlite3).
+
+An optional, queryable companion to .prover-history.jsonl: one row per
+scenario per cycle, written in a single transaction per cycle, with
+indexes for the questions the build/test/fix loop asks — which scenarios
+keep failing, which are slow, and which changed status when.
+
+parse-playwright-results.py records each cycle with --db; prover-report.py
+prints the reports and can back-fill a database from an existing JSONL
+log.
+"""
+
+import json
+import sqlite3
+from typing import Any, Iterable
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    app      TEXT    NOT NULL,
+    cycle    INTEGER NOT NULL,
+    feature  TEXT    NOT NULL,
+    scenario TEXT    NOT NULL,
+    status   TEXT    NOT NULL,
+    duration INTEGER,
+    error    TEXT,
+    trace    TEXT,
+    PRIMARY KEY (app, feature, scenario, cycle)
+);
+CREATE INDEX IF NOT EXISTS results_by_status ON results (app, status, cycle);
+CREATE INDEX IF NOT EXISTS results_by_cycle ON results (app, cycle);
+"""
+
+# Cycle logs record run outcomes, but logs and databases from earlier
+# versions also hold QUARANTINED and EXHAUSTED verdicts for failing runs
+FAILING_STATUSES = ("FAILED", "ERROR", "EXHAUSTED", "QUARANTINED")
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open (creating if needed) a results database."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version > SCHEMA_VERSION:
+        conn.close()
+        raise ValueError(f"{path} has schema version {version}; this script supports up to {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def record_results(conn: sqlite3.Connection, app: str, records: Iterable[dict[str, Any]]) -> int:
+    """
+    Insert cycle log records (see update_meta) in one transaction.
+
+    Re-recording a scenario for the same cycle replaces the earlier row,
+    so re-running a cycle's parse is harmless. Returns the rows written.
+    """
+    rows = [
+        (app, r["cycle"], r["feature"], r["scenario"], r["status"], r.get("duration"), r.get("error"), r.get("trace"))
+        for r in records
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO results (app, cycle, feature, scenario, status, duration, error, trace) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    return len(rows)
+
+
+def read_log(path: str) -> Iterable[dict[str, Any]]:
+    """Yield the records of a JSONL cycle log (gzip-compressed if the path ends in .gz)."""
+    if path.endswith(".gz"):
+        import gzip
+
+        f = gzip.open(path, "rt", encoding="utf-8")
+    else:
+        f = open(path, "r", encoding="utf-8")
+    with f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def apps(conn: sqlite3.Connection) -> list[str]:
+    """Apps with recorded results."""
+    return [row[0] for row in conn.execute("SELECT DISTINCT app FROM results ORDER BY app")]
+
+
+def cycles(conn: sqlite3.Connection, app: str) -> tuple[int, int, int]:
+    """(first cycle, last cycle, number of cycles) recorded for an app."""
+    row = conn.execute("SELECT MIN(cycle), MAX(cycle), COUNT(DISTINCT cycle) FROM results WHERE app = ?",
+                       (app,)).fetchone()
+    return row[0], row[1], row[2]
+
+
+def failure_report(conn: sqlite3.Connection, app: str, limit: int = 20, since: int = 0) -> list[sqlite3.Row]:
+    """Scenarios with the most failing cycles since `since`, with their latest error."""
+    return conn.execute(
+        f"""
+        SELECT feature, scenario, COUNT(*) AS failures, MIN(cycle) AS first_cycle, MAX(cycle) AS last_cycle,
+               (SELECT error FROM results AS latest
+                 WHERE latest.app = failed.app AND latest.feature = failed.feature
+                   AND latest.scenario = failed.scenario AND latest.error IS NOT NULL
+                 ORDER BY latest.cycle DESC LIMIT 1) AS last_error
+          FROM results AS failed
+         WHERE app = ? AND cycle >= ? AND status IN ({", ".join("?" * len(FAILING_STATUSES))})
+         GROUP BY feature, scenario
+         ORDER BY failures DESC, last_cycle DESC, feature, scenario
+         LIMIT ?
+        """,
+        (app, since, *FAILING_STATUSES, limit),
+    ).fetchall()
+
+
+def scenario_history(conn: sqlite3.Connection, app: str, feature: str, scenario: str) -> list[sqlite3.Row]:
+    """Every recorded cycle of one scenario, oldest first."""
+    return conn.execute(
+        "SELECT cycle, status, duration, error, trace FROM results "
+        "WHERE app = ? AND feature = ? AND scenario = ? ORDER BY cycle",
+        (app, feature, scenario),
+    ).fetchall()
+
+
+def duration_report(conn: sqlite3.Connection, app: str, limit: int = 20, since: int = 0) -> list[sqlite3.Row]:
+    """Slowest scenarios by average duration since `since`."""
+    return conn.execute(
+        """
+        SELECT feature, scenario, COUNT(*) AS runs, AVG(duration) AS avg_ms, MAX(duration) AS max_ms,
+               (SELECT duration FROM results AS latest
+                 WHERE latest.app = timed.app AND latest.feature = timed.feature
+                   AND latest.scenario = timed.scenario
+                 ORDER BY latest.cycle DESC LIMIT 1) AS last_ms
+          FROM results AS timed
+         WHERE app = ? AND cycle >= ? AND duration IS NOT NULL
+         GROUP BY feature, scenario
+         ORDER BY avg_ms DESC, feature, scenario
+         LIMIT ?
+        """,
+        (app, since, limit),
+    ).fetchall()
+
+
+def transition_report(conn: sqlite3.Connection, app: str, limit: int = 50, since: int = 0) -> list[sqlite3.Row]:
+    """Status changes between a scenario's consecutive recorded cycles, newest first."""
+    return conn.execute(
+        """
+        SELECT feature, scenario, previous_cycle, previous_status, cycle, status
+          FROM (SELECT feature, scenario, cycle, status,
+                       LAG(cycle) OVER scenario_cycles AS previous_cycle,
+                       LAG(status) OVER scenario_cycles AS previous_status
+                  FROM results
+                 WHERE app = ?
+                WINDOW scenario_cycles AS (PARTITION BY feature, scenario ORDER BY cycle))
+         WHERE previous_status IS NOT NULL AND previous_status != status AND cycle >= ?
+         ORDER BY cycle DESC, feature, scenario
+         LIMIT ?
+        """,
+        (app, since, limit),
+    ).fetchall()
+
+
+def cycle_summary(conn: sqlite3.Connection, app: str, since: int = 0) -> list[sqlite3.Row]:
+    """Scenario, pass and failure counts per recorded cycle, oldest first."""
+    return conn.execute(
+        f"""
+        SELECT cycle, COUNT(*) AS total,
+               SUM(status = 'PASSED') AS passed,
+               SUM(status IN ({", ".join("?" * len(FAILING_STATUSES))})) AS failing
+          FROM results
+         WHERE app = ? AND cycle >= ?
+         GROUP BY cycle
+         ORDER BY cycle
+        """,
+        (*FAILING_STATUSES, app, since),
+    ).fetchall()
@@ -0,0 +1,180 @@
+"""Digest of a Playwright trace.zip for failure triage (stdlib only).
+
+A trace archive is mostly resources — screenshots, DOM snapshots,
+response bodies — that triage does not need. zipfile reads only the
+archive's central directory on open; from it, only the event entries
+(`*.trace`, one JSON event per line, and `*.network`) are opened and
+streamed line by line, so the bytes read are the compressed size of
+those entries rather than of the whole archive.
+
+The digest holds:
+    last_action       the last action or step that finished
+    failing_action    the last action that failed, with its error
+    failing_locator   the selector of the failing action (or the locator
+                      named in its error message)
+    console_errors    console errors and uncaught page errors
+    network_failures  requests that failed or answered 4xx/5xx
+    bytes_read        compressed bytes of the entries streamed
+    trace_bytes       size of the archive
+
+Usage:
+    python3 trace_digest.py test-results/.../trace.zip [...]
+"""
+
+import io
+import json
+import os
+import re
+import sys
+import zipfile
+from typing import Any
+
+DIGEST_ITEMS = 5  # console errors and network failures kept
+TEXT_LIMIT = 300  # characters kept of each message
+
+EVENT_SUFFIXES = (".trace", ".network")
+_LOCATOR_RE = re.compile(r"(?:Locator:\s*|waiting for\s+)((?:locator|getBy\w+|page\.\w+)\(.*?\)(?:\.\w+\(.*?\))*)")
+
+
+def _text(value: Any) -> str:
+    text = str(value or "").strip()
+    return text if len(text) <= TEXT_LIMIT else text[:TEXT_LIMIT] + "..."
+
+
+def _error_message(error: Any) -> str | None:
+    """Message of a serialized error, in either of the shapes traces use."""
+    if isinstance(error, dict):
+        inner = error.get("error")
+        if isinstance(inner, dict):
+            return inner.get("message") or inner.get("value")
+        return error.get("message") or error.get("value")
+    return error if isinstance(error, str) else None
+
+
+def _action_name(event: dict[str, Any]) -> str:
+    if event.get("apiName") or event.get("title"):
+        return event.get("apiName") or event.get("title")
+    return ".".join(part for part in (event.get("class"), event.get("method")) if part) or "action"
+
+
+class _Digest:
+    """Accumulates the digest from trace events, one at a time."""
+
+    def __init__(self):
+        self.open_calls: dict[str, dict[str, Any]] = {}
+        self.last_action: dict[str, Any] | None = None
+        self.failing: dict[str, Any] | None = None
+        self.console_errors: list[str] = []
+        self.network_failures: list[dict[str, Any]] = []
+
+    def finish(self, start: dict[str, Any], error: str | None):
+        params = start.get("params") or {}
+        action = {"action": _action_name(start)}
+        if isinstance(params, dict) and params.get("selector"):
+            action["selector"] = params["selector"]
+        if error:
+            action["error"] = _text(error)
+            self.failing = action
+        self.last_action = action
+
+    def event(self, event: dict[str, Any]):
+        kind = event.get("type")
+        if kind == "before":
+            self.open_calls[event.get("callId")] = event
+        elif kind == "after":
+            start = self.open_calls.pop(event.get("callId"), None)
+            if start is not None:
+                self.finish(start, _error_message(event.get("error")))
+        elif kind == "action":
+            # Traces before v1.31: one event per finished action
+            metadata = event.get("metadata") or {}
+            self.finish(metadata, _error_message(metadata.get("error")))
+        elif kind == "console":
+            if event.get("messageType") == "error":
+                self.add_console(event.get("text"))
+        elif kind == "event" and event.get("method") == "pageError":
+            self.add_console(_error_message((event.get("params") or {}).get("error")))
+        elif kind == "resource-snapshot":
+            self.add_network(event.get("snapshot") or {})
+
+    def add_console(self, text: Any):
+        if text and len(self.console_errors) < DIGEST_ITEMS:
+            self.console_errors.append(_text(text))
+
+    def add_network(self, snapshot: dict[str, Any]):
+        request = snapshot.get("request") or {}
+        response = snapshot.get("response") or {}
+        status = response.get("status", 0)
+        failure = response.get("_failureText")
+        if (failure or (isinstance(status, int) and (status >= 400 or status < 0))) \
+                and len(self.network_failures) < DIGEST_ITEMS:
+            entry = {"method": request.get("method", "GET"), "url": _text(request.get("url")), "status": status}
+            if failure:
+                entry["failure"] = _text(failure)
+            self.network_failures.append(entry)
+
+    def result(self) -> dict[str, Any]:
+        # An action still open when the trace ended is where the test stopped
+        if self.open_calls and self.failing is None:
+            start = list(self.open_calls.values())[-1]
+            self.finish(start, "did not finish")
+        failing_locator = None
+        if self.failing is not None:
+            failing_locator = self.failing.get("selector")
+            if not failing_locator:
+                match = _LOCATOR_RE.search(self.failing.get("error", ""))
+                failing_locator = match.group(1) if match else None
+        return {
+            "last_action": self.last_action,
+            "failing_action": self.failing,
+            "failing_locator": failing_locator,
+            "console_errors": self.console_errors,
+            "network_failures": self.network_failures,
+        }
+
+
+def digest_trace(path: str) -> dict[str, Any]:
+    """
+    Digest one trace archive, streaming only its event entries.
+
+    Raises OSError if the file cannot be read and ValueError if it is not
+    a zip archive. Lines that are not valid JSON are skipped.
+    """
+    digest = _Digest()
+    bytes_read = 0
+    try:
+        with zipfile.ZipFile(path) as archive:
+            entries = sorted(
+                (info for info in archive.infolist() if info.filename.endswith(EVENT_SUFFIXES)),
+                key=lambda info: info.filename,
+            )
+            for info in entries:
+                bytes_read += info.compress_size
+                with archive.open(info) as raw:
+                    for line in io.TextIOWrapper(raw, encoding="utf-8", errors="replace"):
+                        if not line.strip():
+                            continue
+                        try:
+                            event = json.loads(line)
+                        except ValueError:
+                            continue
+                        if isinstance(event, dict):
+                            digest.event(event)
+    except zipfile.BadZipFile as e:
+        raise ValueError(str(e)) from None
+
+    result = digest.result()
+    result["bytes_read"] = bytes_read
+    result["trace_bytes"] = os.path.getsize(path)
+    return result
+
+
+if __name__ == "__main__":
+    status = 0
+    for trace_path in sys.argv[1:]:
+        try:
+            print(json.dumps({"trace": trace_path, **digest_trace(trace_path)}, indent=2, ensure_ascii=False))
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Cannot read trace {trace_path}: {e}", file=sys.stderr)
+            status = 2
+    sys.exit(status)